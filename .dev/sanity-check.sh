@@ -913,53 +913,42 @@ if [ $doc_missing -eq 0 ]; then
 fi
 echo ""
 
+# 15, 16 and 19 are file-level rules evaluated in one pass over the tree by
+# .dev/scripts/sanity-files.py; its "<section>|<status>|<message>" lines are
+# replayed through check_* at each section's place in the report.
+file_check_args=()
+if [ $VERBOSE -eq 1 ]; then
+	file_check_args+=(--verbose)
+fi
+if ! FILE_CHECKS=$("$PYTHON_BIN" .dev/scripts/sanity-files.py "${file_check_args[@]}"); then
+	FILE_CHECKS=""
+	check_fail "File-level sanity checks (.dev/scripts/sanity-files.py) failed to run"
+fi
+
+report_file_checks() {
+	local line_section status message
+	while IFS='|' read -r line_section status message; do
+		if [ "$line_section" != "$1" ]; then
+			continue
+		fi
+		case "$status" in
+		PASS) check_pass "$message" ;;
+		WARN) check_warn "$message" ;;
+		FAIL) check_fail "$message" ;;
+		esac
+	done <<<"$FILE_CHECKS"
+}
+
 # 15. File Size Sanity Checks
 echo "📏 Checking File Sizes..."
-oversized_files=0
-# Check for unreasonably large text files (>10MB) that might be accidentally committed
-while IFS= read -r -d '' large_file; do
-	file_size=$(stat -f%z "$large_file" 2>/dev/null || stat -c%s "$large_file" 2>/dev/null)
-	if [ "$file_size" -gt 10485760 ]; then # 10MB
-		check_warn "Large file detected: $(basename $large_file) ($((file_size / 1048576))MB)"
-		oversized_files=$((oversized_files + 1))
-	fi
-done < <(find . -type f \( -name "*.md" -o -name "*.txt" -o -name "*.json" -o -name "*.yaml" -o -name "*.yml" \) -not -path "./.git/*" -print0 2>/dev/null)
-
-if [ $oversized_files -eq 0 ]; then
-	check_pass "No unusually large text files detected"
-fi
+# Unreasonably large text files (>10MB) that might be accidentally committed
+report_file_checks 15
 echo ""
 
 # 16. Markdown Linting
 log_info "📝 Checking Markdown Formatting and Link Integrity..."
-markdown_issues=0
-
-# Check for broken links in markdown files
-while IFS= read -r -d '' md_file; do
-	# Check for basic markdown issues
-	if grep -q '^\[.*\]: $' "$md_file" 2>/dev/null; then
-		check_warn "$(basename "$md_file"): Empty reference-style link found"
-		markdown_issues=$((markdown_issues + 1))
-	fi
-
-	# Skip template directories when looking for long lines
-	if echo "$md_file" | grep -q "templates/"; then
-		continue
-	fi
-
-	if grep -E '^.{500,}$' "$md_file" >/dev/null 2>&1; then
-		if [ $VERBOSE -eq 1 ]; then
-			check_warn "$(basename "$md_file"): Contains very long lines (>500 chars)"
-		fi
-		markdown_issues=$((markdown_issues + 1))
-	fi
-done < <(find . -type f -name "*.md" -not -path "./.git/*" -print0)
-
-if [ $markdown_issues -eq 0 ]; then
-	check_pass "Markdown files have no obvious formatting issues"
-else
-	check_warn "Found $markdown_issues markdown formatting warnings"
-fi
+# Empty reference-style links, and lines over 500 chars outside templates/
+report_file_checks 16
 log_info ""
 
 # 17. Dependency Security Scanning
@@ -1051,27 +1040,7 @@ log_info ""
 
 # 19. Code Duplication Detection
 log_info "🔍 Checking for Code Duplication in Examples..."
-duplication_found=0
-checksum_tmp=$(mktemp)
-while IFS= read -r -d '' example_file; do
-	checksum=$(md5sum "$example_file" 2>/dev/null | cut -d' ' -f1)
-	existing=$(grep "^$checksum " "$checksum_tmp" 2>/dev/null | head -n 1 | cut -d' ' -f2-)
-	if [ -n "$existing" ]; then
-		if [ $VERBOSE -eq 1 ]; then
-			check_warn "Duplicate file detected: $example_file == $existing"
-		fi
-		duplication_found=$((duplication_found + 1))
-	else
-		echo "$checksum $example_file" >>"$checksum_tmp"
-	fi
-done < <(find examples -type f \( -name "*.py" -o -name "*.js" -o -name "*.go" \) -print0)
-rm -f "$checksum_tmp"
-
-if [ $duplication_found -eq 0 ]; then
-	check_pass "No exact file duplicates found in examples"
-else
-	check_warn "Found $duplication_found duplicate files in examples"
-fi
+report_file_checks 19
 log_info ""
 
 # 20. JSON Schema Validation
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""File-level sanity checks for .dev/sanity-check.sh (sections 15, 16 and 19).
+
+The tree is walked once with ``os.scandir``. The resulting snapshot of
+regular files and their sizes feeds every rule:
+
+- 15: oversized text files
+- 16: markdown empty reference links and very long lines
+- 19: exact duplicates among example sources
+
+Duplicates are found with a dict keyed on MD5. Only files that share a size
+with another example are hashed.
+
+Each result is printed as ``<section>|<PASS|WARN|FAIL>|<message>``. The shell
+script replays these lines through its check_* helpers, so the counters and
+the HTML report are unchanged.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+LARGE_FILE_BYTES = 10 * 1024 * 1024
+LARGE_FILE_SUFFIXES = (".md", ".txt", ".json", ".yaml", ".yml")
+LONG_LINE_CHARS = 500
+EXAMPLE_SUFFIXES = (".py", ".js", ".go")
+
+_EMPTY_REFERENCE_RE = re.compile(r"^\[.*\]: $", re.MULTILINE)
+_CHUNK_SIZE = 1024 * 1024
+
+FileEntry = Tuple[str, int]
+"""``(path relative to the root, size in bytes)`` for one regular file."""
+
+Result = Tuple[str, str, str]
+"""``(section, status, message)`` line reported to sanity-check.sh."""
+
+
+def walk(root: Path) -> List[FileEntry]:
+    """List regular files under ``root`` (not following symlinks), skipping the top-level ``.git``."""
+    files: List[FileEntry] = []
+    pending = [""]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(root / directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in entries:
+            relative = f"{directory}/{entry.name}" if directory else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if relative != ".git":
+                        subdirectories.append(relative)
+                elif entry.is_file(follow_symlinks=False):
+                    files.append((relative, entry.stat(follow_symlinks=False).st_size))
+            except OSError:
+                continue
+        pending.extend(reversed(subdirectories))
+    return files
+
+
+def _md5(path: Path) -> str:
+    digest = hashlib.md5()  # noqa: S324 - content fingerprint, not security
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def check_file_sizes(files: List[FileEntry]) -> Iterator[Result]:
+    oversized = 0
+    for relative, size in files:
+        if relative.endswith(LARGE_FILE_SUFFIXES) and size > LARGE_FILE_BYTES:
+            oversized += 1
+            yield "15", "WARN", f"Large file detected: {os.path.basename(relative)} ({size // 1048576}MB)"
+    if oversized == 0:
+        yield "15", "PASS", "No unusually large text files detected"
+
+
+def check_markdown(root: Path, files: List[FileEntry], *, verbose: bool) -> Iterator[Result]:
+    issues = 0
+    for relative, _ in files:
+        if not relative.endswith(".md"):
+            continue
+        try:
+            text = (root / relative).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        name = os.path.basename(relative)
+        if _EMPTY_REFERENCE_RE.search(text):
+            issues += 1
+            yield "16", "WARN", f"{name}: Empty reference-style link found"
+        # Templates are exempt from the long-line rule.
+        if "templates/" in relative:
+            continue
+        if any(len(line) >= LONG_LINE_CHARS for line in text.split("\n")):
+            issues += 1
+            if verbose:
+                yield "16", "WARN", f"{name}: Contains very long lines (>{LONG_LINE_CHARS} chars)"
+    if issues == 0:
+        yield "16", "PASS", "Markdown files have no obvious formatting issues"
+    else:
+        yield "16", "WARN", f"Found {issues} markdown formatting warnings"
+
+
+def check_duplicates(root: Path, files: List[FileEntry], *, verbose: bool) -> Iterator[Result]:
+    examples = [(relative, size) for relative, size in files if relative.startswith("examples/")]
+    examples = [(relative, size) for relative, size in examples if relative.endswith(EXAMPLE_SUFFIXES)]
+    sizes: Dict[int, int] = {}
+    for _, size in examples:
+        sizes[size] = sizes.get(size, 0) + 1
+
+    seen: Dict[str, str] = {}
+    duplicates = 0
+    for relative, size in examples:
+        if sizes[size] < 2:
+            continue
+        try:
+            checksum = _md5(root / relative)
+        except OSError:
+            continue
+        existing = seen.setdefault(checksum, relative)
+        if existing != relative:
+            duplicates += 1
+            if verbose:
+                yield "19", "WARN", f"Duplicate file detected: {relative} == {existing}"
+    if duplicates == 0:
+        yield "19", "PASS", "No exact file duplicates found in examples"
+    else:
+        yield "19", "WARN", f"Found {duplicates} duplicate files in examples"
+
+
+def run(root: Path, *, verbose: bool = False) -> List[Result]:
+    """Run every file-level rule over a single snapshot of ``root``."""
+    files = walk(root)
+    return [
+        *check_file_sizes(files),
+        *check_markdown(root, files, verbose=verbose),
+        *check_duplicates(root, files, verbose=verbose),
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", type=Path, default=Path("."), help="Tree to check (default: current directory).")
+    parser.add_argument("--verbose", action="store_true", help="Report every long-line and duplicate warning.")
+    args = parser.parse_args(argv)
+
+    for section, status, message in run(args.root, verbose=args.verbose):
+        print(f"{section}|{status}|{message}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
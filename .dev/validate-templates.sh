@@ -20,6 +20,7 @@ Options:
   --upgrade           Run upgrade_tools session
   --template NAME     Limit validation to a specific template (repeatable)
   --force-rebuild     Rebuild template render caches
+  --jobs N            Render template contexts on N parallel workers (0 = one per CPU)
   --help              Show this message
 
 Without explicit mode flags the script runs the unified sync -> render -> lint -> format pipeline.
@@ -32,6 +33,7 @@ RUN_FORMAT=0
 RUN_UPGRADE=0
 RUN_ALL=0
 FORCE_REBUILD=0
+JOBS=""
 
 while [[ $# -gt 0 ]]; do
 	case "$1" in
@@ -55,6 +57,14 @@ while [[ $# -gt 0 ]]; do
 		FORCE_REBUILD=1
 		shift
 		;;
+	--jobs)
+		if [[ $# -lt 2 ]]; then
+			echo "error: --jobs requires a value" >&2
+			exit 1
+		fi
+		JOBS="$2"
+		shift 2
+		;;
 	--template)
 		if [[ $# -lt 2 ]]; then
 			echo "error: --template requires a value" >&2
@@ -94,6 +104,9 @@ fi
 if [[ ${FORCE_REBUILD} -eq 1 ]]; then
 	NOX_ARGS+=("--force")
 fi
+if [[ -n ${JOBS} ]]; then
+	NOX_ARGS+=("--jobs" "${JOBS}")
+fi
 
 run_nox() {
 	local session="$1"
@@ -1 +1,8 @@
-from applications.scaffolder.agentic_canon_cli.__main__ import *  # noqa: F401,F403
+"""Compatibility entry point so ``python -m agentic_canon_cli`` works from the repository root."""
+
+import sys
+
+from applications.scaffolder.agentic_canon_cli.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
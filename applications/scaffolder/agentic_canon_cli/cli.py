@@ -4,14 +4,24 @@ Agentic Canon CLI - Interactive project scaffolding wizard.
 
 This CLI provides an interactive way to create new projects using
 Cookiecutter templates with built-in best practices.
+
+Agents invoke the CLI many times per pipeline, so module import stays cheap:
+only the standard library needed to parse arguments is imported up front and
+each subcommand imports its own dependencies (``subprocess``, ``templates._shared``
+modules, ...) when it runs. Set ``AGENTIC_CANON_PROFILE_IMPORTS=1`` to print a
+``-X importtime`` breakdown of a command's imports.
 """
 
+from __future__ import annotations
+
 import argparse
 import os
-import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import subprocess
 
 SAFE_PIP_SPEC = "pip @ git+https://github.com/pypa/pip@f2b92314da012b9fffa36b3f3e67748a37ef464a"
 """Patched pip build that includes the GHSA-4xh5-x5gv-qwph fix."""
@@ -152,6 +162,8 @@ def _run_command(
     cmd: list[str], cwd: Optional[Path] = None
 ) -> subprocess.CompletedProcess:
     """Run a shell command, capturing output for diagnostics."""
+    import subprocess  # pylint: disable=import-outside-toplevel
+
     result = subprocess.run(
         cmd,
         cwd=cwd,
@@ -169,51 +181,186 @@ def _venv_python_path(venv_path: Path) -> Path:
     return venv_path / "bin" / "python"
 
 
+VENV_MARKER = ".agentic-canon-venv.json"
+"""Written into cache-managed ``.venv`` dirs: the cache key and the path the venv was built at."""
+
+
+def _command_detail(result: subprocess.CompletedProcess, fallback: str) -> str:
+    return result.stderr.strip() or result.stdout.strip() or fallback
+
+
+def _venv_key_material(requirements: Path) -> List[bytes]:
+    """Key a cached venv on its requirements, the interpreter that builds it and the pip spec."""
+    interpreter = os.path.realpath(getattr(sys, "_base_executable", sys.executable))
+    return [
+        b"venv-v1\0",
+        requirements.read_bytes(),
+        f"\0{sys.version}\0{sys.implementation.cache_tag}\0{interpreter}\0{sys.platform}\0".encode("utf-8"),
+        SAFE_PIP_SPEC.encode("utf-8"),
+    ]
+
+
+def _read_venv_marker(venv_path: Path) -> Optional[Dict[str, Any]]:
+    import json  # pylint: disable=import-outside-toplevel
+
+    try:
+        marker = json.loads((venv_path / VENV_MARKER).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return marker if isinstance(marker, dict) else None
+
+
+def _install_requirements(venv_python: Path, requirements: Path, wheelhouse: Optional[Path]) -> Tuple[bool, str]:
+    """
+    Upgrade pip to :data:`SAFE_PIP_SPEC` and install ``requirements`` into a venv.
+
+    With a ``wheelhouse`` the patched pip is built from git once and reused as
+    a wheel, and requirements are installed offline from wheels built there;
+    anything the wheelhouse cannot satisfy (editable or local paths) falls back
+    to a regular index install.
+    """
+    import hashlib  # pylint: disable=import-outside-toplevel
+
+    pip = [str(venv_python), "-m", "pip"]
+    pip_target = SAFE_PIP_SPEC
+    if wheelhouse is not None:
+        pip_dir = wheelhouse / "pip" / hashlib.sha256(SAFE_PIP_SPEC.encode("utf-8")).hexdigest()[:16]
+        wheels = sorted(pip_dir.glob("pip-*.whl"))
+        if not wheels:
+            _run_command([*pip, "wheel", "--no-deps", "-w", str(pip_dir), SAFE_PIP_SPEC])
+            wheels = sorted(pip_dir.glob("pip-*.whl"))
+        if wheels:
+            pip_target = str(wheels[-1])
+
+    upgrade = _run_command([*pip, "install", "--upgrade", pip_target])
+    if upgrade.returncode != 0:
+        return False, _command_detail(upgrade, "pip upgrade failed")
+
+    if wheelhouse is not None:
+        links = ["--find-links", str(wheelhouse)]
+        built = _run_command([*pip, "wheel", "-r", str(requirements), "-w", str(wheelhouse), *links])
+        if built.returncode == 0:
+            offline = _run_command([*pip, "install", "--no-index", *links, "-r", str(requirements)])
+            if offline.returncode == 0:
+                return True, "requirements installed from the wheelhouse"
+        install = _run_command([*pip, "install", *links, "-r", str(requirements)])
+    else:
+        install = _run_command([*pip, "install", "-r", str(requirements)])
+    if install.returncode != 0:
+        return False, _command_detail(install, "pip install failed")
+    return True, "requirements installed"
+
+
+def _relocate_virtualenv(venv_path: Path, old_root: str, new_root: str) -> int:
+    """
+    Point a venv restored from the cache at its new project directory.
+
+    Script shebangs, activation scripts, ``pyvenv.cfg`` and editable-install
+    hooks embed the absolute path the venv was built at. Rewritten files are
+    replaced rather than edited in place so cached objects stay untouched.
+    Returns the number of files rewritten.
+    """
+    import re  # pylint: disable=import-outside-toplevel
+    import tempfile  # pylint: disable=import-outside-toplevel
+
+    if old_root == new_root:
+        return 0
+    pattern = re.compile(re.escape(os.fsencode(old_root)) + rb"(?=[/\\\"'\s:]|$)", re.MULTILINE)
+    replacement = os.fsencode(new_root).replace(b"\\", b"\\\\")
+
+    candidates = [venv_path / "pyvenv.cfg", venv_path / VENV_MARKER]
+    candidates.extend(_venv_python_path(venv_path).parent.iterdir())
+    for site_packages in venv_path.glob("lib*/python*/site-packages"):
+        candidates.extend(site_packages.glob("*.pth"))
+        candidates.extend(site_packages.glob("__editable__*.py"))
+        candidates.extend(site_packages.glob("*.dist-info/direct_url.json"))
+
+    rewritten = 0
+    for path in candidates:
+        if path.is_symlink() or not path.is_file() or path.stat().st_size > 1024 * 1024:
+            continue
+        content = path.read_bytes()
+        updated = pattern.sub(replacement, content)
+        if updated == content:
+            continue
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".relocate-")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(updated)
+        os.chmod(temp_name, path.stat().st_mode & 0o7777)
+        os.replace(temp_name, path)
+        rewritten += 1
+    return rewritten
+
+
+def _build_virtualenv(venv_path: Path, requirements: Path, digest: str, wheelhouse: Path) -> None:
+    """Create a fresh cache-managed venv at ``venv_path``; raises ``RuntimeError`` on failure."""
+    import json  # pylint: disable=import-outside-toplevel
+    import shutil  # pylint: disable=import-outside-toplevel
+
+    if venv_path.exists():
+        shutil.rmtree(venv_path)
+    result = _run_command([sys.executable, "-m", "venv", str(venv_path)])
+    if result.returncode != 0:
+        raise RuntimeError(_command_detail(result, "venv creation failed"))
+    venv_python = _venv_python_path(venv_path)
+    if not venv_python.exists():
+        raise RuntimeError("Unable to locate python executable inside .venv")
+    success, detail = _install_requirements(venv_python, requirements, wheelhouse)
+    if not success:
+        raise RuntimeError(detail)
+    (venv_path / VENV_MARKER).write_text(
+        json.dumps({"key": digest, "root": str(venv_path.parent)}, indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+
 def _ensure_virtualenv() -> Tuple[bool, str]:
-    """Ensure a local virtual environment is ready when requirements exist."""
+    """
+    Ensure a local virtual environment is ready when requirements exist.
+
+    A missing ``.venv`` is restored from the shared installer cache (see
+    ``cache_pip_install``), keyed on :func:`_venv_key_material`; on a miss it is
+    built through the wheelhouse and published for the next checkout. A
+    ``.venv`` the cache did not create is upgraded in place and never replaced.
+    """
+    import hashlib  # pylint: disable=import-outside-toplevel
+
     requirements = Path("requirements.txt")
     if not requirements.exists():
         return True, "No requirements.txt detected, skipping Python environment setup"
 
-    venv_path = Path(".venv")
-    if not venv_path.exists():
-        result = _run_command([sys.executable, "-m", "venv", str(venv_path)])
-        if result.returncode != 0:
-            detail = (
-                result.stderr.strip() or result.stdout.strip() or "venv creation failed"
-            )
-            return False, detail
+    venv_path = Path(".venv").absolute()
+    marker = _read_venv_marker(venv_path)
+    if venv_path.exists() and marker is None:
+        venv_python = _venv_python_path(venv_path)
+        if not venv_python.exists():
+            return False, "Unable to locate python executable inside .venv"
+        success, detail = _install_requirements(venv_python, requirements, None)
+        return (True, "Python virtual environment ready") if success else (False, detail)
 
-    venv_python = _venv_python_path(venv_path)
-    if not venv_python.exists():
-        return False, "Unable to locate python executable inside .venv"
-
-    upgrade = _run_command(
-        [
-            str(venv_python),
-            "-m",
-            "pip",
-            "install",
-            "--upgrade",
-            SAFE_PIP_SPEC,
-        ]
-    )
-    if upgrade.returncode != 0:
-        detail = (
-            upgrade.stderr.strip() or upgrade.stdout.strip() or "pip upgrade failed"
-        )
-        return False, detail
+    key_material = _venv_key_material(requirements)
+    digest = hashlib.sha256(b"".join(key_material)).hexdigest()
+    if marker is not None and marker.get("key") == digest and _venv_python_path(venv_path).exists():
+        return True, "Python virtual environment up to date"
 
-    install = _run_command(
-        [str(venv_python), "-m", "pip", "install", "-r", str(requirements)]
-    )
-    if install.returncode != 0:
-        detail = (
-            install.stderr.strip() or install.stdout.strip() or "pip install failed"
-        )
-        return False, detail
+    cache = _load_shared_module("cache")
+    built: List[bool] = []
 
-    return True, "Python virtual environment ready"
+    def _installer(project_path: Path) -> None:
+        _build_virtualenv(project_path / ".venv", requirements, digest, cache.WHEELHOUSE_DIR)
+        built.append(True)
+
+    try:
+        # Reflink or copy, never hardlink: the venv is mutable and relocated after restore.
+        cache.cache_pip_install(venv_path.parent, key_material, _installer, strategy="reflink")
+    except RuntimeError as exc:
+        return False, str(exc)
+    if built:
+        return True, "Python virtual environment built and cached"
+
+    restored = _read_venv_marker(venv_path) or {}
+    _relocate_virtualenv(venv_path, str(restored.get("root") or venv_path.parent), str(venv_path.parent))
+    return True, "Python virtual environment restored from cache"
 
 
 def _install_precommit_hooks() -> Tuple[bool, str]:
@@ -278,6 +425,51 @@ def _run_validation_check() -> Tuple[bool, str]:
     return False, "Validation reported issues (see above)"
 
 
+def _load_render_backend():
+    """Return ``templates._shared.render``, or ``None`` when cookiecutter/Jinja2 are not importable."""
+    try:
+        # pylint: disable=import-outside-toplevel,unused-import
+        import cookiecutter  # type: ignore[import]  # noqa: F401
+        import jinja2  # noqa: F401
+
+        return _load_shared_module("render")
+    except ImportError:
+        return None
+
+
+def _render_template(template: str, context: Dict[str, Any], output_dir: Path) -> Path:
+    """
+    Generate ``template`` with ``context`` below ``output_dir`` and return the project directory.
+
+    Projects are rendered in-process through the shared template cache, so a
+    context that was rendered before is cloned instead of re-rendered. The
+    ``cookiecutter`` executable is only used when the library is not importable.
+    Failures raise ``RuntimeError`` chained to the underlying error.
+    """
+    template_path = TEMPLATES_DIR / template
+    render = _load_render_backend()
+    if render is not None:
+        from cookiecutter.exceptions import CookiecutterException  # type: ignore[import]  # pylint: disable=import-outside-toplevel
+
+        try:
+            return render.render_project(template, template_path, context, output_dir)
+        except FileExistsError as exc:
+            raise RuntimeError(f"{exc}; remove it or pick another project slug") from exc
+        except CookiecutterException as exc:
+            raise RuntimeError(f"{type(exc).__name__}: {exc}") from exc
+
+    cmd = ["cookiecutter", str(template_path), "--no-input", "--output-dir", str(output_dir)]
+    for key, value in context.items():
+        cmd.extend([f"{key}={value}"])
+    try:
+        result = _run_command(cmd)
+    except FileNotFoundError as exc:
+        raise RuntimeError("Cookiecutter not installed. Install with: pip install cookiecutter") from exc
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr or result.stdout)
+    return output_dir / str(context.get("project_slug", ""))
+
+
 def generate_project(template: str, context: Dict[str, Any]) -> bool:
     """Generate project using Cookiecutter."""
     print("\n🔨 Generating project...\n")
@@ -289,23 +481,13 @@ def generate_project(template: str, context: Dict[str, Any]) -> bool:
         print(f"❌ Template not found: {template_path}")
         return False
 
-    # Build cookiecutter command
-    cmd = ["cookiecutter", str(template_path), "--no-input"]
-
-    # Add context parameters
-    for key, value in context.items():
-        cmd.extend([f"{key}={value}"])
-
     try:
-        result = _run_command(cmd)
-        if result.returncode != 0:
-            print(f"\n❌ Cookiecutter failed: {result.stderr or result.stdout}")
-            return False
-        print("\n✅ Project generated successfully!")
-        return True
-    except FileNotFoundError:
-        print("\n❌ Cookiecutter not installed. Install with: pip install cookiecutter")
+        _render_template(template, context, Path.cwd())
+    except RuntimeError as exc:
+        print(f"\n❌ Cookiecutter failed: {exc}")
         return False
+    print("\n✅ Project generated successfully!")
+    return True
 
 
 def show_next_steps(project_slug: str):
@@ -436,68 +618,19 @@ def cmd_repo_init():
         print(f"\n❌ Template not found: {template_path}")
         return 1
 
-    # Build cookiecutter command
-    cmd = ["cookiecutter", str(template_path), "--no-input", "--output-dir", "/tmp"]
-    for key, value in details.items():
-        cmd.extend([f"{key}={value}"])
-
     try:
-        subprocess.run(cmd, check=True)
-
-        # Copy generated files to current directory
-        temp_project = Path("/tmp") / details["project_slug"]
-        if temp_project.exists():
-            # Copy workflows
-            os.makedirs(".github/workflows", exist_ok=True)
-            for workflow in (temp_project / ".github" / "workflows").glob("*.yml"):
-                # Only copy non-empty workflow files (not disabled by cookiecutter)
-                content = workflow.read_text()
-                if content.strip():
-                    dest = Path(".github/workflows") / workflow.name
-                    dest.write_text(content)
-                    print(f"  ✅ Created {dest}")
-
-            # Copy other .github files
-            if (temp_project / ".github" / "CODEOWNERS").exists():
-                dest = Path(".github/CODEOWNERS")
-                dest.write_text((temp_project / ".github" / "CODEOWNERS").read_text())
-                print(f"  ✅ Created {dest}")
-
-            if (temp_project / ".github" / "PULL_REQUEST_TEMPLATE.md").exists():
-                dest = Path(".github/PULL_REQUEST_TEMPLATE.md")
-                dest.write_text(
-                    (temp_project / ".github" / "PULL_REQUEST_TEMPLATE.md").read_text()
-                )
-                print(f"  ✅ Created {dest}")
-
-            # Copy issue templates
-            os.makedirs(".github/ISSUE_TEMPLATE", exist_ok=True)
-            for template_file in (temp_project / ".github" / "ISSUE_TEMPLATE").glob(
-                "*.md"
-            ):
-                dest = Path(".github/ISSUE_TEMPLATE") / template_file.name
-                dest.write_text(template_file.read_text())
-                print(f"  ✅ Created {dest}")
-
-            # Copy docs
-            if (temp_project / "PROJECT_MANAGEMENT.md").exists():
-                dest = Path("PROJECT_MANAGEMENT.md")
-                if not dest.exists():
-                    dest.write_text(
-                        (temp_project / "PROJECT_MANAGEMENT.md").read_text()
-                    )
-                    print(f"  ✅ Created {dest}")
-
-            if (temp_project / "TASKS.md").exists():
-                dest = Path("TASKS.md")
-                if not dest.exists():
-                    dest.write_text((temp_project / "TASKS.md").read_text())
-                    print(f"  ✅ Created {dest}")
-
-            # Cleanup temp directory
-            import shutil
-
-            shutil.rmtree(temp_project)
+        import tempfile  # pylint: disable=import-outside-toplevel
+
+        apply_overlay = _load_cli_module("overlay").apply_overlay
+
+        # A private render dir keeps concurrent repo-inits on a shared runner apart.
+        with tempfile.TemporaryDirectory(prefix="agentic-canon-repo-init-") as temp_dir:
+            temp_project = _render_template("project-management", details, Path(temp_dir))
+            for result in apply_overlay(temp_project, Path.cwd()):
+                if result["status"] in ("created", "updated"):
+                    print(f"  ✅ {result['status'].capitalize()} {result['path']}")
+                elif result["status"] == "unchanged":
+                    print(f"  ⏭️  Unchanged {result['path']}")
 
         print("\n✅ Project management automation setup complete!")
         print("\n📋 Next Steps:")
@@ -511,7 +644,7 @@ def cmd_repo_init():
         print("\n📚 See PROJECT_MANAGEMENT.md for detailed documentation\n")
         return 0
 
-    except subprocess.CalledProcessError as e:
+    except RuntimeError as e:
         print(f"\n❌ Failed to generate: {e}")
         return 1
     except Exception as e:
@@ -524,48 +657,17 @@ def cmd_repo_init():
 
 def cmd_validate():
     """Validate project structure and configuration."""
-    print("\n🔍 Validating Project Structure\n")
-
-    issues = []
-    warnings = []
+    inspection = _load_cli_module("inspection")
 
-    # Check for common files
-    required_files = ["README.md"]
-    recommended_files = ["CONTRIBUTING.md", "SECURITY.md", "LICENSE", ".gitignore"]
-
-    for file in required_files:
-        if not Path(file).exists():
-            issues.append(f"Missing required file: {file}")
-        else:
-            print(f"  ✅ {file}")
-
-    for file in recommended_files:
-        if not Path(file).exists():
-            warnings.append(f"Missing recommended file: {file}")
-        else:
-            print(f"  ✅ {file}")
-
-    # Check .github structure
-    if Path(".github").exists():
-        print("  ✅ .github/")
-
-        # Check for workflows
-        if Path(".github/workflows").exists():
-            workflows = list(Path(".github/workflows").glob("*.yml")) + list(
-                Path(".github/workflows").glob("*.yaml")
-            )
-            if workflows:
-                print(f"  ✅ .github/workflows/ ({len(workflows)} workflows)")
-            else:
-                warnings.append("No workflows found in .github/workflows/")
-    else:
-        warnings.append("No .github/ directory found")
+    print("\n🔍 Validating Project Structure\n")
 
-    # Check for git repository
-    if Path(".git").exists():
-        print("  ✅ Git repository initialized")
-    else:
-        issues.append("Not a git repository")
+    required_files = inspection.REQUIRED_FILES
+    recommended_files = inspection.RECOMMENDED_FILES
+    results = inspection.validate_rules(inspection.ProjectIndex(Path.cwd()))
+    issues = results["issues"]
+    warnings = results["warnings"]
+    for label in results["passed"]:
+        print(f"  ✅ {label}")
 
     # Summary
     print("\n📊 Validation Summary:")
@@ -588,70 +690,173 @@ def cmd_validate():
     return 0
 
 
-def cmd_doctor():
-    """Check environment setup and dependencies."""
-    print("\n🩺 Environment Diagnostic\n")
+DOCTOR_PROBES: Tuple[Tuple[str, str, str], ...] = (
+    ("Git", "git", "Not found"),
+    ("GitHub CLI", "gh", "Not installed"),
+    ("Cookiecutter", "cookiecutter", "Not installed"),
+    ("pre-commit", "pre-commit", "Not installed"),
+)
+"""``(check name, executable, label when missing)`` for each tool ``doctor`` probes."""
 
-    checks = []
+DOCTOR_PROBE_TIMEOUT = 10.0
+_DOCTOR_CACHE_VERSION = 1
 
-    # Check Python version
-    import sys
 
-    python_version = (
-        f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-    )
-    checks.append(("Python version", python_version, sys.version_info >= (3, 8)))
+def _doctor_cache_path() -> Path:
+    return _load_shared_module("cache").CACHE_ROOT / "doctor.json"
 
-    # Check for git
-    try:
-        result = subprocess.run(
-            ["git", "--version"], capture_output=True, text=True, check=True
-        )
-        git_version = result.stdout.strip()
-        checks.append(("Git", git_version, True))
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        checks.append(("Git", "Not found", False))
 
-    # Check for gh CLI
+def _probe_fingerprint(executable: str) -> str:
+    """
+    Identify the installation a probe would hit.
+
+    Found tools are keyed on the resolved binary and its PATH entry's mtime;
+    missing tools on every PATH entry's mtime, so installing a tool anywhere on
+    PATH invalidates the cached "not installed" result.
+    """
+    import hashlib  # pylint: disable=import-outside-toplevel
+    import shutil  # pylint: disable=import-outside-toplevel
+
+    resolved = shutil.which(executable)
+    entries = [resolved] if resolved else os.environ.get("PATH", "").split(os.pathsep)
+    parts = [resolved or ""]
+    for entry in entries:
+        for candidate in (entry, os.path.dirname(entry)) if resolved else (entry,):
+            try:
+                parts.append(f"{candidate}:{os.stat(candidate).st_mtime_ns}")
+            except OSError:
+                parts.append(f"{candidate}:-")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _probe_tool(name: str, executable: str, missing: str) -> Dict[str, Any]:
+    """Run ``<executable> --version`` with a timeout and describe the outcome."""
+    import subprocess  # pylint: disable=import-outside-toplevel
+    import time  # pylint: disable=import-outside-toplevel
+
+    started = time.perf_counter()
+    check: Dict[str, Any] = {"name": name, "command": executable, "cached": False}
     try:
         result = subprocess.run(
-            ["gh", "--version"], capture_output=True, text=True, check=True
+            [executable, "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=DOCTOR_PROBE_TIMEOUT,
         )
-        gh_version = result.stdout.split("\n")[0].strip()
-        checks.append(("GitHub CLI", gh_version, True))
+        lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        check.update(version=lines[0] if lines else "", ok=True)
+    except subprocess.TimeoutExpired:
+        check.update(version=f"Timed out after {DOCTOR_PROBE_TIMEOUT:g}s", ok=False, timed_out=True)
     except (subprocess.CalledProcessError, FileNotFoundError):
-        checks.append(("GitHub CLI", "Not installed", False))
+        check.update(version=missing, ok=False)
+    check["seconds"] = round(time.perf_counter() - started, 3)
+    return check
+
+
+def _read_doctor_cache(path: Path) -> Dict[str, Any]:
+    import json  # pylint: disable=import-outside-toplevel
 
-    # Check for cookiecutter
     try:
-        result = subprocess.run(
-            ["cookiecutter", "--version"], capture_output=True, text=True, check=True
-        )
-        cc_version = result.stdout.strip()
-        checks.append(("Cookiecutter", cc_version, True))
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        checks.append(("Cookiecutter", "Not installed", False))
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _DOCTOR_CACHE_VERSION:
+        return {}
+    probes = data.get("probes")
+    return probes if isinstance(probes, dict) else {}
+
+
+def _write_doctor_cache(path: Path, probes: Dict[str, Any]) -> None:
+    import json  # pylint: disable=import-outside-toplevel
+    import tempfile  # pylint: disable=import-outside-toplevel
 
-    # Check for pre-commit
+    payload = json.dumps({"version": _DOCTOR_CACHE_VERSION, "probes": probes}, indent=2, sort_keys=True)
     try:
-        result = subprocess.run(
-            ["pre-commit", "--version"], capture_output=True, text=True, check=True
-        )
-        pc_version = result.stdout.strip()
-        checks.append(("pre-commit", pc_version, True))
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        checks.append(("pre-commit", "Not installed", False))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".doctor-")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(payload)
+        os.replace(temp_name, path)
+    except OSError:
+        # A read-only cache only costs the next run a re-probe.
+        pass
+
+
+def run_doctor_probes(*, use_cache: bool = True) -> List[Dict[str, Any]]:
+    """
+    Probe every tool in :data:`DOCTOR_PROBES` concurrently.
+
+    Results are cached in ``CACHE_ROOT/doctor.json`` keyed on
+    :func:`_probe_fingerprint`; timed-out probes are never cached.
+    """
+    from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    cache_path = _doctor_cache_path()
+    cached = _read_doctor_cache(cache_path) if use_cache else {}
+    fingerprints = {executable: _probe_fingerprint(executable) for _name, executable, _missing in DOCTOR_PROBES}
+
+    checks: Dict[str, Dict[str, Any]] = {}
+    pending = []
+    for name, executable, missing in DOCTOR_PROBES:
+        entry = cached.get(executable)
+        if isinstance(entry, dict) and entry.get("fingerprint") == fingerprints[executable]:
+            checks[executable] = {**entry["check"], "cached": True, "seconds": 0.0}
+        else:
+            pending.append((name, executable, missing))
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            for check in pool.map(lambda probe: _probe_tool(*probe), pending):
+                checks[check["command"]] = check
+        updated = dict(cached)
+        for _name, executable, _missing in pending:
+            check = checks[executable]
+            if check.get("timed_out"):
+                updated.pop(executable, None)
+                continue
+            stored = {key: value for key, value in check.items() if key not in ("cached", "seconds")}
+            updated[executable] = {"fingerprint": fingerprints[executable], "check": stored}
+        _write_doctor_cache(cache_path, updated)
+
+    return [checks[executable] for _name, executable, _missing in DOCTOR_PROBES]
+
+
+def cmd_doctor(as_json: bool = False, refresh: bool = False):
+    """Check environment setup and dependencies."""
+    python_version = (
+        f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    )
+    checks: List[Dict[str, Any]] = [
+        {
+            "name": "Python version",
+            "command": sys.executable,
+            "version": python_version,
+            "ok": sys.version_info >= (3, 8),
+            "cached": False,
+        }
+    ]
+    checks.extend(run_doctor_probes(use_cache=not refresh))
+    failed = [check for check in checks if not check["ok"]]
+
+    if as_json:
+        import json  # pylint: disable=import-outside-toplevel
+
+        print(json.dumps({"ok": not failed, "checks": checks}, indent=2))
+        return 0 if not failed else 1
+
+    print("\n🩺 Environment Diagnostic\n")
 
     # Display results
-    for name, version, status in checks:
-        status_icon = "✅" if status else "❌"
-        print(f"  {status_icon} {name}: {version}")
+    for check in checks:
+        status_icon = "✅" if check["ok"] else "❌"
+        print(f"  {status_icon} {check['name']}: {check['version']}")
 
     # Recommendations
-    failed = [c for c in checks if not c[2]]
     if failed:
         print("\n📦 Installation Recommendations:")
-        for name, _, _ in failed:
+        for check in failed:
+            name = check["name"]
             if name == "GitHub CLI":
                 print("  - Install GitHub CLI: https://cli.github.com/")
             elif name == "Cookiecutter":
@@ -665,61 +870,11 @@ def cmd_doctor():
 
 def cmd_audit():
     """Run security and quality audit on project."""
-    print("\n🔒 Security & Quality Audit\n")
-
-    audit_items = []
-
-    # Check for security files
-    if Path("SECURITY.md").exists():
-        audit_items.append(("Security policy", True, "SECURITY.md exists"))
-    else:
-        audit_items.append(("Security policy", False, "SECURITY.md missing"))
+    inspection = _load_cli_module("inspection")
 
-    # Check for .gitignore
-    if Path(".gitignore").exists():
-        gitignore = Path(".gitignore").read_text()
-        has_secrets = any(
-            pattern in gitignore for pattern in [".env", "*.key", "*.pem", "secret"]
-        )
-        audit_items.append(
-            (
-                "Secrets in .gitignore",
-                has_secrets,
-                f"{'Found' if has_secrets else 'Missing'} secret patterns",
-            )
-        )
-    else:
-        audit_items.append(("Secrets in .gitignore", False, ".gitignore missing"))
-
-    # Check for security workflows
-    security_workflows = []
-    if Path(".github/workflows").exists():
-        for workflow in Path(".github/workflows").glob("*.yml"):
-            content = workflow.read_text().lower()
-            if any(
-                keyword in content
-                for keyword in ["codeql", "security", "secret", "vulnerability"]
-            ):
-                security_workflows.append(workflow.name)
-
-    if security_workflows:
-        audit_items.append(
-            ("Security workflows", True, f"Found: {', '.join(security_workflows)}")
-        )
-    else:
-        audit_items.append(("Security workflows", False, "No security workflows found"))
-
-    # Check for CODEOWNERS
-    if Path(".github/CODEOWNERS").exists():
-        audit_items.append(("Code ownership", True, "CODEOWNERS file exists"))
-    else:
-        audit_items.append(("Code ownership", False, "CODEOWNERS missing"))
+    print("\n🔒 Security & Quality Audit\n")
 
-    # Check for dependabot
-    if Path(".github/dependabot.yml").exists():
-        audit_items.append(("Dependency updates", True, "Dependabot configured"))
-    else:
-        audit_items.append(("Dependency updates", False, "Dependabot not configured"))
+    audit_items = inspection.audit_rules(inspection.ProjectIndex(Path.cwd()))
 
     # Display results
     for name, status, detail in audit_items:
@@ -743,6 +898,8 @@ def cmd_audit():
 
 def cmd_update():
     """Update project from template using Cruft."""
+    import subprocess  # pylint: disable=import-outside-toplevel
+
     print("\n🔄 Updating Project from Template\n")
 
     # Check if cruft is installed
@@ -834,6 +991,134 @@ def cmd_update():
         return 1
 
 
+def _load_shared_module(name: str):
+    """Import ``templates._shared.<name>`` from the scaffolder tree."""
+    import importlib  # pylint: disable=import-outside-toplevel
+
+    if str(SCAFFOLDER_ROOT) not in sys.path:
+        sys.path.insert(0, str(SCAFFOLDER_ROOT))
+    return importlib.import_module(f"templates._shared.{name}")
+
+
+def _load_cli_module(name: str):
+    """Import ``agentic_canon_cli.<name>``; works when this file is run directly as a script."""
+    import importlib  # pylint: disable=import-outside-toplevel
+
+    if str(SCAFFOLDER_ROOT) not in sys.path:
+        sys.path.insert(0, str(SCAFFOLDER_ROOT))
+    return importlib.import_module(f"agentic_canon_cli.{name}")
+
+
+def cmd_gc(
+    max_size: Optional[str] = None,
+    max_age_days: Optional[float] = None,
+    dry_run: bool = False,
+) -> int:
+    """Evict stale and least recently used entries from the shared cache."""
+    print("\n🧹 Cache Garbage Collection\n")
+
+    eviction = _load_shared_module("eviction")
+    try:
+        max_bytes = eviction.parse_size(max_size) if max_size is not None else None
+    except ValueError as exc:
+        print(f"❌ {exc}")
+        return 1
+
+    report = eviction.collect_garbage(
+        max_bytes=max_bytes,
+        max_age_days=max_age_days,
+        dry_run=dry_run,
+    )
+
+    budget = eviction.format_size(report["max_bytes"]) if report["max_bytes"] else "unlimited"
+    age = f"{report['max_age_days']:g} days" if report["max_age_days"] else "unlimited"
+    print(f"📦 Budget: {budget}, max age: {age}")
+    print(f"🔍 Scanned {report['scanned']} cache entries")
+
+    verb = "Would evict" if dry_run else "Evicted"
+    print(f"🗑️  {verb} {len(report['evicted'])} entries and {report['objects_removed']} objects")
+    for path in report["evicted"]:
+        print(f"  - {path}")
+    derived = {name: stats for name, stats in report["auxiliary"].items() if stats["files"]}
+    if derived:
+        print("🗂️  Derived caches:")
+        for name, stats in derived.items():
+            print(
+                f"  - {name}: {stats['files']} files, {eviction.format_size(stats['bytes'])}; "
+                f"{verb.lower()} {stats['evicted']}"
+            )
+    if report["staging_removed"]:
+        print(f"🧽 Removed {len(report['staging_removed'])} stale staging directories")
+    if report["busy"]:
+        print(f"⏳ Skipped {len(report['busy'])} entries in use")
+
+    print(
+        f"\n✅ Cache size: {eviction.format_size(report['bytes_before'])} → "
+        f"{eviction.format_size(report['bytes_after'])}\n"
+    )
+    return 0
+
+
+def cmd_generate(
+    spec: str,
+    output_dir: str = ".",
+    jobs: Optional[int] = None,
+    report_path: Optional[str] = None,
+    keep_going: bool = False,
+) -> int:
+    """Generate many projects from a JSONL/YAML spec file."""
+    import json  # pylint: disable=import-outside-toplevel
+
+    print("\n🏭 Batch Project Generation\n")
+
+    if _load_render_backend() is None:
+        print("❌ Batch generation needs the cookiecutter library. Install with: pip install cookiecutter")
+        return 1
+    batch = _load_shared_module("batch")
+    try:
+        entries = batch.load_spec(Path(spec))
+    except (OSError, ValueError) as exc:
+        print(f"❌ Cannot read spec: {exc}")
+        return 1
+
+    print(f"📋 Validating {len(entries)} projects from {spec}")
+
+    def _progress(result: Dict[str, Any]) -> None:
+        if result["status"] == "generated":
+            source = "cache" if result["cached"] else "rendered"
+            print(f"  ✅ [{result['index']}] {result['project_dir']} ({source}, {result['seconds']:.1f}s)")
+        else:
+            print(f"  ❌ [{result['index']}] {result['project_dir']}: {result['error']}")
+
+    report = batch.run_batch(
+        entries,
+        output_dir=Path(output_dir),
+        jobs=jobs,
+        keep_going=keep_going,
+        on_result=_progress,
+    )
+
+    for result in report["results"]:
+        if result["status"] == "invalid":
+            label = result["project_dir"] or result["template"] or "entry"
+            print(f"  ⚠️  [{result['index']}] {label}:")
+            for error in result["errors"]:
+                print(f"      - {error}")
+    if report["skipped"]:
+        print(f"\n⏭️  Skipped {report['skipped']} valid projects; fix the spec or pass --keep-going")
+
+    if report_path:
+        Path(report_path).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\n📝 Report written to {report_path}")
+
+    print(
+        f"\n{'✅' if report['generated'] == report['total'] else '⚠️ '} "
+        f"Generated {report['generated']}/{report['total']} projects in {report['seconds']:.1f}s "
+        f"({report['failed']} failed, {report['invalid']} invalid)\n"
+    )
+    return 0 if report["generated"] == report["total"] else 1
+
+
 def cmd_fix() -> int:
     """Run intelligent heuristics to remediate common setup issues."""
     print("\n🧠 Intelligent Auto-Fix (beta)\n")
@@ -872,8 +1157,80 @@ def cmd_fix() -> int:
     return 1
 
 
-def main():
-    """Main CLI entry point with subcommands."""
+PROFILE_IMPORTS_ENV = "AGENTIC_CANON_PROFILE_IMPORTS"
+"""Set to ``1`` (or a row count) to print the slowest imports of a CLI invocation."""
+
+_IMPORT_TIME_PREFIX = "import time:"
+_PROFILE_ROWS = 20
+
+
+def parse_import_times(lines: Sequence[str]) -> List[Dict[str, Any]]:
+    """Parse ``python -X importtime`` lines into ``{module, depth, self_us, cumulative_us}`` rows."""
+    rows: List[Dict[str, Any]] = []
+    for line in lines:
+        if not line.startswith(_IMPORT_TIME_PREFIX):
+            continue
+        fields = line[len(_IMPORT_TIME_PREFIX) :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # column header
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        rows.append(
+            {
+                "module": module,
+                "depth": (len(name) - len(module) - 1) // 2,
+                "self_us": int(fields[0]),
+                "cumulative_us": int(fields[1]),
+            }
+        )
+    return rows
+
+
+def _profile_imports(argv: Sequence[str]) -> int:
+    """Re-run the CLI under ``-X importtime`` and print its slowest imports to stderr."""
+    import subprocess  # pylint: disable=import-outside-toplevel
+
+    setting = os.environ.get(PROFILE_IMPORTS_ENV, "")
+    limit = int(setting) if setting.isdigit() and int(setting) > 1 else _PROFILE_ROWS
+
+    env = dict(os.environ)
+    env.pop(PROFILE_IMPORTS_ENV, None)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (str(SCAFFOLDER_ROOT), env.get("PYTHONPATH", "")) if path
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "agentic_canon_cli", *argv],
+        env=env,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+
+    timings: List[str] = []
+    for line in process.stderr.splitlines():
+        if line.startswith(_IMPORT_TIME_PREFIX):
+            timings.append(line)
+        else:
+            print(line, file=sys.stderr)
+
+    rows = parse_import_times(timings)
+    total_us = sum(row["self_us"] for row in rows)
+    print(
+        f"\n⏱️  Import profile: {len(rows)} modules, {total_us / 1000:.1f} ms total",
+        file=sys.stderr,
+    )
+    print(f"{'self ms':>9} {'cumul ms':>9}  module", file=sys.stderr)
+    for row in sorted(rows, key=lambda item: item["cumulative_us"], reverse=True)[:limit]:
+        print(
+            f"{row['self_us'] / 1000:>9.1f} {row['cumulative_us'] / 1000:>9.1f}  "
+            f"{'  ' * row['depth']}{row['module']}",
+            file=sys.stderr,
+        )
+    return process.returncode
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser; subcommand dependencies are imported by the commands."""
     parser = argparse.ArgumentParser(
         description="Agentic Canon CLI - Project scaffolding and management",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -901,7 +1258,17 @@ def main():
     )
 
     # doctor command
-    subparsers.add_parser("doctor", help="Check environment setup and dependencies")
+    doctor_parser = subparsers.add_parser("doctor", help="Check environment setup and dependencies")
+    doctor_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the checks as JSON for agents and scripts",
+    )
+    doctor_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-probe every tool instead of reusing cached results",
+    )
 
     # audit command
     subparsers.add_parser("audit", help="Run security and quality audit")
@@ -912,7 +1279,65 @@ def main():
     # fix command
     subparsers.add_parser("fix", help="Run the intelligent auto-fix routine")
 
-    args = parser.parse_args()
+    # gc command
+    gc_parser = subparsers.add_parser(
+        "gc", help="Evict stale entries from the template and installer cache"
+    )
+    gc_parser.add_argument(
+        "--max-size",
+        help="Cache size budget, e.g. 500M or 10G (default: $AGENTIC_CANON_CACHE_MAX_SIZE or 10G; 0 disables)",
+    )
+    gc_parser.add_argument(
+        "--max-age-days",
+        type=float,
+        help="Evict entries unused for this many days (default: $AGENTIC_CANON_CACHE_MAX_AGE_DAYS or 30; 0 disables)",
+    )
+    gc_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be evicted without deleting anything",
+    )
+
+    # generate command
+    generate_parser = subparsers.add_parser(
+        "generate", help="Generate projects non-interactively from a spec file"
+    )
+    generate_parser.add_argument(
+        "--batch",
+        required=True,
+        metavar="SPEC",
+        help="JSONL or YAML file of {template, context, output_dir} entries",
+    )
+    generate_parser.add_argument(
+        "--output-dir",
+        default=".",
+        help="Directory projects are generated in unless an entry sets output_dir (default: .)",
+    )
+    generate_parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Concurrent renders (default: one per CPU)",
+    )
+    generate_parser.add_argument(
+        "--report",
+        help="Write the per-project JSON result report to this path",
+    )
+    generate_parser.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="Generate the valid entries even when others fail validation",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Main CLI entry point with subcommands."""
+    arguments = list(sys.argv[1:] if argv is None else argv)
+    if os.environ.get(PROFILE_IMPORTS_ENV, "0") not in ("", "0"):
+        return _profile_imports(arguments)
+
+    parser = build_parser()
+    args = parser.parse_args(arguments)
 
     # If no command specified, default to init
     if not args.command:
@@ -925,10 +1350,14 @@ def main():
         "init": cmd_init,
         "repo-init": cmd_repo_init,
         "validate": cmd_validate,
-        "doctor": cmd_doctor,
+        "doctor": lambda: cmd_doctor(args.json, args.refresh),
         "audit": cmd_audit,
         "update": cmd_update,
         "fix": cmd_fix,
+        "gc": lambda: cmd_gc(args.max_size, args.max_age_days, args.dry_run),
+        "generate": lambda: cmd_generate(
+            args.batch, args.output_dir, args.jobs, args.report, args.keep_going
+        ),
     }
 
     command_func = commands.get(args.command)
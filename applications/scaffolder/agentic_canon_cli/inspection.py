@@ -0,0 +1,208 @@
+"""Project inspection engine shared by ``validate`` and ``audit``.
+
+Checks run as rules over a :class:`ProjectIndex`: every directory a rule
+looks at is listed once with ``os.scandir`` and answered from memory after
+that, so existence tests and workflow globs never touch the filesystem twice.
+Only the directories rules ask about are scanned, which keeps the cost
+independent of how large the rest of a monorepo is. File contents are
+searched by streaming them through a compiled keyword matcher that stops at
+the first hit.
+"""
+
+from __future__ import annotations
+
+import os
+import posixpath
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+WORKFLOWS_DIR = ".github/workflows"
+WORKFLOW_SUFFIXES = (".yml", ".yaml")
+SECURITY_KEYWORDS = ("codeql", "security", "secret", "vulnerability")
+SECRET_IGNORE_PATTERNS = (".env", "*.key", "*.pem", "secret")
+
+REQUIRED_FILES = ("README.md",)
+RECOMMENDED_FILES = ("CONTRIBUTING.md", "SECURITY.md", "LICENSE", ".gitignore")
+
+_CHUNK_SIZE = 64 * 1024
+
+AuditItem = Tuple[str, bool, str]
+"""``(check name, passed, detail)`` row reported by ``agentic-canon audit``."""
+
+
+class ProjectIndex:
+    """Memoised ``os.scandir`` listings of a project tree, keyed by POSIX relative path."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._listings: Dict[str, Dict[str, str]] = {}
+
+    def listing(self, directory: str = "") -> Dict[str, str]:
+        """Map each entry of ``directory`` to ``"dir"`` or ``"file"`` (``{}`` if it is missing)."""
+        directory = posixpath.normpath(directory) if directory else ""
+        directory = "" if directory == "." else directory
+        cached = self._listings.get(directory)
+        if cached is not None:
+            return cached
+
+        entries: Dict[str, str] = {}
+        try:
+            with os.scandir(self.root / directory) as iterator:
+                for entry in iterator:
+                    try:
+                        # Follow symlinks like Path.exists(); dangling links count as missing.
+                        if entry.is_dir():
+                            entries[entry.name] = "dir"
+                        elif entry.is_file():
+                            entries[entry.name] = "file"
+                    except OSError:
+                        continue
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            pass
+        self._listings[directory] = entries
+        return entries
+
+    def kind(self, path: str) -> Optional[str]:
+        parent, name = posixpath.split(posixpath.normpath(path))
+        return self.listing(parent).get(name)
+
+    def exists(self, path: str) -> bool:
+        return self.kind(path) is not None
+
+    def is_dir(self, path: str) -> bool:
+        return self.kind(path) == "dir"
+
+    def files(self, directory: str, suffixes: Iterable[str]) -> List[str]:
+        """Relative paths of the files in ``directory`` ending with one of ``suffixes``, sorted."""
+        suffixes = tuple(suffixes)
+        return sorted(
+            posixpath.join(directory, name)
+            for name, kind in self.listing(directory).items()
+            if kind == "file" and name.endswith(suffixes)
+        )
+
+    def path(self, relative: str) -> Path:
+        return self.root / relative
+
+
+def compile_keywords(keywords: Iterable[str], *, ignore_case: bool = True) -> Pattern[str]:
+    """Compile literal ``keywords`` into one alternation, longest first."""
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return re.compile("|".join(re.escape(keyword) for keyword in ordered), re.IGNORECASE if ignore_case else 0)
+
+
+def stream_search(path: Path, matcher: Pattern[str], *, overlap: int) -> Optional[str]:
+    """
+    Return the first ``matcher`` hit in ``path``, reading it in chunks.
+
+    ``overlap`` must be at least the longest keyword length minus one so a
+    keyword split across two chunks is still found.
+    """
+    tail = ""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as handle:
+            while True:
+                chunk = handle.read(_CHUNK_SIZE)
+                if not chunk:
+                    return None
+                window = tail + chunk
+                match = matcher.search(window)
+                if match:
+                    return match.group(0)
+                tail = window[-overlap:] if overlap else ""
+    except OSError:
+        return None
+
+
+def _search(index: ProjectIndex, relative: str, matcher: Pattern[str], keywords: Tuple[str, ...]) -> Optional[str]:
+    return stream_search(index.path(relative), matcher, overlap=max(map(len, keywords)) - 1)
+
+
+_SECURITY_MATCHER = compile_keywords(SECURITY_KEYWORDS)
+# .gitignore entries are literal paths, so they are compared case-sensitively.
+_SECRET_IGNORE_MATCHER = compile_keywords(SECRET_IGNORE_PATTERNS, ignore_case=False)
+
+
+def workflow_files(index: ProjectIndex) -> List[str]:
+    return index.files(WORKFLOWS_DIR, WORKFLOW_SUFFIXES)
+
+
+def validate_rules(index: ProjectIndex) -> Dict[str, List[str]]:
+    """Run the ``agentic-canon validate`` checks; returns ``passed``, ``warnings`` and ``issues``."""
+    passed: List[str] = []
+    warnings: List[str] = []
+    issues: List[str] = []
+
+    for name in REQUIRED_FILES:
+        if index.exists(name):
+            passed.append(name)
+        else:
+            issues.append(f"Missing required file: {name}")
+    for name in RECOMMENDED_FILES:
+        if index.exists(name):
+            passed.append(name)
+        else:
+            warnings.append(f"Missing recommended file: {name}")
+
+    if index.exists(".github"):
+        passed.append(".github/")
+        if index.exists(WORKFLOWS_DIR):
+            workflows = workflow_files(index)
+            if workflows:
+                passed.append(f"{WORKFLOWS_DIR}/ ({len(workflows)} workflows)")
+            else:
+                warnings.append(f"No workflows found in {WORKFLOWS_DIR}/")
+    else:
+        warnings.append("No .github/ directory found")
+
+    if index.exists(".git"):
+        passed.append("Git repository initialized")
+    else:
+        issues.append("Not a git repository")
+
+    return {"passed": passed, "warnings": warnings, "issues": issues}
+
+
+def audit_rules(index: ProjectIndex) -> List[AuditItem]:
+    """Run the ``agentic-canon audit`` checks in report order."""
+    items: List[AuditItem] = []
+
+    if index.exists("SECURITY.md"):
+        items.append(("Security policy", True, "SECURITY.md exists"))
+    else:
+        items.append(("Security policy", False, "SECURITY.md missing"))
+
+    if index.exists(".gitignore"):
+        has_secrets = _search(index, ".gitignore", _SECRET_IGNORE_MATCHER, SECRET_IGNORE_PATTERNS) is not None
+        items.append(
+            (
+                "Secrets in .gitignore",
+                has_secrets,
+                f"{'Found' if has_secrets else 'Missing'} secret patterns",
+            )
+        )
+    else:
+        items.append(("Secrets in .gitignore", False, ".gitignore missing"))
+
+    security_workflows = [
+        posixpath.basename(workflow)
+        for workflow in workflow_files(index)
+        if _search(index, workflow, _SECURITY_MATCHER, SECURITY_KEYWORDS) is not None
+    ]
+    if security_workflows:
+        items.append(("Security workflows", True, f"Found: {', '.join(security_workflows)}"))
+    else:
+        items.append(("Security workflows", False, "No security workflows found"))
+
+    if index.exists(".github/CODEOWNERS"):
+        items.append(("Code ownership", True, "CODEOWNERS file exists"))
+    else:
+        items.append(("Code ownership", False, "CODEOWNERS missing"))
+
+    if index.exists(".github/dependabot.yml"):
+        items.append(("Dependency updates", True, "Dependabot configured"))
+    else:
+        items.append(("Dependency updates", False, "Dependabot not configured"))
+
+    return items
@@ -0,0 +1,131 @@
+"""Manifest-driven file overlay used by ``agentic-canon repo-init``.
+
+A rendered template is laid over an existing checkout according to an
+ordered manifest of glob patterns. Files are copied as bytes with
+``shutil.copyfile`` (which uses ``sendfile``/``copy_file_range`` where the
+platform offers them), written through a temporary sibling and renamed into
+place, and skipped entirely when the destination already has identical
+content. Copies run on a small thread pool; results come back in manifest
+order so the CLI output is stable.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+_CHUNK_SIZE = 1024 * 1024
+_MAX_WORKERS = 8
+
+REPO_INIT_OVERLAY: Sequence[Mapping[str, Any]] = (
+    # Workflows cookiecutter disabled render to blank files and are not copied.
+    {"pattern": ".github/workflows/*.yml", "existing": "replace", "skip_blank": True},
+    {"pattern": ".github/CODEOWNERS", "existing": "replace"},
+    {"pattern": ".github/PULL_REQUEST_TEMPLATE.md", "existing": "replace"},
+    {"pattern": ".github/ISSUE_TEMPLATE/*.md", "existing": "replace"},
+    {"pattern": "PROJECT_MANAGEMENT.md", "existing": "keep"},
+    {"pattern": "TASKS.md", "existing": "keep"},
+)
+"""Files ``repo-init`` copies from the rendered template, in report order.
+
+``existing`` is ``"replace"`` to overwrite a differing destination or
+``"keep"`` to leave any existing destination untouched.
+"""
+
+OverlayResult = Dict[str, str]
+"""``{"path": <relative POSIX path>, "status": "created" | "updated" | "unchanged" | "kept"}``."""
+
+
+def _is_blank(path: Path) -> bool:
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            if chunk.strip():
+                return False
+    return True
+
+
+def _digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def same_content(source: Path, destination: Path) -> bool:
+    """True when ``destination`` is a regular file with the same bytes as ``source``."""
+    try:
+        if not destination.is_file() or destination.stat().st_size != source.stat().st_size:
+            return False
+    except OSError:
+        return False
+    return _digest(source) == _digest(destination)
+
+
+def copy_bytes(source: Path, destination: Path) -> None:
+    """Copy ``source`` to ``destination`` without decoding, replacing it atomically."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=destination.parent, prefix=f".{destination.name}.")
+    os.close(fd)
+    try:
+        shutil.copyfile(source, temp_name)
+        shutil.copymode(source, temp_name)
+        os.replace(temp_name, destination)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_name)
+        raise
+
+
+def plan_overlay(source_root: Path, manifest: Iterable[Mapping[str, Any]] = REPO_INIT_OVERLAY) -> List[Dict[str, Any]]:
+    """Expand ``manifest`` against ``source_root`` into ordered, de-duplicated copy jobs."""
+    jobs: List[Dict[str, Any]] = []
+    seen = set()
+    for entry in manifest:
+        for source in sorted(source_root.glob(entry["pattern"])):
+            relative = source.relative_to(source_root).as_posix()
+            if relative in seen or not source.is_file():
+                continue
+            if entry.get("skip_blank") and _is_blank(source):
+                continue
+            seen.add(relative)
+            jobs.append({"path": relative, "source": source, "existing": entry.get("existing", "replace")})
+    return jobs
+
+
+def _apply(job: Mapping[str, Any], destination_root: Path) -> OverlayResult:
+    destination = destination_root / job["path"]
+    exists = destination.exists()
+    if exists and job["existing"] == "keep":
+        status = "kept"
+    elif exists and same_content(job["source"], destination):
+        status = "unchanged"
+    else:
+        copy_bytes(job["source"], destination)
+        status = "updated" if exists else "created"
+    return {"path": job["path"], "status": status}
+
+
+def apply_overlay(
+    source_root: Path,
+    destination_root: Path,
+    manifest: Iterable[Mapping[str, Any]] = REPO_INIT_OVERLAY,
+    *,
+    max_workers: Optional[int] = None,
+) -> List[OverlayResult]:
+    """Copy the files ``manifest`` selects from ``source_root`` into ``destination_root``."""
+    jobs = plan_overlay(Path(source_root), manifest)
+    if not jobs:
+        return []
+    workers = max(1, min(max_workers or _MAX_WORKERS, len(jobs)))
+    destination_root = Path(destination_root)
+    if workers == 1:
+        return [_apply(job, destination_root) for job in jobs]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda job: _apply(job, destination_root), jobs))
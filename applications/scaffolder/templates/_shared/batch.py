@@ -0,0 +1,228 @@
+"""Batch project generation from a spec file.
+
+A spec lists ``{template, context, output_dir}`` entries as JSON Lines, or as
+YAML/JSON holding a list (or a mapping with a ``projects`` list). Every entry
+is resolved against its template's ``cookiecutter.json`` and checked with the
+:mod:`validation` rules before anything is rendered, so a bad row in a large
+spec fails in seconds rather than half-way through. Valid entries are then
+generated concurrently through :func:`render.render_project`, sharing the
+template render cache, and a per-project report is returned.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from . import cache as cache_utils
+from . import engine, render, sources, validation
+
+REPORT_VERSION = 1
+
+
+def load_spec(path: Path) -> List[Dict[str, Any]]:
+    """Read batch entries from a ``.jsonl``, ``.json`` or ``.yaml``/``.yml`` spec."""
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".jsonl":
+        entries = []
+        for number, line in enumerate(text.splitlines(), start=1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{number}: invalid JSON ({exc.msg})") from exc
+        return entries
+
+    if path.suffix in {".yaml", ".yml"}:
+        try:
+            import yaml  # type: ignore  # pylint: disable=import-outside-toplevel
+        except ImportError as exc:  # pragma: no cover - PyYAML ships with the dev requirements
+            raise ValueError("YAML specs require PyYAML; use JSON Lines instead") from exc
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+
+    if isinstance(data, Mapping):
+        data = data.get("projects")
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: expected a list of projects (or a mapping with a 'projects' list)")
+    return data
+
+
+def prepare_entry(entry: Any, output_dir: Path) -> Dict[str, Any]:
+    """
+    Resolve one spec entry and collect every problem with it.
+
+    The returned job carries ``errors`` (empty when the entry may be rendered)
+    and, once resolved, the ``template_root`` and target ``project_dir``.
+    """
+    job: Dict[str, Any] = {"template": None, "context": {}, "project_dir": None, "errors": []}
+    if not isinstance(entry, Mapping):
+        job["errors"].append("entry must be a mapping with 'template' and 'context'")
+        return job
+
+    template_name = entry.get("template")
+    context = entry.get("context") or {}
+    job["template"] = template_name
+    job["context"] = context
+    if not template_name:
+        job["errors"].append("missing 'template'")
+        return job
+    if not isinstance(context, Mapping):
+        job["errors"].append("'context' must be a mapping")
+        return job
+    template_root = sources.template_root(str(template_name))
+    if template_root is None:
+        job["errors"].append(f"unknown template '{template_name}'")
+        return job
+
+    target_dir = Path(entry.get("output_dir") or output_dir)
+    if not target_dir.is_absolute():
+        target_dir = output_dir / target_dir
+    try:
+        resolved = engine.build_context(template_root, context, target_dir)
+    except Exception as exc:  # noqa: BLE001 - cookiecutter reports bad choices/overrides in many ways
+        job["errors"].append(f"cannot resolve context: {exc}")
+        return job
+
+    variables = resolved["cookiecutter"]
+    unknown = sorted(key for key in context if key not in variables)
+    if unknown:
+        job["errors"].append(f"unknown variables for '{template_name}': {', '.join(unknown)}")
+    job["errors"].extend(issue["message"] for issue in validation.validate_context(str(template_name), variables))
+
+    env = engine.environment_for(template_root, resolved)
+    project_name = engine.render_path(env, engine.project_template_dir(template_root, env).name, resolved)
+    job["template_root"] = str(template_root)
+    job["project_dir"] = str(target_dir.resolve() / project_name)
+    if Path(job["project_dir"]).exists():
+        job["errors"].append(f"{job['project_dir']} already exists")
+    return job
+
+
+def prepare_batch(entries: List[Any], output_dir: Path) -> List[Dict[str, Any]]:
+    """Prepare every entry up front, flagging entries that would write the same project."""
+    jobs = [prepare_entry(entry, output_dir) for entry in entries]
+    claimed: Dict[str, int] = {}
+    for index, job in enumerate(jobs, start=1):
+        job["index"] = index
+        target = job["project_dir"]
+        if target is None:
+            continue
+        if target in claimed:
+            job["errors"].append(f"project dir {target} is also generated by entry {claimed[target]}")
+        else:
+            claimed[target] = index
+    return jobs
+
+
+def _generate(job: Mapping[str, Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    cache_dir = cache_utils.get_template_cache_dir(job["template"], dict(job["context"]))
+    result: Dict[str, Any] = {
+        "index": job["index"],
+        "template": job["template"],
+        "project_dir": job["project_dir"],
+        "cached": (cache_dir / cache_utils.SENTINEL).exists(),
+    }
+    try:
+        render.render_project(
+            job["template"],
+            Path(job["template_root"]),
+            job["context"],
+            Path(job["project_dir"]).parent,
+        )
+    except Exception as exc:  # noqa: BLE001 - one failed project must not sink the batch
+        result.update(status="failed", error=f"{type(exc).__name__}: {exc}")
+    else:
+        result["status"] = "generated"
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def _init_worker(paths: List[str]) -> None:
+    render._extend_sys_path(paths)  # pylint: disable=protected-access
+    # Dozens of concurrent hooks printing "next steps" banners only bury the report.
+    os.environ.setdefault("AGENTIC_CANON_SKIP_MESSAGES", "1")
+
+
+def run_batch(
+    entries: List[Any],
+    *,
+    output_dir: Path,
+    jobs: Optional[int] = None,
+    keep_going: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Validate ``entries`` and generate the projects concurrently.
+
+    ``jobs`` follows :func:`render.resolve_jobs` (``0`` means one per CPU,
+    default one per CPU as well). When any entry is invalid nothing is
+    rendered unless ``keep_going`` is set, in which case the valid entries
+    still are. ``on_result`` is called as each project finishes. The report
+    lists one result per entry, in spec order, with ``status`` ``invalid``,
+    ``skipped``, ``generated`` or ``failed``.
+    """
+    output_dir = Path(output_dir).resolve()
+    prepared = prepare_batch(entries, output_dir)
+    invalid = [job for job in prepared if job["errors"]]
+    results: Dict[int, Dict[str, Any]] = {}
+    for job in invalid:
+        results[job["index"]] = {
+            "index": job["index"],
+            "template": job["template"],
+            "project_dir": job["project_dir"],
+            "status": "invalid",
+            "errors": job["errors"],
+        }
+
+    runnable = [job for job in prepared if not job["errors"]]
+    if invalid and not keep_going:
+        for job in runnable:
+            results[job["index"]] = {
+                "index": job["index"],
+                "template": job["template"],
+                "project_dir": job["project_dir"],
+                "status": "skipped",
+            }
+        runnable = []
+
+    def _record(result: Dict[str, Any]) -> None:
+        results[result["index"]] = result
+        if on_result is not None:
+            on_result(result)
+
+    started = time.perf_counter()
+    workers = min(render.resolve_jobs(0 if jobs is None else jobs), len(runnable))
+    if workers <= 1:
+        for job in runnable:
+            _record(_generate(job))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(list(sys.path),),
+        ) as pool:
+            futures = [pool.submit(_generate, job) for job in runnable]
+            for future in as_completed(futures):
+                _record(future.result())
+
+    ordered = [results[index] for index in sorted(results)]
+    counts = {status: 0 for status in ("generated", "failed", "invalid", "skipped")}
+    for result in ordered:
+        counts[result["status"]] += 1
+    return {
+        "version": REPORT_VERSION,
+        "output_dir": str(output_dir),
+        "total": len(ordered),
+        **counts,
+        "seconds": round(time.perf_counter() - started, 3),
+        "results": ordered,
+    }
@@ -1,4 +1,11 @@
-"""Caching helpers for template rendering and installer artifacts."""
+"""Caching helpers for template rendering and installer artifacts.
+
+Cache entries are small directories holding a tree manifest; file contents live
+once in the shared content-addressed object store (see :mod:`store`). Template
+render entries are keyed on the Merkle digest of the template sources (see
+:mod:`sources`) and remember those sources so a later render can be patched
+incrementally.
+"""
 
 from __future__ import annotations
 
@@ -7,8 +14,11 @@ import hashlib
 import json
 import os
 import shutil
+import tempfile
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from . import sources, store
 
 try:  # pragma: no cover
     import fcntl
@@ -35,12 +45,22 @@ PIP_CACHE_DIR = Path(
 GO_CACHE_DIR = Path(
     os.environ.get("AGENTIC_CANON_GO_CACHE_DIR", INSTALLER_CACHE_ROOT / "go")
 ).expanduser()
+WHEELHOUSE_DIR = Path(
+    os.environ.get("AGENTIC_CANON_WHEELHOUSE_DIR", INSTALLER_CACHE_ROOT / "wheelhouse")
+).expanduser()
+"""Wheels built for cached virtualenvs; lets a cache miss install without rebuilding sdists."""
+OBJECT_STORE_DIR = Path(
+    os.environ.get("AGENTIC_CANON_OBJECT_STORE_DIR", CACHE_ROOT / "objects")
+).expanduser()
 
-for directory in (TEMPLATE_CACHE_DIR, NODE_CACHE_DIR, PIP_CACHE_DIR, GO_CACHE_DIR):
+for directory in (TEMPLATE_CACHE_DIR, NODE_CACHE_DIR, PIP_CACHE_DIR, GO_CACHE_DIR, OBJECT_STORE_DIR):
     directory.mkdir(parents=True, exist_ok=True)
 
 
 SENTINEL = ".installed"
+SOURCES_MANIFEST = ".sources.json"
+CACHE_STRATEGY_ENV = "AGENTIC_CANON_CACHE_STRATEGY"
+DEFAULT_STRATEGY = "auto"
 
 
 def _sentinel_path(cache_dir: Path) -> Path:
@@ -59,20 +79,62 @@ def _normalise_payload(data: Mapping[str, Any]) -> str:
     return json.dumps(data, sort_keys=True, separators=(",", ":"))
 
 
-def _manifest_digest(template_name: str) -> Optional[str]:
+def _template_config(template_name: str) -> Optional[Mapping[str, Any]]:
     try:
         from .manifest import get_template_config  # pylint: disable=import-outside-toplevel
     except Exception:  # pragma: no cover - manifest unavailable during bootstrap
         return None
     try:
-        config = get_template_config(template_name)
+        return get_template_config(template_name)
     except KeyError:
         return None
+
+
+def _manifest_digest(template_name: str) -> Optional[str]:
+    config = _template_config(template_name)
+    if config is None:
+        return None
     return hashlib.sha256(_normalise_payload(config).encode("utf-8")).hexdigest()
 
 
+def resolve_strategy(template_name: Optional[str] = None) -> str:
+    """
+    Return how cache hits are materialised (see :data:`store.STRATEGIES`).
+
+    ``AGENTIC_CANON_CACHE_STRATEGY`` wins, then the template's manifest
+    ``cache.render.strategy`` field, then ``auto``.
+    """
+    override = os.environ.get(CACHE_STRATEGY_ENV, "").strip().lower()
+    if override:
+        if override not in store.STRATEGIES:
+            raise ValueError(
+                f"{CACHE_STRATEGY_ENV}={override!r} is not one of {', '.join(store.STRATEGIES)}"
+            )
+        return override
+
+    config = _template_config(template_name) if template_name else None
+    cache_cfg = config.get("cache") if config else None
+    render_cfg = cache_cfg.get("render") if isinstance(cache_cfg, Mapping) else None
+    if isinstance(render_cfg, Mapping):
+        value = str(render_cfg.get("strategy") or "").strip().lower()
+        if value in store.STRATEGIES:
+            return value
+    return DEFAULT_STRATEGY
+
+
+def editable_strategy(strategy: str) -> str:
+    """
+    Downgrade ``strategy`` for trees that tools will edit in place.
+
+    A hardlink shares the store object's inode, so a formatter rewriting a
+    linked file would corrupt the store. ``auto`` and ``hardlink`` therefore
+    become ``reflink``, which falls back to a byte copy.
+    """
+    return "reflink" if strategy in ("auto", "hardlink") else strategy
+
+
 @contextlib.contextmanager
-def file_lock(lock_path: Path):
+def file_lock(lock_path: Path, *, shared: bool = False):
     if fcntl is None:
         yield
         return
@@ -80,31 +142,170 @@ def file_lock(lock_path: Path):
     lock_path.parent.mkdir(parents=True, exist_ok=True)
     fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
     try:
-        fcntl.flock(fd, fcntl.LOCK_EX)
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
         yield
     finally:
         fcntl.flock(fd, fcntl.LOCK_UN)
         os.close(fd)
 
 
-def context_hash(template_name: str, extra_context: Dict[str, Any], manifest_hash: Optional[str] = None) -> str:
-    payload = {
+@contextlib.contextmanager
+def try_file_lock(lock_path: Path):
+    """Take an exclusive lock without blocking; yields ``False`` when it is held elsewhere."""
+    if fcntl is None:
+        yield True
+        return
+
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def entry_lock_path(cache_dir: Path) -> Path:
+    """Lock file guarding a cache entry; lock files are kept so waiters never race a new inode."""
+    return cache_dir.with_suffix(".lock")
+
+
+def store_lock_path() -> Path:
+    """Lock shared by publishers and taken exclusively while unreferenced objects are swept."""
+    return OBJECT_STORE_DIR / ".lock"
+
+
+def touch_entry(cache_dir: Path) -> None:
+    """Record a cache hit; the sentinel's mtime is the entry's last-used time."""
+    with contextlib.suppress(FileNotFoundError):
+        os.utime(_sentinel_path(cache_dir))
+
+
+def context_hash(
+    template_name: str,
+    extra_context: Dict[str, Any],
+    manifest_hash: Optional[str] = None,
+    source_hash: Optional[str] = None,
+) -> str:
+    payload: Dict[str, Any] = {
         "template": template_name,
         "context": extra_context,
         "manifest": manifest_hash,
     }
+    if source_hash is not None:
+        payload["sources"] = source_hash
     return hashlib.sha256(_normalise_payload(payload).encode("utf-8")).hexdigest()
 
 
 def get_template_cache_dir(template_name: str, extra_context: Dict[str, Any]) -> Path:
-    digest = context_hash(template_name, extra_context, _manifest_digest(template_name))
+    digest = context_hash(
+        template_name,
+        extra_context,
+        _manifest_digest(template_name),
+        sources.template_source_digest(template_name),
+    )
     return TEMPLATE_CACHE_DIR / template_name / digest
 
 
-def copy_from_cache(cache_dir: Path, destination: Path) -> None:
-    if destination.exists():
-        shutil.rmtree(destination)
+def _lineage_pointer(template_name: str, extra_context: Dict[str, Any]) -> Path:
+    # Same template, context and manifest config; only the template sources may differ.
+    lineage = context_hash(template_name, extra_context, _manifest_digest(template_name))
+    return TEMPLATE_CACHE_DIR / template_name / f"{lineage}.latest"
+
+
+def previous_template_entry(template_name: str, extra_context: Dict[str, Any]) -> Optional[Path]:
+    """Return the newest ready render of this context built from older template sources."""
+    pointer = _lineage_pointer(template_name, extra_context)
+    try:
+        name = pointer.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return None
+    candidate = pointer.parent / name
+    if not name or candidate == get_template_cache_dir(template_name, extra_context):
+        return None
+    return candidate if _is_ready(candidate) else None
+
+
+def _record_lineage(template_name: str, extra_context: Dict[str, Any], cache_dir: Path) -> None:
+    pointer = _lineage_pointer(template_name, extra_context)
+    temp_pointer = pointer.with_suffix(".latest.tmp")
+    temp_pointer.write_text(cache_dir.name, encoding="utf-8")
+    os.replace(temp_pointer, pointer)
+
+
+def read_sources(cache_dir: Path) -> Optional[Dict[str, Any]]:
+    """Return the template source listing recorded with a render entry, if any."""
+    try:
+        payload = json.loads((cache_dir / SOURCES_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != store.TREE_VERSION:
+        return None
+    return payload
+
+
+def entry_digests(cache_dir: Path) -> Optional[List[str]]:
+    """Return every object digest an entry references, or ``None`` for legacy full-copy entries."""
+    manifest = store.read_tree(cache_dir)
+    if manifest is None:
+        return None
+    digests = store.tree_digests(manifest)
+    recorded_sources = read_sources(cache_dir)
+    if recorded_sources is not None:
+        digests.extend(store.tree_digests(recorded_sources))
+    return digests
+
+
+def _snapshot_sources(template_root: Path) -> Dict[str, Any]:
+    entries = sources.source_entries(template_root)
+    for entry in entries:
+        if entry["type"] == "file":
+            store.put_file(OBJECT_STORE_DIR, template_root / entry["path"])
+    return {"version": store.TREE_VERSION, "shared": sources.shared_digest(), "entries": entries}
+
+
+def _publish_entry(source: Path, cache_dir: Path, *, template_root: Optional[Path] = None) -> None:
+    """
+    Ingest ``source`` into the object store and publish ``cache_dir`` as its tree manifest.
+
+    When ``template_root`` is given its sources are stored alongside, so the
+    entry can seed an incremental re-render once the template changes.
+    """
+    with file_lock(store_lock_path(), shared=True):
+        manifest = store.snapshot_tree(OBJECT_STORE_DIR, source, ignore={SENTINEL})
+        temp_dir = cache_dir.with_suffix(".tmp")
+        if temp_dir.exists():
+            shutil.rmtree(temp_dir)
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        store.write_tree(temp_dir, manifest)
+        if template_root is not None:
+            (temp_dir / SOURCES_MANIFEST).write_text(
+                _normalise_payload(_snapshot_sources(template_root)),
+                encoding="utf-8",
+            )
+        _mark_ready(temp_dir)
+        os.replace(temp_dir, cache_dir)
+
+
+def _restore_entry(cache_dir: Path, destination: Path, strategy: Optional[str]) -> None:
+    manifest = store.read_tree(cache_dir)
+    if manifest is not None:
+        store.materialise_tree(
+            OBJECT_STORE_DIR,
+            manifest,
+            destination,
+            strategy=strategy or resolve_strategy(),
+        )
+        return
 
+    # Entries written before the object store existed hold a full copy of the tree.
     def _ignore(_src: str, names: Iterable[str]):
         ignored = {SENTINEL}
         return {name for name in names if name in ignored}
@@ -112,6 +313,74 @@ def copy_from_cache(cache_dir: Path, destination: Path) -> None:
     shutil.copytree(cache_dir, destination, dirs_exist_ok=True, ignore=_ignore)
 
 
+def _discard(*paths: Path) -> None:
+    for path in paths:
+        if path.exists():
+            shutil.rmtree(path)
+
+
+EXISTING_MODES = ("error", "replace", "merge")
+"""How :func:`copy_from_cache` treats a non-empty destination."""
+
+
+def copy_from_cache(
+    cache_dir: Path,
+    destination: Path,
+    *,
+    strategy: Optional[str] = None,
+    existing: str = "error",
+) -> None:
+    """
+    Materialise a cache entry at ``destination`` using ``strategy`` (default: :func:`resolve_strategy`).
+
+    A non-empty ``destination`` raises :class:`FileExistsError` unless
+    ``existing`` is ``"replace"`` (delete it first; only for directories the
+    caller owns, such as render scratch dirs) or ``"merge"`` (write the entry
+    over it, keeping files the entry does not contain, like cookiecutter's
+    ``overwrite_if_exists``).
+
+    The entry is read under a shared lock so garbage collection cannot evict it
+    mid-copy; :class:`FileNotFoundError` is raised if it was evicted before the
+    lock was taken. If a stored object turns out to have been modified in place,
+    the entry is invalidated and :class:`store.StoreIntegrityError` propagates so
+    the caller can re-render it.
+    """
+    if existing not in EXISTING_MODES:
+        raise ValueError(f"existing={existing!r} is not one of {', '.join(EXISTING_MODES)}")
+    occupied = any(destination.iterdir()) if destination.is_dir() else destination.exists()
+    if occupied and existing == "error":
+        raise FileExistsError(f"{destination} already exists")
+    if occupied and existing == "replace":
+        shutil.rmtree(destination)
+    target = destination
+    if occupied and existing == "merge":
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        target = Path(tempfile.mkdtemp(prefix=f".{destination.name}.", dir=destination.parent))
+    created = not target.exists()
+
+    integrity_error: Optional[store.StoreIntegrityError] = None
+    try:
+        with file_lock(entry_lock_path(cache_dir), shared=True):
+            if not _is_ready(cache_dir):
+                raise FileNotFoundError(f"Cache entry {cache_dir} is missing or was evicted")
+            try:
+                _restore_entry(cache_dir, target, strategy)
+            except store.StoreIntegrityError as exc:
+                integrity_error = exc
+            else:
+                touch_entry(cache_dir)
+        if integrity_error is None and target != destination:
+            shutil.copytree(target, destination, symlinks=True, dirs_exist_ok=True)
+    finally:
+        if target != destination:
+            shutil.rmtree(target, ignore_errors=True)
+    if integrity_error is not None:
+        # Invalidate under the exclusive lock so concurrent readers never see a half-removed entry.
+        with file_lock(entry_lock_path(cache_dir)):
+            _discard(cache_dir, *([target] if created and target == destination else []))
+        raise integrity_error
+
+
 def _prepare_cache_dir(cache_dir: Path, force: bool) -> None:
     if force and cache_dir.exists():
         shutil.rmtree(cache_dir)
@@ -129,22 +398,26 @@ def prime_template_cache(
     cache_dir = get_template_cache_dir(template_name, extra_context)
     _prepare_cache_dir(cache_dir, force)
     if cache_dir.exists():
+        touch_entry(cache_dir)
         return cache_dir
 
     cache_dir.parent.mkdir(parents=True, exist_ok=True)
-    lock_file = cache_dir.with_suffix(".lock")
+    lock_file = entry_lock_path(cache_dir)
     with file_lock(lock_file):
         _prepare_cache_dir(cache_dir, force)
         if cache_dir.exists():
             return cache_dir
 
-        temp_dir = cache_dir.with_suffix(".tmp")
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        producer(temp_dir)
-        _mark_ready(temp_dir)
-        os.replace(temp_dir, cache_dir)
+        render_dir = cache_dir.with_suffix(".render")
+        if render_dir.exists():
+            shutil.rmtree(render_dir)
+        render_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            producer(render_dir)
+            _publish_entry(render_dir, cache_dir, template_root=sources.template_root(template_name))
+        finally:
+            shutil.rmtree(render_dir, ignore_errors=True)
+        _record_lineage(template_name, extra_context, cache_dir)
     return cache_dir
 
 
@@ -152,40 +425,56 @@ def _installer_cache_dir(namespace: Path, digest: str) -> Path:
     return namespace / digest
 
 
-def cache_node_modules(
+def _cache_installer_output(
+    namespace: Path,
     project_path: Path,
+    output_dir: Path,
     key_material: Iterable[bytes],
     installer: Callable[[Path], None],
-    *,
-    force: bool = False,
+    force: bool,
+    strategy: Optional[str],
 ) -> None:
     digest = hashlib.sha256(b"".join(key_material)).hexdigest()
-    cache_dir = _installer_cache_dir(NODE_CACHE_DIR, digest)
-    lock_file = cache_dir.with_suffix(".lock")
-    node_modules = project_path / "node_modules"
+    cache_dir = _installer_cache_dir(namespace, digest)
+    lock_file = entry_lock_path(cache_dir)
 
     with file_lock(lock_file):
         _prepare_cache_dir(cache_dir, force)
         if cache_dir.exists():
-            if node_modules.exists():
-                shutil.rmtree(node_modules)
-
-            def _ignore(_src: str, names: Iterable[str]):
-                return {name for name in names if name == SENTINEL}
-
-            shutil.copytree(cache_dir, node_modules, dirs_exist_ok=True, ignore=_ignore)
-            return
+            if output_dir.exists():
+                shutil.rmtree(output_dir)
+            try:
+                _restore_entry(cache_dir, output_dir, strategy)
+                touch_entry(cache_dir)
+                return
+            except store.StoreIntegrityError:
+                # Fall through and reinstall; the tampered object has been quarantined.
+                _discard(cache_dir, output_dir)
 
         installer(project_path)
-        if not node_modules.exists():
+        if not output_dir.exists():
             return
 
-        temp_dir = cache_dir.with_suffix(".tmp")
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-        shutil.copytree(node_modules, temp_dir, dirs_exist_ok=True)
-        _mark_ready(temp_dir)
-        os.replace(temp_dir, cache_dir)
+        _publish_entry(output_dir, cache_dir)
+
+
+def cache_node_modules(
+    project_path: Path,
+    key_material: Iterable[bytes],
+    installer: Callable[[Path], None],
+    *,
+    force: bool = False,
+    strategy: Optional[str] = None,
+) -> None:
+    _cache_installer_output(
+        NODE_CACHE_DIR,
+        project_path,
+        project_path / "node_modules",
+        key_material,
+        installer,
+        force,
+        strategy,
+    )
 
 
 def cache_pip_install(
@@ -194,6 +483,7 @@ def cache_pip_install(
     installer: Callable[[Path], None],
     *,
     force: bool = False,
+    strategy: Optional[str] = None,
 ) -> None:
     """
     Cache Python virtual environment style installers (pip, uv, etc.).
@@ -201,34 +491,15 @@ def cache_pip_install(
     The ``installer`` is expected to create a ``.venv`` directory relative to
     ``project_path``.
     """
-    digest = hashlib.sha256(b"".join(key_material)).hexdigest()
-    cache_dir = _installer_cache_dir(PIP_CACHE_DIR, digest)
-    lock_file = cache_dir.with_suffix(".lock")
-    venv_dir = project_path / ".venv"
-
-    with file_lock(lock_file):
-        _prepare_cache_dir(cache_dir, force)
-        if cache_dir.exists():
-            if venv_dir.exists():
-                shutil.rmtree(venv_dir)
-            shutil.copytree(
-                cache_dir,
-                venv_dir,
-                dirs_exist_ok=True,
-                ignore=lambda _src, names: {name for name in names if name == SENTINEL},
-            )
-            return
-
-        installer(project_path)
-        if not venv_dir.exists():
-            return
-
-        temp_dir = cache_dir.with_suffix(".tmp")
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-        shutil.copytree(venv_dir, temp_dir, dirs_exist_ok=True)
-        _mark_ready(temp_dir)
-        os.replace(temp_dir, cache_dir)
+    _cache_installer_output(
+        PIP_CACHE_DIR,
+        project_path,
+        project_path / ".venv",
+        key_material,
+        installer,
+        force,
+        strategy,
+    )
 
 
 def cache_go_modules(
@@ -237,33 +508,15 @@ def cache_go_modules(
     installer: Callable[[Path], None],
     *,
     force: bool = False,
+    strategy: Optional[str] = None,
 ) -> None:
     """Cache Go module downloads (``go mod download``)."""
-    digest = hashlib.sha256(b"".join(key_material)).hexdigest()
-    cache_dir = _installer_cache_dir(GO_CACHE_DIR, digest)
-    lock_file = cache_dir.with_suffix(".lock")
-    module_cache = project_path / "pkg" / "mod"
-
-    with file_lock(lock_file):
-        _prepare_cache_dir(cache_dir, force)
-        if cache_dir.exists():
-            if module_cache.exists():
-                shutil.rmtree(module_cache)
-            shutil.copytree(
-                cache_dir,
-                module_cache,
-                dirs_exist_ok=True,
-                ignore=lambda _src, names: {name for name in names if name == SENTINEL},
-            )
-            return
-
-        installer(project_path)
-        if not module_cache.exists():
-            return
-
-        temp_dir = cache_dir.with_suffix(".tmp")
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-        shutil.copytree(module_cache, temp_dir, dirs_exist_ok=True)
-        _mark_ready(temp_dir)
-        os.replace(temp_dir, cache_dir)
+    _cache_installer_output(
+        GO_CACHE_DIR,
+        project_path,
+        project_path / "pkg" / "mod",
+        key_material,
+        installer,
+        force,
+        strategy,
+    )
@@ -0,0 +1,224 @@
+"""In-process cookiecutter rendering backend with compiled template reuse.
+
+``cookiecutter()`` builds a fresh Jinja environment (and loader) for every
+project, so each render re-parses every template file. This backend keeps one
+environment per template tree for the life of the process: file templates are
+compiled once and served from Jinja's in-memory cache, path-name templates are
+memoised, and compiled bytecode is persisted under ``CACHE_ROOT/jinja`` so new
+processes (pool workers, the next test session) skip parsing as well. Hooks,
+copy-only paths, binary files, newline handling and file modes follow
+``cookiecutter.generate.generate_files``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from . import cache as cache_utils
+
+BYTECODE_CACHE_DIR = cache_utils.CACHE_ROOT / "jinja"
+
+_ENVIRONMENTS: Dict[Tuple[str, str], Any] = {}
+_PATH_TEMPLATES: Dict[Tuple[int, str], Any] = {}
+_TEMPLATE_DIRS: Dict[str, Path] = {}
+_NEWLINES: Dict[Tuple[str, int], Optional[str]] = {}
+
+
+def build_context(
+    template_root: Path,
+    extra_context: Mapping[str, Any],
+    output_dir: Path,
+    *,
+    default_context: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build the context ``cookiecutter()`` would pass to ``generate_files`` in no-input mode."""
+    # pylint: disable=import-outside-toplevel
+    from cookiecutter.generate import generate_context  # type: ignore[import]
+    from cookiecutter.prompt import prompt_for_config  # type: ignore[import]
+
+    if default_context is None:
+        from cookiecutter.config import get_user_config  # type: ignore[import]
+
+        default_context = get_user_config()["default_context"]
+
+    context = generate_context(
+        context_file=str(template_root / "cookiecutter.json"),
+        default_context=dict(default_context),
+        extra_context=dict(extra_context),
+    )
+    context["_cookiecutter"] = {
+        key: value for key, value in context["cookiecutter"].items() if not key.startswith("_")
+    }
+    context["cookiecutter"].update(prompt_for_config(context, True))
+    context["cookiecutter"]["_template"] = str(template_root)
+    context["cookiecutter"]["_output_dir"] = os.path.abspath(output_dir)
+    context["cookiecutter"]["_repo_dir"] = str(template_root)
+    context["cookiecutter"]["_checkout"] = None
+    return context
+
+
+def environment_for(template_root: Path, context: Mapping[str, Any]):
+    """
+    Return the shared Jinja environment for ``template_root``.
+
+    Environments are keyed on the template tree plus the context's Jinja
+    options (``_jinja2_env_vars`` and ``_extensions``), which come from
+    ``cookiecutter.json`` and are therefore identical for every context.
+    """
+    # pylint: disable=import-outside-toplevel
+    from cookiecutter.environment import StrictEnvironment  # type: ignore[import]
+    from jinja2 import FileSystemBytecodeCache, FileSystemLoader
+
+    settings = context.get("cookiecutter", {})
+    envvars = settings.get("_jinja2_env_vars", {})
+    key = (
+        str(template_root),
+        json.dumps([envvars, settings.get("_extensions", [])], sort_keys=True, default=str),
+    )
+    env = _ENVIRONMENTS.get(key)
+    if env is not None:
+        return env
+
+    BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    env = StrictEnvironment(
+        context=context,
+        keep_trailing_newline=True,
+        bytecode_cache=FileSystemBytecodeCache(str(BYTECODE_CACHE_DIR)),
+        **envvars,
+    )
+    template_dir = project_template_dir(template_root, env)
+    # Same search path generate_files() uses ('.' and '../templates'), made absolute so the
+    # loader, and therefore Jinja's compiled-template cache, outlives any single render.
+    env.loader = FileSystemLoader([str(template_dir), str(template_dir.parent / "templates")])
+    _ENVIRONMENTS[key] = env
+    return env
+
+
+def project_template_dir(template_root: Path, env: Any) -> Path:
+    """Return the ``{{cookiecutter.project_slug}}``-style directory inside ``template_root``."""
+    cached = _TEMPLATE_DIRS.get(str(template_root))
+    if cached is None:
+        from cookiecutter.generate import find_template  # type: ignore[import]  # pylint: disable=import-outside-toplevel
+
+        cached = Path(find_template(template_root, env)).resolve()
+        _TEMPLATE_DIRS[str(template_root)] = cached
+    return cached
+
+
+def render_path(env: Any, source: str, context: Mapping[str, Any]) -> str:
+    """Render a templated file or directory name, compiling each distinct name once."""
+    key = (id(env), source)
+    template = _PATH_TEMPLATES.get(key)
+    if template is None:
+        template = env.from_string(source)
+        _PATH_TEMPLATES[key] = template
+    return template.render(**context)
+
+
+def _detect_newline(path: Path) -> Optional[str]:
+    info = path.stat()
+    key = (str(path), info.st_mtime_ns)
+    if key not in _NEWLINES:
+        with open(path, encoding="utf-8") as handle:
+            handle.readline()
+        newlines = handle.newlines
+        _NEWLINES[key] = newlines[0] if isinstance(newlines, tuple) else newlines
+    return _NEWLINES[key]
+
+
+def render_file(
+    env: Any,
+    template_dir: Path,
+    infile: str,
+    context: Mapping[str, Any],
+    project_dir: Path,
+) -> Optional[str]:
+    """
+    Render one project source file (``infile`` is relative to ``template_dir``).
+
+    Returns the output path relative to ``project_dir``, or ``None`` when the
+    rendered name is empty (cookiecutter skips such files).
+    """
+    # pylint: disable=import-outside-toplevel
+    from cookiecutter.generate import is_binary, is_copy_only_path  # type: ignore[import]
+
+    relative = os.path.normpath(render_path(env, infile, context))
+    target = project_dir / relative
+    if target.is_dir():
+        return None
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists() or target.is_symlink():
+        target.unlink()
+
+    source = template_dir / infile
+    if is_copy_only_path(infile, context) or is_binary(str(source)):
+        shutil.copyfile(source, target)
+        shutil.copymode(source, target)
+        return Path(relative).as_posix()
+
+    rendered = env.get_template(Path(infile).as_posix()).render(**context)
+    newline = context["cookiecutter"].get("_new_lines") or _detect_newline(source)
+    with open(target, "w", encoding="utf-8", newline=newline) as handle:
+        handle.write(rendered)
+    shutil.copymode(source, target)
+    return Path(relative).as_posix()
+
+
+def generate_project(
+    template_root: Path,
+    context: Dict[str, Any],
+    output_dir: Path,
+    *,
+    accept_hooks: bool = True,
+) -> Path:
+    """
+    Render ``template_root`` with ``context`` into ``output_dir`` and return the project dir.
+
+    Hook failures raise ``cookiecutter.exceptions.FailedHookException`` and the
+    half-generated project is removed, as with ``cookiecutter()``.
+    """
+    # pylint: disable=import-outside-toplevel
+    from cookiecutter.generate import is_copy_only_path  # type: ignore[import]
+    from cookiecutter.hooks import run_hook_from_repo_dir  # type: ignore[import]
+
+    template_root = Path(template_root).resolve()
+    env = environment_for(template_root, context)
+    template_dir = project_template_dir(template_root, env)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    project_dir = (output_dir / render_path(env, template_dir.name, context)).resolve()
+    created = not project_dir.exists()
+    project_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        if accept_hooks:
+            run_hook_from_repo_dir(str(template_root), "pre_gen_project", str(project_dir), context, created)
+
+        for root, dirs, files in os.walk(template_dir):
+            relative_root = os.path.relpath(root, template_dir)
+            render_dirs = []
+            for name in dirs:
+                relative = os.path.normpath(os.path.join(relative_root, name))
+                if is_copy_only_path(relative, context):
+                    target = project_dir / render_path(env, relative, context)
+                    if target.is_dir():
+                        shutil.rmtree(target)
+                    shutil.copytree(Path(root) / name, target)
+                else:
+                    render_dirs.append(name)
+                    (project_dir / render_path(env, relative, context)).mkdir(parents=True, exist_ok=True)
+            dirs[:] = render_dirs
+            for name in files:
+                render_file(env, template_dir, os.path.normpath(os.path.join(relative_root, name)), context, project_dir)
+
+        if accept_hooks:
+            run_hook_from_repo_dir(str(template_root), "post_gen_project", str(project_dir), context, created)
+    except BaseException:
+        if created:
+            shutil.rmtree(project_dir, ignore_errors=True)
+        raise
+    return project_dir
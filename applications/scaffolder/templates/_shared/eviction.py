@@ -0,0 +1,324 @@
+"""Least-recently-used eviction and garbage collection for the shared cache.
+
+Every ready cache entry (template renders and installer outputs) records its
+last use in the mtime of its sentinel, which :mod:`cache` bumps on each hit.
+:func:`collect_garbage` evicts entries older than the age limit, then the
+least recently used entries until the object store fits the size budget, and
+finally sweeps objects no surviving tree manifest references.
+
+The derived caches that live beside the entries (Jinja bytecode, manifest
+snapshots, lint/doctor/front matter/waiver results and the wheelhouse) fall
+under the same policy file by file. Their last use is the later of a file's
+mtime and atime, and they count towards the size budget.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from . import cache as cache_utils
+from . import store
+
+MAX_SIZE_ENV = "AGENTIC_CANON_CACHE_MAX_SIZE"
+MAX_AGE_ENV = "AGENTIC_CANON_CACHE_MAX_AGE_DAYS"
+DEFAULT_MAX_SIZE = 10 * 1024**3
+DEFAULT_MAX_AGE_DAYS = 30
+
+# Leftover staging directories and object temp files younger than this may still be in use.
+_STALE_AFTER_SECONDS = 3600
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+_STAGING_SUFFIXES = (".tmp", ".render")
+
+
+def parse_size(value: str) -> int:
+    """Parse sizes such as ``"512M"``, ``"10G"`` or ``"1048576"`` into bytes."""
+    match = _SIZE_PATTERN.match(value)
+    if not match:
+        raise ValueError(f"Invalid size '{value}' (expected e.g. 500M, 10G)")
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit.lower()])
+
+
+def format_size(size: int) -> str:
+    amount = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if amount < 1024:
+            return f"{amount:.0f} {unit}" if unit == "B" else f"{amount:.1f} {unit}"
+        amount /= 1024
+    return f"{amount:.1f} TiB"
+
+
+def resolve_limits(
+    max_bytes: Optional[int] = None,
+    max_age_days: Optional[float] = None,
+) -> Dict[str, Optional[float]]:
+    """Fill unset limits from the environment, then the defaults; ``0`` disables a limit."""
+    if max_bytes is None:
+        raw_size = os.environ.get(MAX_SIZE_ENV)
+        max_bytes = parse_size(raw_size) if raw_size else DEFAULT_MAX_SIZE
+    if max_age_days is None:
+        raw_age = os.environ.get(MAX_AGE_ENV)
+        max_age_days = float(raw_age) if raw_age else DEFAULT_MAX_AGE_DAYS
+    return {
+        "max_bytes": max_bytes or None,
+        "max_age_days": max_age_days or None,
+    }
+
+
+def auxiliary_caches() -> Dict[str, Path]:
+    """Derived caches under the cache root that can be deleted file by file and rebuilt."""
+    root = cache_utils.CACHE_ROOT
+    return {
+        "jinja": root / "jinja",  # engine.BYTECODE_CACHE_DIR
+        "manifest": root / "manifest",  # manifest.SNAPSHOT_DIR
+        "lint": root / "lint",  # noxfile lint_templates clean-render index
+        "doctor": root / "doctor.json",  # agentic-canon doctor results
+        "frontmatter": root / "frontmatter",  # tools/validate_frontmatter.py
+        "waivers": root / "waivers",  # tools/check_waivers.py
+        "wheelhouse": cache_utils.WHEELHOUSE_DIR,
+    }
+
+
+def _entry_roots() -> List[Path]:
+    return [
+        cache_utils.TEMPLATE_CACHE_DIR,
+        cache_utils.NODE_CACHE_DIR,
+        cache_utils.PIP_CACHE_DIR,
+        cache_utils.GO_CACHE_DIR,
+    ]
+
+
+def _iter_candidate_dirs() -> Iterator[Path]:
+    """Yield entry directories: ``<namespace>/<digest>`` or ``templates/<name>/<digest>``."""
+    for root in _entry_roots():
+        if not root.is_dir():
+            continue
+        groups = [path for path in root.iterdir() if path.is_dir()] if root == cache_utils.TEMPLATE_CACHE_DIR else [root]
+        for group in groups:
+            for path in group.iterdir():
+                if path.is_dir() and not path.is_symlink():
+                    yield path
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for directory, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(directory, name)).st_size
+            except FileNotFoundError:
+                continue
+    return total
+
+
+def _object_size(digest: str) -> int:
+    base = store.object_path(cache_utils.OBJECT_STORE_DIR, digest)
+    total = 0
+    for candidate in (base, base.with_name(base.name + ".x")):
+        try:
+            total += candidate.stat().st_size
+        except FileNotFoundError:
+            continue
+    return total
+
+
+def _scan_entries() -> List[Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = []
+    for path in _iter_candidate_dirs():
+        if path.suffix in _STAGING_SUFFIXES:
+            continue
+        sentinel = path / cache_utils.SENTINEL
+        try:
+            last_used = sentinel.stat().st_mtime
+        except FileNotFoundError:
+            continue
+        digests = cache_utils.entry_digests(path)
+        entries.append(
+            {
+                "path": path,
+                "last_used": last_used,
+                "digests": set(digests or ()),
+                # Legacy full-copy entries own their bytes outright.
+                "own_bytes": 0 if digests is not None else _tree_size(path),
+            }
+        )
+    entries.extend(_scan_auxiliary())
+    entries.sort(key=lambda entry: entry["last_used"])
+    return entries
+
+
+def _scan_auxiliary() -> Iterator[Dict[str, Any]]:
+    for name, root in auxiliary_caches().items():
+        if root.is_file():
+            files = [root]
+        elif root.is_dir():
+            files = [Path(directory, file) for directory, _dirs, names in os.walk(root) for file in names]
+        else:
+            continue
+        for path in files:
+            try:
+                stat = os.lstat(path)
+            except FileNotFoundError:
+                continue
+            yield {
+                "path": path,
+                "last_used": max(stat.st_mtime, stat.st_atime),
+                "digests": set(),
+                "own_bytes": stat.st_size,
+                "cache": name,
+            }
+
+
+def _evict(path: Path, dry_run: bool) -> bool:
+    """Remove ``path`` unless another process holds its entry lock."""
+    if not path.is_dir():
+        # Auxiliary cache files are rewritten atomically and have no entry lock.
+        if not dry_run:
+            path.unlink(missing_ok=True)
+        return True
+    with cache_utils.try_file_lock(cache_utils.entry_lock_path(path)) as acquired:
+        if not acquired:
+            return False
+        if not dry_run:
+            shutil.rmtree(path, ignore_errors=True)
+    return True
+
+
+def _remove_stale_staging(now: float, dry_run: bool) -> List[str]:
+    removed: List[str] = []
+    for path in _iter_candidate_dirs():
+        if path.suffix not in _STAGING_SUFFIXES:
+            continue
+        try:
+            if now - path.stat().st_mtime < _STALE_AFTER_SECONDS:
+                continue
+        except FileNotFoundError:
+            continue
+        entry = path.with_suffix("")
+        with cache_utils.try_file_lock(cache_utils.entry_lock_path(entry)) as acquired:
+            if not acquired:
+                continue
+            if not dry_run:
+                shutil.rmtree(path, ignore_errors=True)
+        removed.append(str(path))
+    return removed
+
+
+def _live_digests() -> Set[str]:
+    live: Set[str] = set()
+    for path in _iter_candidate_dirs():
+        live.update(cache_utils.entry_digests(path) or ())
+    return live
+
+
+def _sweep_objects(now: float) -> int:
+    """Delete objects no manifest references; runs under the exclusive store lock."""
+    removed = 0
+    root = cache_utils.OBJECT_STORE_DIR
+    if not root.is_dir():
+        return 0
+
+    with cache_utils.file_lock(cache_utils.store_lock_path()):
+        # Manifests are re-read inside the lock: publishers hold it shared while ingesting.
+        live = _live_digests()
+        for shard in root.iterdir():
+            if not shard.is_dir():
+                continue
+            for path in shard.iterdir():
+                name = path.name
+                if name.startswith(".tmp-"):
+                    try:
+                        if now - path.stat().st_mtime < _STALE_AFTER_SECONDS:
+                            continue
+                    except FileNotFoundError:
+                        continue
+                elif name.removesuffix(".x") in live:
+                    continue
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    continue
+                removed += 1
+    return removed
+
+
+def collect_garbage(
+    *,
+    max_bytes: Optional[int] = None,
+    max_age_days: Optional[float] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Evict stale and least recently used cache entries, then sweep orphaned objects.
+
+    Limits default to :data:`MAX_SIZE_ENV` / :data:`MAX_AGE_ENV` and then to
+    10 GiB / 30 days; pass ``0`` to disable either. Entries whose lock is held
+    (being rendered, installed or copied) are reported as busy and kept. Files
+    in the :func:`auxiliary_caches` are evicted under the same limits and
+    summarised per cache in ``auxiliary``. With ``dry_run`` nothing is deleted
+    but the report describes what would be.
+    """
+    limits = resolve_limits(max_bytes, max_age_days)
+    now = time.time()
+    entries = _scan_entries()
+
+    refcounts: Dict[str, int] = {}
+    for entry in entries:
+        for digest in entry["digests"]:
+            refcounts[digest] = refcounts.get(digest, 0) + 1
+    sizes = {digest: _object_size(digest) for digest in refcounts}
+    total = sum(sizes.values()) + sum(entry["own_bytes"] for entry in entries)
+    bytes_before = total
+
+    evicted: List[str] = []
+    busy: List[str] = []
+    auxiliary = {name: {"files": 0, "bytes": 0, "evicted": 0} for name in auxiliary_caches()}
+    for entry in entries:
+        if "cache" in entry:
+            auxiliary[entry["cache"]]["files"] += 1
+            auxiliary[entry["cache"]]["bytes"] += entry["own_bytes"]
+    age_cutoff = now - limits["max_age_days"] * 86400 if limits["max_age_days"] else None
+    for entry in entries:
+        expired = age_cutoff is not None and entry["last_used"] < age_cutoff
+        over_budget = limits["max_bytes"] is not None and total > limits["max_bytes"]
+        if not expired and not over_budget:
+            # Entries are sorted oldest first, so nothing later can qualify either.
+            break
+        if not _evict(entry["path"], dry_run):
+            busy.append(str(entry["path"]))
+            continue
+        if "cache" in entry:
+            auxiliary[entry["cache"]]["evicted"] += 1
+        else:
+            evicted.append(str(entry["path"]))
+        total -= entry["own_bytes"]
+        for digest in entry["digests"]:
+            refcounts[digest] -= 1
+            if refcounts[digest] == 0:
+                total -= sizes[digest]
+
+    staging = _remove_stale_staging(now, dry_run)
+    if dry_run:
+        objects_removed = sum(1 for count in refcounts.values() if count == 0)
+    else:
+        objects_removed = _sweep_objects(now)
+
+    return {
+        "dry_run": dry_run,
+        "max_bytes": limits["max_bytes"],
+        "max_age_days": limits["max_age_days"],
+        "scanned": len(entries) - sum(stats["files"] for stats in auxiliary.values()),
+        "evicted": evicted,
+        "auxiliary": auxiliary,
+        "busy": busy,
+        "staging_removed": staging,
+        "objects_removed": objects_removed,
+        "bytes_before": bytes_before,
+        "bytes_after": total,
+    }
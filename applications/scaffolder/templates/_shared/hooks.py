@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import json
 import os
+import posixpath
+import re
 import shutil
 import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from .manifest import get_template_config
 
@@ -31,35 +37,219 @@ def remove_paths(base_path: Path, paths: Iterable[str]) -> None:
             target.unlink()
 
 
+@lru_cache(maxsize=None)
+def _compile_replacements(items: Tuple[Tuple[str, str], ...]) -> Tuple["re.Pattern[str]", Dict[str, str]]:
+    """Build one alternation regex for a workflow's placeholders (cached per replacement set)."""
+    table = dict(items)
+    # Longest first so a placeholder that prefixes another never shadows it.
+    ordered = sorted(table, key=len, reverse=True)
+    return re.compile("|".join(re.escape(placeholder) for placeholder in ordered)), table
+
+
 def replace_workflow_placeholders(project_path: Path, workflows: Sequence[Mapping[str, Any]]) -> None:
-    """Replace templated placeholders inside rendered workflow files."""
+    """
+    Replace templated placeholders inside rendered workflow files.
+
+    Each file is scanned once with a compiled alternation of all its
+    placeholders, and only rewritten when something was substituted.
+    """
     for workflow in workflows or []:
         if not isinstance(workflow, Mapping):
             continue
         file_path = workflow.get("path") or workflow.get("file")
         if not file_path:
             continue
-        replacements: Mapping[str, str] = workflow.get("replacements") or workflow.get("placeholders") or {}
+        replacements: Mapping[str, Any] = workflow.get("replacements") or workflow.get("placeholders") or {}
         target = project_path / file_path
         if not target.exists():
             continue
+        items = tuple(sorted((str(key), str(value)) for key, value in replacements.items() if key))
+        if not items:
+            continue
+        pattern, table = _compile_replacements(items)
         content = target.read_text(encoding="utf-8")
-        for placeholder, value in replacements.items():
-            content = content.replace(placeholder, value)
-        target.write_text(content, encoding="utf-8")
+        updated = pattern.sub(lambda match: table[match.group(0)], content)
+        if updated != content:
+            target.write_text(updated, encoding="utf-8")
+
 
+BOOTSTRAP_REPORT = Path(".agentic-canon") / "bootstrap-report.json"
+BOOTSTRAP_JOBS_ENV = "AGENTIC_CANON_BOOTSTRAP_JOBS"
+_OUTPUT_LIMIT = 20_000
 
-def run_commands(project_path: Path, commands: Iterable[Any]) -> None:
-    """Execute bootstrap commands best-effort."""
-    for command in commands or []:
-        try:
-            if isinstance(command, str):
-                subprocess.run(command, cwd=project_path, shell=True, check=True)
-            else:
-                subprocess.run(list(command), cwd=project_path, check=True)
-        except (OSError, subprocess.CalledProcessError):
-            # Bootstrap commands should never break template generation.
-            pass
+
+def _describe(command: Any) -> str:
+    return command if isinstance(command, str) else " ".join(str(part) for part in command)
+
+
+def _plan_commands(commands: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten manifest command entries into steps with explicit dependencies.
+
+    Entries are a shell string, an argv list, a mapping
+    ``{name, run, needs}`` or a group ``{parallel: [...]}``. Plain entries run
+    after the previous step (as before); ``needs`` replaces that ordering with
+    named hard dependencies, and group members run concurrently.
+    """
+    steps: List[Dict[str, Any]] = []
+    names: Dict[str, int] = {}
+    previous: List[int] = []
+
+    def _add(entry: Any, after: List[int]) -> Optional[int]:
+        if isinstance(entry, Mapping):
+            command = entry.get("run") or entry.get("command")
+            name = _stringify(entry.get("name"))
+            needs = entry.get("needs")
+        else:
+            command, name, needs = entry, "", None
+        if not command:
+            return None
+        index = len(steps)
+        step = {
+            "name": name or _describe(command),
+            "command": command,
+            "needs": [],
+            "after": list(after),
+        }
+        if needs is not None:
+            wanted = [needs] if isinstance(needs, str) else list(needs)
+            missing = [need for need in wanted if need not in names]
+            if missing:
+                # The manifest loader rejects these; never abort generation over one here.
+                step["error"] = f"needs unknown step(s): {', '.join(missing)}"
+            step["needs"] = [names[need] for need in wanted if need in names]
+            step["after"] = []
+        steps.append(step)
+        if name:
+            names[name] = index
+        return index
+
+    for entry in commands or []:
+        if isinstance(entry, Mapping) and "parallel" in entry:
+            group = [_add(member, previous) for member in entry.get("parallel") or []]
+            members = [index for index in group if index is not None]
+            previous = members or previous
+        else:
+            index = _add(entry, previous)
+            if index is not None:
+                previous = [index]
+    return steps
+
+
+def _tail(text: Optional[str]) -> str:
+    text = text or ""
+    return text if len(text) <= _OUTPUT_LIMIT else text[-_OUTPUT_LIMIT:]
+
+
+def _run_step(project_path: Path, step: Dict[str, Any], origin: float) -> Dict[str, Any]:
+    command = step["command"]
+    started = time.monotonic()
+    result: Dict[str, Any] = {"started_at": round(started - origin, 3)}
+    try:
+        if isinstance(command, str):
+            completed = subprocess.run(command, cwd=project_path, shell=True, capture_output=True, text=True)
+        else:
+            completed = subprocess.run([str(part) for part in command], cwd=project_path, capture_output=True, text=True)
+    except OSError as exc:
+        result.update({"status": "error", "exit_code": None, "stdout": "", "stderr": str(exc)})
+    else:
+        result.update(
+            {
+                "status": "ok" if completed.returncode == 0 else "failed",
+                "exit_code": completed.returncode,
+                "stdout": _tail(completed.stdout),
+                "stderr": _tail(completed.stderr),
+            }
+        )
+    result["duration_seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+
+def _bootstrap_jobs(max_workers: Optional[int]) -> int:
+    if max_workers is None:
+        raw = os.environ.get(BOOTSTRAP_JOBS_ENV, "")
+        max_workers = int(raw) if raw.strip().isdigit() else min(4, os.cpu_count() or 1)
+    return max(1, max_workers)
+
+
+def run_commands(
+    project_path: Path,
+    commands: Iterable[Any],
+    *,
+    max_workers: Optional[int] = None,
+    report_path: Optional[Path] = BOOTSTRAP_REPORT,
+) -> List[Dict[str, Any]]:
+    """
+    Execute bootstrap commands best-effort on a bounded worker pool.
+
+    Steps start once their ordering and ``needs`` dependencies have finished;
+    a step whose ``needs`` failed, or names an unknown step, is skipped. Failures never break template
+    generation. Per-step status, exit code, wall time and captured output are
+    returned and, unless ``report_path`` is ``None``, written as JSON relative
+    to ``project_path``.
+    """
+    steps = _plan_commands(commands)
+    if not steps:
+        return []
+
+    origin = time.monotonic()
+    results: List[Optional[Dict[str, Any]]] = [None] * len(steps)
+    jobs = _bootstrap_jobs(max_workers)
+    running: Dict[Future, int] = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while True:
+            for index, step in enumerate(steps):
+                if results[index] is not None or index in running.values():
+                    continue
+                if any(results[dep] is None for dep in step["needs"] + step["after"]):
+                    continue
+                if step.get("error"):
+                    results[index] = {
+                        "status": "skipped",
+                        "exit_code": None,
+                        "duration_seconds": 0.0,
+                        "stdout": "",
+                        "stderr": step["error"],
+                    }
+                    continue
+                if any(results[dep]["status"] != "ok" for dep in step["needs"]):  # type: ignore[index]
+                    results[index] = {"status": "skipped", "exit_code": None, "duration_seconds": 0.0}
+                    continue
+                running[pool.submit(_run_step, project_path, step, origin)] = index
+            if not running:
+                # Dependencies always point at earlier steps, so an idle pool means every step resolved.
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+    report = [
+        {"name": step["name"], "command": _describe(step["command"]), **(result or {})}
+        for step, result in zip(steps, results)
+    ]
+    if report_path is not None:
+        write_bootstrap_report(project_path, report, jobs=jobs, seconds=time.monotonic() - origin, report_path=report_path)
+    return report
+
+
+def write_bootstrap_report(
+    project_path: Path,
+    report: List[Dict[str, Any]],
+    *,
+    jobs: int,
+    seconds: float,
+    report_path: Path = BOOTSTRAP_REPORT,
+) -> None:
+    """Write command results as JSON relative to ``project_path`` (best-effort)."""
+    target = project_path / report_path
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(
+            json.dumps({"jobs": jobs, "total_seconds": round(seconds, 3), "commands": report}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
 
 
 def ensure_git_repo(project_path: Path, git_config: Mapping[str, Any], context: Mapping[str, Any]) -> None:
@@ -84,38 +274,59 @@ def remove_optional_components(project_path: Path, paths: Iterable[str]) -> None
     remove_paths(project_path, paths)
 
 
-def _apply_actions(project_path: Path, actions: Mapping[str, Any]) -> None:
-    if not actions:
-        return
-    removals = actions.get("remove") or []
-    if removals:
-        remove_paths(project_path, removals)
-
-    workflow_actions = actions.get("workflows")
-    if workflow_actions:
-        if isinstance(workflow_actions, Mapping):
-            replace_workflow_placeholders(project_path, [workflow_actions])
-        else:
-            replace_workflow_placeholders(project_path, workflow_actions)
+def _normalise_relative(path: Any) -> str:
+    normalised = posixpath.normpath(str(path).replace("\\", "/"))
+    return "" if normalised == "." else normalised
 
-    commands = actions.get("commands") or []
-    if commands:
-        run_commands(project_path, commands)
 
+def _new_stage(source: str) -> Dict[str, Any]:
+    return {"source": source, "removals": [], "rewrites": [], "commands": []}
 
-def _apply_option_matrix(project_path: Path, options: Mapping[str, Any], context: Mapping[str, Any]) -> None:
+
+def _plan_workflows(stage: Dict[str, Any], workflows: Any) -> None:
+    if isinstance(workflows, Mapping):
+        workflows = [workflows]
+    for workflow in workflows or []:
+        if not isinstance(workflow, Mapping):
+            continue
+        file_path = workflow.get("path") or workflow.get("file")
+        replacements = workflow.get("replacements") or workflow.get("placeholders") or {}
+        if not file_path or not replacements:
+            continue
+        # Each config stays a separate pass so chained and overlapping placeholders behave sequentially.
+        stage["rewrites"].append(
+            {
+                "path": _normalise_relative(file_path),
+                "replacements": dict(sorted((str(key), str(value)) for key, value in replacements.items())),
+            }
+        )
+
+
+def _plan_actions(source: str, actions: Mapping[str, Any]) -> Dict[str, Any]:
+    stage = _new_stage(source)
+    if actions:
+        stage["removals"].extend(_normalise_relative(path) for path in actions.get("remove") or [])
+        _plan_workflows(stage, actions.get("workflows"))
+        stage["commands"].extend(actions.get("commands") or [])
+    return stage
+
+
+def _selected_option_actions(
+    options: Mapping[str, Any], context: Mapping[str, Any]
+) -> Iterable[Tuple[str, Mapping[str, Any]]]:
     for option_name, option_config in (options or {}).items():
         desired_value = context.get(option_name)
         if desired_value is None and "default" in option_config:
             desired_value = option_config.get("default")
         normalized = _normalize_option(desired_value)
-        cases = option_config.get("cases", {})
-        actions = cases.get(normalized)
+        actions = option_config.get("cases", {}).get(normalized)
         if actions:
-            _apply_actions(project_path, actions)
+            yield f"options.{option_name}={normalized}", actions
 
 
-def _apply_legacy_features(project_path: Path, config: Mapping[str, Any], context: Mapping[str, Any]) -> None:
+def _selected_feature_actions(
+    config: Mapping[str, Any], context: Mapping[str, Any]
+) -> Iterable[Tuple[str, Mapping[str, Any]]]:
     for feature in config.get("features", []) or []:
         variable = feature.get("variable")
         if not variable:
@@ -123,30 +334,119 @@ def _apply_legacy_features(project_path: Path, config: Mapping[str, Any], contex
         actions_map = feature.get("actions", {})
         desired_value = _normalize_option(context.get(variable))
         if desired_value in actions_map:
-            _apply_actions(project_path, actions_map[desired_value])
-
+            yield f"features.{variable}={desired_value}", actions_map[desired_value]
 
-def _apply_cleanup(project_path: Path, hooks_config: Mapping[str, Any]) -> None:
-    cleanup_cfg = hooks_config.get("cleanup", {}) if hooks_config else {}
-    remove_optional_components(project_path, cleanup_cfg.get("remove_after_render", []))
 
+def _covered(path: str, removed: Iterable[str]) -> bool:
+    return any(path == prefix or path.startswith(f"{prefix}/") for prefix in removed)
 
-def run_post_gen(template_name: str, project_path: Path, context: Dict[str, Any]) -> None:
-    """Apply manifest-driven post-generation customisations."""
-    config = get_template_config(template_name)
-    hooks_config: Mapping[str, Any] = config.get("hooks", {})
 
-    replace_workflow_placeholders(project_path, hooks_config.get("workflows", []))
-    _apply_option_matrix(project_path, hooks_config.get("options", {}), context)
-    _apply_legacy_features(project_path, config, context)
-    _apply_cleanup(project_path, hooks_config)
+def _finalise_stages(stages: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop redundant work without reordering anything.
 
-    manifest_commands = hooks_config.get("commands", [])
-    if manifest_commands:
-        run_commands(project_path, manifest_commands)
-    run_commands(project_path, config.get("bootstrap", []))
+    Within a stage, removals are deduplicated and nested paths dropped.
+    Removals and rewrites of paths an earlier removal already deleted are
+    skipped, as are rewrites of files a later stage removes before any
+    command could read them. Commands may read or recreate any file, so no
+    skipping crosses a stage that runs commands. Empty stages are omitted.
+    """
+    stages = list(stages)
+    removed: List[str] = []
+    for stage in stages:
+        removals: List[str] = []
+        for path in sorted({path for path in stage["removals"] if path}):
+            if not _covered(path, removals) and not _covered(path, removed):
+                removals.append(path)
+        removed.extend(removals)
+        stage["removals"] = removals
+        stage["rewrites"] = [rewrite for rewrite in stage["rewrites"] if not _covered(rewrite["path"], removed)]
+        if stage["commands"]:
+            removed = []
+
+    removed_later: List[str] = []
+    for stage in reversed(stages):
+        if stage["commands"]:
+            removed_later = []
+        stage["rewrites"] = [rewrite for rewrite in stage["rewrites"] if not _covered(rewrite["path"], removed_later)]
+        removed_later.extend(stage["removals"])
+    return [stage for stage in stages if stage["removals"] or stage["rewrites"] or stage["commands"]]
+
+
+def plan_post_gen(template_name: str, context: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the post-generation plan for ``template_name`` without touching disk.
+
+    The plan is an ordered list of stages, in the order the steps were always
+    applied: ``hooks.workflows`` rewrites, each selected option-matrix case
+    and legacy feature action (its removals, then rewrites, then commands),
+    ``cleanup`` removals, and finally ``commands`` (``hooks.commands`` then
+    ``bootstrap``), plus git settings. Paths are project-relative, so plans
+    for different contexts can be diffed without rendering.
+    """
+    config = get_template_config(template_name)
+    hooks_config: Mapping[str, Any] = config.get("hooks", {}) or {}
+
+    stages: List[Dict[str, Any]] = [_new_stage("hooks.workflows")]
+    _plan_workflows(stages[0], hooks_config.get("workflows", []))
+    for source, actions in _selected_option_actions(hooks_config.get("options", {}), context):
+        stages.append(_plan_actions(source, actions))
+    for source, actions in _selected_feature_actions(config, context):
+        stages.append(_plan_actions(source, actions))
+    cleanup = _new_stage("cleanup")
+    cleanup_cfg = hooks_config.get("cleanup", {}) or {}
+    cleanup["removals"].extend(_normalise_relative(path) for path in cleanup_cfg.get("remove_after_render", []) or [])
+    stages.append(cleanup)
+    commands = _new_stage("commands")
+    commands["commands"].extend(hooks_config.get("commands") or [])
+    commands["commands"].extend(config.get("bootstrap") or [])
+    stages.append(commands)
+
+    plan: Dict[str, Any] = {"template": template_name, "stages": _finalise_stages(stages), "git": {}}
+    git_config = config.get("git", {}) or {}
+    if git_config.get("init"):
+        branch_var = git_config.get("default_branch_variable")
+        plan["git"] = {
+            "init": True,
+            "default_branch_variable": branch_var,
+            "default_branch": _stringify(context.get(branch_var)) if branch_var else "",
+        }
+    return plan
+
+
+def apply_plan(project_path: Path, plan: Mapping[str, Any], context: Mapping[str, Any]) -> None:
+    """
+    Apply a :func:`plan_post_gen` plan stage by stage, then initialise git.
 
-    ensure_git_repo(project_path, config.get("git", {}), context)
+    Each stage runs its removals, then its rewrites, then its commands, so a
+    command only sees the effects of the stages before it. Command results from
+    every stage are collected into one bootstrap report.
+    """
+    origin = time.monotonic()
+    report: List[Dict[str, Any]] = []
+    jobs = _bootstrap_jobs(None)
+    for stage in plan.get("stages", []):
+        remove_paths(project_path, stage.get("removals", []))
+        replace_workflow_placeholders(project_path, stage.get("rewrites", []))
+        if stage.get("commands"):
+            report.extend(run_commands(project_path, stage["commands"], max_workers=jobs, report_path=None))
+    if report:
+        write_bootstrap_report(project_path, report, jobs=jobs, seconds=time.monotonic() - origin)
+    ensure_git_repo(project_path, plan.get("git") or {}, context)
+
+
+def run_post_gen(
+    template_name: str,
+    project_path: Path,
+    context: Dict[str, Any],
+    *,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Apply manifest-driven post-generation customisations; ``dry_run`` only returns the plan."""
+    plan = plan_post_gen(template_name, context)
+    if not dry_run:
+        apply_plan(project_path, plan, context)
+    return plan
 
 
 def apply_template_config(template_name: str, project_path: Path, context: Dict[str, Any]) -> None:
@@ -161,3 +461,50 @@ def apply_template_config(template_name: str, project_path: Path, context: Dict[
 
 def should_suppress_messages() -> bool:
     return bool(os.environ.get("AGENTIC_CANON_SKIP_MESSAGES"))
+
+
+def _dry_run_context(template_name: str, sample: Optional[str], overrides: Iterable[str]) -> Dict[str, Any]:
+    """Cookiecutter defaults (first choice for lists), then a manifest sample context, then overrides."""
+    config = get_template_config(template_name)
+    context: Dict[str, Any] = {}
+    root = Path(__file__).resolve().parents[2] / str(config.get("root") or f"templates/{template_name}")
+    defaults_file = root / "cookiecutter.json"
+    if defaults_file.exists():
+        for key, value in json.loads(defaults_file.read_text(encoding="utf-8")).items():
+            context[key] = value[0] if isinstance(value, list) and value else value
+    if sample:
+        samples = config.get("sample_contexts", {}) or {}
+        if sample not in samples:
+            raise KeyError(f"Unknown sample context '{sample}' for template '{template_name}'")
+        context.update(samples[sample])
+    for override in overrides:
+        key, separator, value = override.partition("=")
+        if not separator:
+            raise ValueError(f"Context override must be KEY=value, got '{override}'")
+        context[key.strip()] = value
+    return context
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Print a post-generation plan as JSON so contexts can be diffed without rendering.
+
+    The CLI never applies the plan: its context comes from the manifest, not from
+    a rendered project. ``--dry-run`` is accepted for compatibility and implied.
+    """
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(description="Plan manifest-driven post-generation steps")
+    parser.add_argument("template", help="Template name from the manifest")
+    parser.add_argument("--dry-run", action="store_true", help="Accepted for compatibility; the plan is never applied")
+    parser.add_argument("--context", help="Manifest sample context to start from")
+    parser.add_argument("--set", action="append", default=[], dest="overrides", metavar="KEY=VALUE")
+    args = parser.parse_args(argv)
+
+    context = _dry_run_context(args.template, args.context, args.overrides)
+    print(json.dumps(plan_post_gen(args.template, context), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
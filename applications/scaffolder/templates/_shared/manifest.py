@@ -1,11 +1,24 @@
-"""Manifest helpers for Agentic Canon templates."""
+"""Manifest helpers for Agentic Canon templates.
+
+Parsed manifests are kept as marshal snapshots under the shared cache root
+(``AGENTIC_CANON_CACHE_DIR``, default ``~/.cache/agentic-canon``) keyed on the
+source file's mtime, size and SHA-256, so hook processes only pay for YAML
+parsing after the manifest actually changes. A freshly parsed manifest is
+checked with :func:`validate_manifest` before it is snapshotted.
+"""
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import json
+import marshal
+import os
+import sys
+import tempfile
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 try:  # Optional dependency; hooks must continue to work without PyYAML.
     import yaml  # type: ignore
@@ -17,19 +30,143 @@ MANIFEST_DIR = Path(__file__).resolve().parent.parent
 MANIFEST_YAML = MANIFEST_DIR / "manifest.yaml"
 MANIFEST_JSON = MANIFEST_DIR / "manifest.json"
 
+SNAPSHOT_DIR = (
+    Path(os.environ.get("AGENTIC_CANON_CACHE_DIR", Path.home() / ".cache" / "agentic-canon")).expanduser()
+    / "manifest"
+)
+# Bump when the snapshot layout changes; marshal output is also specific to the Python version.
+_SNAPSHOT_FORMAT = 1
+
+_YAML_LOADER = None
+if yaml is not None:  # pragma: no branch
+    # libyaml's C loader is an order of magnitude faster than the pure-Python SafeLoader.
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+
+
+def _snapshot_path(source: Path) -> Path:
+    location = hashlib.sha256(str(source).encode("utf-8")).hexdigest()[:16]
+    version = f"py{sys.version_info[0]}{sys.version_info[1]}"
+    return SNAPSHOT_DIR / f"{source.name}.{location}.{version}.marshal"
+
+
+def _read_snapshot(source: Path) -> Optional[Tuple[Any, ...]]:
+    try:
+        with _snapshot_path(source).open("rb") as handle:
+            snapshot = marshal.load(handle)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(snapshot, tuple) or len(snapshot) != 5 or snapshot[0] != _SNAPSHOT_FORMAT:
+        return None
+    return snapshot
+
+
+def _write_snapshot(source: Path, stat_result: os.stat_result, digest: str, data: Dict[str, Any]) -> None:
+    snapshot = (_SNAPSHOT_FORMAT, stat_result.st_mtime_ns, stat_result.st_size, digest, data)
+    target = _snapshot_path(source)
+    try:
+        payload = marshal.dumps(snapshot)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+    except (OSError, ValueError):
+        # Read-only cache or a value marshal cannot encode: the snapshot is only an optimisation.
+        return
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(temp_name, target)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+
+
+def _load_with_snapshot(source: Path, parse: Callable[[bytes], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return ``source`` parsed by ``parse``, preferring a valid compiled snapshot.
+
+    An unchanged mtime and size trusts the snapshot without reading the source;
+    otherwise the source is hashed and only re-parsed when its content changed.
+    """
+    stat_result = source.stat()
+    snapshot = _read_snapshot(source)
+    if snapshot is not None and snapshot[1:3] == (stat_result.st_mtime_ns, stat_result.st_size):
+        return snapshot[4]
+
+    raw = source.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if snapshot is not None and snapshot[3] == digest:
+        data = snapshot[4]
+    else:
+        data = parse(raw)
+    _write_snapshot(source, stat_result, digest, data)
+    return data
+
+
+def command_lists(config: Dict[str, Any]) -> Iterable[Tuple[str, List[Any]]]:
+    """Yield each list of commands that post-gen runs as one dependency graph."""
+    hooks_config = config.get("hooks") or {}
+    yield "commands", list(hooks_config.get("commands") or []) + list(config.get("bootstrap") or [])
+    for option_name, option_config in (hooks_config.get("options") or {}).items():
+        for case, actions in ((option_config or {}).get("cases") or {}).items():
+            yield f"options.{option_name}={case}", list((actions or {}).get("commands") or [])
+    for feature in config.get("features") or []:
+        for value, actions in ((feature or {}).get("actions") or {}).items():
+            yield f"features.{feature.get('variable')}={value}", list((actions or {}).get("commands") or [])
+
+
+def _unknown_needs(commands: List[Any]) -> List[str]:
+    problems: List[str] = []
+    names: set = set()
+
+    def _visit(entry: Any) -> None:
+        if not isinstance(entry, dict):
+            return
+        needs = entry.get("needs")
+        wanted = [needs] if isinstance(needs, str) else list(needs or [])
+        missing = [need for need in wanted if need not in names]
+        if missing:
+            problems.append(f"'{entry.get('name') or entry.get('run')}' needs unknown step(s): {', '.join(missing)}")
+        if entry.get("name"):
+            names.add(str(entry["name"]).strip())
+
+    for entry in commands:
+        if isinstance(entry, dict) and "parallel" in entry:
+            for member in entry.get("parallel") or []:
+                _visit(member)
+        else:
+            _visit(entry)
+    return problems
+
+
+def validate_manifest(data: Dict[str, Any]) -> List[str]:
+    """Return authoring errors in ``data``; currently command ``needs`` naming no earlier step."""
+    errors: List[str] = []
+    for template_name, config in (data.get("templates") or {}).items():
+        for source, commands in command_lists(config or {}):
+            errors.extend(f"{template_name} {source}: {problem}" for problem in _unknown_needs(commands))
+    return errors
+
+
+def _checked(parse: Callable[[bytes], Dict[str, Any]]) -> Callable[[bytes], Dict[str, Any]]:
+    def _parse(raw: bytes) -> Dict[str, Any]:
+        data = parse(raw)
+        errors = validate_manifest(data) if isinstance(data, dict) else []
+        if errors:
+            raise ValueError("Invalid template manifest:\n  " + "\n  ".join(errors))
+        return data
+
+    return _parse
+
 
 def _load_from_yaml() -> Dict[str, Any]:
     if yaml is None or not MANIFEST_YAML.exists():
         raise RuntimeError("YAML manifest unavailable")
-    with MANIFEST_YAML.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle)
+    return _load_with_snapshot(MANIFEST_YAML, _checked(lambda raw: yaml.load(raw, Loader=_YAML_LOADER)))
 
 
 def _load_from_json() -> Dict[str, Any]:
     if not MANIFEST_JSON.exists():
         raise FileNotFoundError("manifest.json is missing")
-    with MANIFEST_JSON.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return _load_with_snapshot(MANIFEST_JSON, _checked(json.loads))
 
 
 @lru_cache(maxsize=None)
@@ -39,9 +176,14 @@ def load_manifest() -> Dict[str, Any]:
 
     We prefer the YAML representation for readability, but fall back to the
     JSON mirror when PyYAML is unavailable (e.g., inside Cookiecutter hooks).
+    A YAML snapshot written by an earlier process is used even without PyYAML.
     """
-    if MANIFEST_YAML.exists() and yaml is not None:
-        return _load_from_yaml()
+    if MANIFEST_YAML.exists():
+        if yaml is not None:
+            return _load_from_yaml()
+        snapshot = _read_snapshot(MANIFEST_YAML)
+        if snapshot is not None and snapshot[3] == hashlib.sha256(MANIFEST_YAML.read_bytes()).hexdigest():
+            return snapshot[4]
     return _load_from_json()
 
 
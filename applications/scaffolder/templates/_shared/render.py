@@ -0,0 +1,316 @@
+"""Rendering helpers for manifest-driven template renders."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from . import cache as cache_utils
+from . import engine, sources, store
+
+SKIP_GIT_INIT_ENV = "AGENTIC_CANON_SKIP_GIT_INIT"
+
+_GIT_DEFER_LOCK = threading.Lock()
+_GIT_DEFER_DEPTH = 0
+_GIT_DEFER_PREVIOUS: Optional[str] = None
+
+RenderTarget = Tuple[str, Path, Dict[str, Any]]
+"""``(template_name, template_root, extra_context)`` triple accepted by :func:`render_many`."""
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Translate a ``--jobs`` value into a worker count (``0`` means one per CPU)."""
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def render_into(template_root: Path, extra_context: Mapping[str, Any], destination: Path) -> None:
+    """Render ``template_root`` so the generated project lands directly in ``destination``."""
+    context = engine.build_context(template_root, extra_context, destination)
+    generated = engine.generate_project(template_root, context, destination)
+    if generated != destination.resolve():
+        for item in generated.iterdir():
+            shutil.move(str(item), destination)
+        shutil.rmtree(generated)
+
+
+def patch_render(
+    previous: Path,
+    template_root: Path,
+    extra_context: Mapping[str, Any],
+    destination: Path,
+) -> bool:
+    """
+    Rebuild a render by patching the ``previous`` cache entry into ``destination``.
+
+    Only edits to existing files inside the project template directory are
+    patched, and only when the cached output of each such file still equals a
+    standalone render of its old source (i.e. no post-gen hook rewrote it).
+    Anything else — added/removed sources, hook, ``cookiecutter.json`` or
+    ``_shared`` edits — returns ``False`` and the caller renders from scratch.
+    """
+    recorded = cache_utils.read_sources(previous)
+    previous_tree = store.read_tree(previous)
+    if recorded is None or previous_tree is None or recorded.get("shared") != sources.shared_digest():
+        return False
+
+    diff = sources.changed_paths(recorded["entries"], sources.source_entries(template_root))
+    if diff["added"] or diff["removed"]:
+        return False
+
+    context = engine.build_context(template_root, extra_context, destination)
+    env = engine.environment_for(template_root, context)
+    template_dir = engine.project_template_dir(template_root, env)
+    prefix = f"{template_dir.name}/"
+    recorded_types = {entry["path"]: entry["type"] for entry in recorded["entries"]}
+    if any(not path.startswith(prefix) or recorded_types.get(path) != "file" for path in diff["modified"]):
+        return False
+    infiles = [path[len(prefix):] for path in diff["modified"]]
+
+    outputs = {entry["path"]: entry for entry in previous_tree.get("entries", [])}
+    with tempfile.TemporaryDirectory(prefix="agentic-canon-patch-") as scratch:
+        old_root = Path(scratch) / "sources"
+        old_render = Path(scratch) / "render"
+        try:
+            store.materialise_tree(
+                cache_utils.OBJECT_STORE_DIR,
+                {"entries": recorded["entries"]},
+                old_root,
+                strategy="copy",
+            )
+            old_env = engine.environment_for(old_root, context)
+            old_template_dir = engine.project_template_dir(old_root, old_env)
+            for infile in infiles:
+                relative = engine.render_file(old_env, old_template_dir, infile, context, old_render)
+                cached = outputs.get(relative) if relative else None
+                rendered = old_render / relative if relative else None
+                if (
+                    cached is None
+                    or rendered is None
+                    or cached.get("type") != "file"
+                    or cached.get("digest") != store.hash_file(rendered)
+                    or cached.get("mode") != (rendered.stat().st_mode & 0o7777)
+                ):
+                    return False
+            cache_utils.copy_from_cache(previous, destination, strategy="copy")
+            for infile in infiles:
+                engine.render_file(env, template_dir, infile, context, destination)
+        except Exception:  # noqa: BLE001 - any surprise means "render from scratch"
+            return False
+    return True
+
+
+def render_cached(
+    template_name: str,
+    template_root: Path,
+    extra_context: Mapping[str, Any],
+    *,
+    force: bool = False,
+    incremental: bool = False,
+) -> Path:
+    """
+    Render a template context through the shared template cache.
+
+    With ``incremental`` a miss caused by template edits is served by patching
+    the last render of the same context (see :func:`patch_render`).
+    """
+    previous = None
+    if incremental and not force:
+        previous = cache_utils.previous_template_entry(template_name, dict(extra_context))
+
+    def _produce(destination: Path) -> None:
+        if previous is not None and patch_render(previous, template_root, extra_context, destination):
+            return
+        if destination.exists():
+            shutil.rmtree(destination)
+            destination.mkdir(parents=True)
+        render_into(template_root, extra_context, destination)
+
+    return cache_utils.prime_template_cache(
+        template_name,
+        dict(extra_context),
+        _produce,
+        force=force,
+    )
+
+
+@contextlib.contextmanager
+def _git_init_deferred() -> Iterator[None]:
+    # Cached renders stay git-free; standalone projects initialise their own repository.
+    # Hooks run in subprocesses, so the switch has to live in os.environ (refcounted for threads).
+    global _GIT_DEFER_DEPTH, _GIT_DEFER_PREVIOUS  # pylint: disable=global-statement
+    with _GIT_DEFER_LOCK:
+        if _GIT_DEFER_DEPTH == 0:
+            _GIT_DEFER_PREVIOUS = os.environ.get(SKIP_GIT_INIT_ENV)
+            os.environ[SKIP_GIT_INIT_ENV] = "1"
+        _GIT_DEFER_DEPTH += 1
+    try:
+        yield
+    finally:
+        with _GIT_DEFER_LOCK:
+            _GIT_DEFER_DEPTH -= 1
+            if _GIT_DEFER_DEPTH == 0:
+                if _GIT_DEFER_PREVIOUS is None:
+                    os.environ.pop(SKIP_GIT_INIT_ENV, None)
+                else:
+                    os.environ[SKIP_GIT_INIT_ENV] = _GIT_DEFER_PREVIOUS
+
+
+def post_gen_cacheable(template_name: str) -> bool:
+    """
+    Whether a cached render can stand in for running ``template_name``'s hooks in the project.
+
+    Removals and workflow rewrites only change file content, so they are
+    captured by the cached tree; git init is redone per project. Manifest
+    commands (option/feature ``commands``, ``hooks.commands``, ``bootstrap``)
+    may depend on the project path (virtualenvs, ``pre-commit install``,
+    absolute paths) and would only ever run inside the cache entry, so any
+    template that declares one is rendered in place instead.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .manifest import command_lists, get_template_config
+
+    try:
+        config = get_template_config(template_name)
+    except KeyError:
+        return False
+    return not any(commands for _source, commands in command_lists(config))
+
+
+def render_project(
+    template_name: str,
+    template_root: Path,
+    extra_context: Mapping[str, Any],
+    output_dir: Path,
+    *,
+    overwrite: bool = False,
+) -> Path:
+    """
+    Generate a standalone project below ``output_dir``, from the template cache when safe.
+
+    This is the in-process equivalent of ``cookiecutter <template> --no-input
+    --output-dir <output_dir>``. When :func:`post_gen_cacheable` allows it,
+    the render is served from (or added to) the shared cache, cloned into
+    ``output_dir`` (``reflink`` or ``copy``, never hardlinks, since the project
+    will be edited) and given the git repository the manifest asks for.
+    Otherwise the template is rendered directly, so its hooks run in the
+    project. Existing projects raise :class:`FileExistsError` unless
+    ``overwrite`` is set, in which case the render is merged over the existing
+    files and nothing is deleted. Hook failures raise cookiecutter's
+    ``FailedHookException``.
+    """
+    # pylint: disable=import-outside-toplevel
+    from . import hooks
+    from .manifest import get_template_config
+
+    template_root = Path(template_root).resolve()
+    output_dir = Path(output_dir)
+    context = engine.build_context(template_root, extra_context, output_dir)
+    env = engine.environment_for(template_root, context)
+    template_dir = engine.project_template_dir(template_root, env)
+    project_dir = output_dir.resolve() / engine.render_path(env, template_dir.name, context)
+    if project_dir.exists() and not overwrite:
+        raise FileExistsError(f"{project_dir} already exists")
+
+    if not post_gen_cacheable(template_name):
+        return engine.generate_project(template_root, context, output_dir)
+
+    existing = "merge" if overwrite else "error"
+    with _git_init_deferred():
+        cache_dir = render_cached(template_name, template_root, extra_context)
+        try:
+            cache_utils.copy_from_cache(cache_dir, project_dir, strategy="reflink", existing=existing)
+        except (store.StoreIntegrityError, FileNotFoundError):
+            # The entry was tampered with or evicted by a concurrent `gc` run; render it again.
+            cache_dir = render_cached(template_name, template_root, extra_context)
+            cache_utils.copy_from_cache(cache_dir, project_dir, strategy="reflink", existing=existing)
+
+    try:
+        git_config = get_template_config(template_name).get("git") or {}
+    except KeyError:
+        git_config = {}
+    hooks.ensure_git_repo(project_dir, git_config, context["cookiecutter"])
+    return project_dir
+
+
+def _extend_sys_path(paths: Sequence[str]) -> None:
+    # Spawned workers do not inherit runtime sys.path tweaks (e.g. nox session site-packages).
+    for entry in reversed(paths):
+        if entry not in sys.path:
+            sys.path.insert(0, entry)
+
+
+def _render_target(target: RenderTarget, force: bool, incremental: bool) -> Path:
+    template_name, template_root, extra_context = target
+    return render_cached(template_name, template_root, extra_context, force=force, incremental=incremental)
+
+
+def render_many(
+    targets: Sequence[RenderTarget],
+    *,
+    jobs: int = 1,
+    force: bool = False,
+    incremental: bool = False,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Render every target through the template cache and return the cache dirs.
+
+    Cache hits are resolved in the calling process; misses are rendered on a
+    process pool when ``jobs > 1``. Concurrent renders of the same cache entry
+    are serialised by the per-entry ``file_lock`` in :mod:`cache`. With
+    ``incremental`` misses are patched from the previous render of the same
+    context where possible. The result list always follows the order of
+    ``targets``, independent of completion order. With ``return_exceptions``
+    a failed render (including a hook's ``SystemExit``) is returned in place
+    of its cache dir instead of being raised.
+    """
+    results: List[Any] = [None] * len(targets)
+    pending: Dict[Path, List[int]] = {}
+
+    for position, (template_name, _root, extra_context) in enumerate(targets):
+        cache_dir = cache_utils.get_template_cache_dir(template_name, extra_context)
+        if not force and (cache_dir / cache_utils.SENTINEL).exists():
+            results[position] = cache_dir
+            continue
+        pending.setdefault(cache_dir, []).append(position)
+
+    workers = min(resolve_jobs(jobs), len(pending))
+    if workers <= 1:
+        for positions in pending.values():
+            try:
+                outcome: Any = _render_target(targets[positions[0]], force, incremental)
+            except (Exception, SystemExit) as exc:  # noqa: BLE001 - hooks abort with SystemExit
+                if not return_exceptions:
+                    raise
+                outcome = exc
+            for position in positions:
+                results[position] = outcome
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_extend_sys_path,
+            initargs=(list(sys.path),),
+        ) as pool:
+            futures = {
+                pool.submit(_render_target, targets[positions[0]], force, incremental): positions
+                for positions in pending.values()
+            }
+            for future, positions in futures.items():
+                outcome = future.exception() if return_exceptions else None
+                if outcome is None:
+                    outcome = future.result()
+                for position in positions:
+                    results[position] = outcome
+
+    return [path for path in results if path is not None]
@@ -0,0 +1,159 @@
+"""Merkle digests of template source trees.
+
+The render cache keys every entry on the digest of the template's source tree
+together with ``_shared`` (which the hooks import), so editing any template
+file invalidates exactly the renders that depend on it. Source listings use
+the same entry schema as :mod:`store` tree manifests, which lets a cached
+render remember the sources it was produced from.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from . import store
+
+SHARED_DIR = Path(__file__).resolve().parent
+TEMPLATES_DIR = SHARED_DIR.parent
+
+_EXCLUDED_NAMES = {"__pycache__", ".DS_Store", ".pytest_cache", ".mypy_cache"}
+_EXCLUDED_SUFFIXES = (".pyc", ".pyo")
+# path -> (mtime_ns, size, digest); lets repeated key computations skip rehashing unchanged files.
+_DIGEST_MEMO: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _excluded(name: str) -> bool:
+    return name in _EXCLUDED_NAMES or name.endswith(_EXCLUDED_SUFFIXES)
+
+
+def _file_digest(path: str, info: os.stat_result) -> str:
+    memo = _DIGEST_MEMO.get(path)
+    if memo is not None and memo[0] == info.st_mtime_ns and memo[1] == info.st_size:
+        return memo[2]
+    digest = store.hash_file(Path(path))
+    _DIGEST_MEMO[path] = (info.st_mtime_ns, info.st_size, digest)
+    return digest
+
+
+def source_entries(root: Path) -> List[Dict[str, Any]]:
+    """List ``root`` in :mod:`store` manifest-entry form, skipping caches and bytecode."""
+    entries: List[Dict[str, Any]] = []
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as iterator:
+            children = [entry for entry in iterator if not _excluded(entry.name)]
+        for entry in children:
+            relative = Path(entry.path).relative_to(root).as_posix()
+            if entry.is_symlink():
+                entries.append({"path": relative, "type": "symlink", "target": os.readlink(entry.path)})
+            elif entry.is_dir(follow_symlinks=False):
+                entries.append({"path": relative, "type": "dir"})
+                stack.append(Path(entry.path))
+            elif entry.is_file(follow_symlinks=False):
+                info = entry.stat(follow_symlinks=False)
+                entries.append(
+                    {
+                        "path": relative,
+                        "type": "file",
+                        "digest": _file_digest(entry.path, info),
+                        "mode": stat.S_IMODE(info.st_mode),
+                    }
+                )
+    entries.sort(key=lambda item: item["path"])
+    return entries
+
+
+def _leaf_digest(entry: Mapping[str, Any]) -> str:
+    if entry["type"] == "file":
+        return f"{entry['digest']}:{entry['mode']:o}"
+    if entry["type"] == "symlink":
+        return hashlib.sha256(entry["target"].encode("utf-8")).hexdigest()
+    return ""
+
+
+def merkle_digest(entries: Sequence[Mapping[str, Any]]) -> str:
+    """
+    Return the root hash of the Merkle tree described by ``entries``.
+
+    Each directory hashes the sorted ``(type, name, digest)`` lines of its
+    children, so the root changes whenever any file, mode, symlink or
+    directory below it does.
+    """
+    children: Dict[str, List[str]] = {"": []}
+    for entry in entries:
+        if entry["type"] == "dir":
+            children.setdefault(entry["path"], [])
+
+    def _parent(path: str) -> str:
+        return path.rpartition("/")[0]
+
+    for entry in entries:
+        if entry["type"] != "dir":
+            name = entry["path"].rpartition("/")[2]
+            children.setdefault(_parent(entry["path"]), []).append(
+                f"{entry['type']} {name} {_leaf_digest(entry)}"
+            )
+    # Deepest directories first so each child's hash exists before its parent is sealed.
+    directories = sorted((path for path in children if path), key=lambda path: path.count("/"), reverse=True)
+    for directory in directories:
+        lines = sorted(children[directory])
+        digest = hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+        children.setdefault(_parent(directory), []).append(f"dir {directory.rpartition('/')[2]} {digest}")
+    return hashlib.sha256("\n".join(sorted(children[""])).encode("utf-8")).hexdigest()
+
+
+def tree_digest(root: Path) -> str:
+    return merkle_digest(source_entries(root))
+
+
+def template_root(template_name: str) -> Optional[Path]:
+    """Resolve a template's source directory from the manifest ``root`` field."""
+    try:
+        from .manifest import get_template_config  # pylint: disable=import-outside-toplevel
+
+        root_value = get_template_config(template_name).get("root")
+    except Exception:  # pragma: no cover - manifest unavailable or template unknown
+        root_value = None
+    candidates = [TEMPLATES_DIR.parent / str(root_value)] if root_value else []
+    candidates.append(TEMPLATES_DIR / template_name)
+    for candidate in candidates:
+        if (candidate / "cookiecutter.json").is_file():
+            return candidate
+    return None
+
+
+def template_source_digest(template_name: str) -> Optional[str]:
+    """Digest of the template source tree plus ``_shared``, or ``None`` for unknown templates."""
+    root = template_root(template_name)
+    if root is None:
+        return None
+    combined = f"{tree_digest(root)}\n{shared_digest()}"
+    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+
+def shared_digest() -> str:
+    return tree_digest(SHARED_DIR)
+
+
+def changed_paths(
+    previous: Sequence[Mapping[str, Any]],
+    current: Sequence[Mapping[str, Any]],
+) -> Dict[str, List[str]]:
+    """Compare two source listings and bucket their paths into added/removed/modified."""
+    before = {entry["path"]: entry for entry in previous}
+    after = {entry["path"]: entry for entry in current}
+    return {
+        "added": sorted(set(after) - set(before)),
+        "removed": sorted(set(before) - set(after)),
+        "modified": sorted(
+            path
+            for path in set(before) & set(after)
+            if before[path].get("type") != after[path].get("type")
+            or _leaf_digest(before[path]) != _leaf_digest(after[path])
+        ),
+    }
@@ -0,0 +1,254 @@
+"""Content-addressed object store shared by the template and installer caches.
+
+Files are stored once under ``<root>/<xx>/<sha256>`` and directory snapshots are
+described by small JSON tree manifests that map relative paths to object
+digests, so identical files across cache entries and namespaces share storage.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:  # pragma: no cover
+    import fcntl
+except ImportError:  # pragma: no cover - Windows fallback
+    fcntl = None  # type: ignore
+
+TREE_MANIFEST = ".tree.json"
+TREE_VERSION = 1
+_CHUNK_SIZE = 1024 * 1024
+
+STRATEGIES = ("auto", "reflink", "hardlink", "copy")
+"""Materialisation strategies; ``auto`` tries reflink, then hardlink, then copy."""
+
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl is not None else None
+_OBJECT_MTIME = 0
+_EXECUTABLE_SUFFIX = ".x"
+# Errors meaning "this link/clone method is unavailable here", as opposed to real I/O failures.
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EACCES,
+    errno.EINVAL,
+    errno.EMLINK,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+    errno.ENOSYS,
+}
+
+
+class StoreIntegrityError(RuntimeError):
+    """Raised when a stored object was modified in place (e.g. through a hardlink)."""
+
+
+def object_path(root: Path, digest: str) -> Path:
+    """Return the on-disk location of the object identified by ``digest``."""
+    return root / digest[:2] / digest
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_object(target: Path, source: Path, mode: int) -> None:
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+    os.close(fd)
+    try:
+        shutil.copyfile(source, temp_name)
+        # Objects are shared between entries and must never be modified in place. Pinning
+        # the mtime lets materialise_tree() detect writes made through a hardlink.
+        os.chmod(temp_name, mode)
+        os.utime(temp_name, (_OBJECT_MTIME, _OBJECT_MTIME))
+        os.replace(temp_name, target)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_name)
+        raise
+
+
+def put_file(root: Path, path: Path) -> str:
+    """Store ``path`` in the object store (if not already present) and return its digest."""
+    digest = hash_file(path)
+    target = object_path(root, digest)
+    if target.exists():
+        return digest
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    _write_object(target, path, 0o444)
+    return digest
+
+
+def _iter_tree(source: Path, ignore: Iterable[str]) -> Iterator[os.DirEntry]:
+    ignored = set(ignore)
+    stack: List[Path] = [source]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            children = sorted(entries, key=lambda entry: entry.name)
+        for entry in children:
+            if directory == source and entry.name in ignored:
+                continue
+            yield entry
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(Path(entry.path))
+
+
+def snapshot_tree(root: Path, source: Path, *, ignore: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Ingest every file below ``source`` into the store and return its tree manifest.
+
+    Names in ``ignore`` are skipped at the top level only (e.g. cache sentinels).
+    """
+    entries: List[Dict[str, Any]] = []
+    for entry in _iter_tree(source, ignore):
+        relative = Path(entry.path).relative_to(source).as_posix()
+        if entry.is_symlink():
+            entries.append({"path": relative, "type": "symlink", "target": os.readlink(entry.path)})
+        elif entry.is_dir(follow_symlinks=False):
+            entries.append({"path": relative, "type": "dir"})
+        elif entry.is_file(follow_symlinks=False):
+            mode = stat.S_IMODE(entry.stat(follow_symlinks=False).st_mode)
+            digest = put_file(root, Path(entry.path))
+            entries.append({"path": relative, "type": "file", "digest": digest, "mode": mode})
+    entries.sort(key=lambda item: item["path"])
+    return {"version": TREE_VERSION, "entries": entries}
+
+
+def write_tree(entry_dir: Path, manifest: Dict[str, Any]) -> None:
+    (entry_dir / TREE_MANIFEST).write_text(
+        json.dumps(manifest, sort_keys=True, separators=(",", ":")),
+        encoding="utf-8",
+    )
+
+
+def read_tree(entry_dir: Path) -> Optional[Dict[str, Any]]:
+    """Return the tree manifest stored in ``entry_dir`` or ``None`` for legacy full-copy entries."""
+    manifest_path = entry_dir / TREE_MANIFEST
+    if not manifest_path.is_file():
+        return None
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != TREE_VERSION:
+        return None
+    return manifest
+
+
+def tree_digests(manifest: Dict[str, Any]) -> List[str]:
+    """Return the object digests referenced by ``manifest``."""
+    return [item["digest"] for item in manifest.get("entries", []) if item.get("type") == "file"]
+
+
+def _check_object(source: Path, digest: str) -> None:
+    if os.stat(source).st_mtime == _OBJECT_MTIME:
+        return
+    # The pinned mtime moved: either the object predates pinning or it was written
+    # through a hardlink. Re-verify the content before trusting it again.
+    if hash_file(source) == digest:
+        os.utime(source, (_OBJECT_MTIME, _OBJECT_MTIME))
+        return
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(source)
+    raise StoreIntegrityError(f"Cached object {source.name} was modified in place")
+
+
+def _link_source(root: Path, digest: str, mode: int) -> Path:
+    """Return an object whose permission bits suit ``mode`` when hardlinked."""
+    source = object_path(root, digest)
+    if not mode & 0o111:
+        return source
+    # A hardlink shares the inode mode, so executables link to a 0555 sibling object.
+    variant = source.with_name(source.name + _EXECUTABLE_SUFFIX)
+    if not variant.exists():
+        _write_object(variant, source, 0o555)
+    return variant
+
+
+def _reflink(source: Path, target: Path) -> None:
+    if _FICLONE is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink unsupported on this platform")
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())  # type: ignore[union-attr]
+        except OSError:
+            dst.close()
+            os.unlink(target)
+            raise
+
+
+def _methods_for(strategy: str) -> List[str]:
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown cache strategy '{strategy}' (expected one of {', '.join(STRATEGIES)})")
+    if strategy == "auto":
+        return ["reflink", "hardlink", "copy"]
+    if strategy == "copy":
+        return ["copy"]
+    return [strategy, "copy"]
+
+
+def materialise_tree(
+    root: Path,
+    manifest: Dict[str, Any],
+    destination: Path,
+    *,
+    strategy: str = "copy",
+) -> str:
+    """
+    Recreate the tree described by ``manifest`` below ``destination``.
+
+    Files are cloned (``reflink``), hardlinked to read-only objects (``hardlink``)
+    or byte-copied (``copy``). An unsupported method falls back down that chain
+    once per call; the method the chain settled on is returned. Objects found to
+    be modified in place are quarantined and :class:`StoreIntegrityError` is raised.
+    """
+    methods = _methods_for(strategy)
+    destination.mkdir(parents=True, exist_ok=True)
+    for item in manifest.get("entries", []):
+        target = destination / item["path"]
+        kind = item.get("type")
+        if kind == "dir":
+            target.mkdir(parents=True, exist_ok=True)
+        elif kind == "symlink":
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.symlink(item["target"], target)
+        elif kind == "file":
+            target.parent.mkdir(parents=True, exist_ok=True)
+            mode = item.get("mode", 0o644)
+            source = object_path(root, item["digest"])
+            _check_object(source, item["digest"])
+            while True:
+                method = methods[0]
+                try:
+                    if method == "reflink":
+                        _reflink(source, target)
+                        os.chmod(target, mode)
+                    elif method == "hardlink":
+                        link_source = _link_source(root, item["digest"], mode)
+                        if link_source != source:
+                            _check_object(link_source, item["digest"])
+                        os.link(link_source, target)
+                    else:
+                        shutil.copyfile(source, target)
+                        os.chmod(target, mode)
+                    break
+                except OSError as exc:
+                    if method == "copy" or exc.errno not in _UNSUPPORTED_ERRNOS:
+                        raise
+                    methods.pop(0)
+    return methods[0]
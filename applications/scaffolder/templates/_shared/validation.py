@@ -4,14 +4,22 @@
 This module provides common validation functions used across all templates
 to ensure consistent input validation and error messaging.
 
+Each rule exists in two forms. ``check_*`` functions return an
+:data:`Issue` (or ``None``) and never print or exit, so whole contexts can be
+checked in one pass with :func:`validate_context` / :func:`validate_many`
+(batch generation, test matrices). The ``validate_*`` functions are thin
+shims over them that print and ``sys.exit(1)`` on failure, as the templates'
+pre-generation hooks expect. Patterns are compiled once at import time.
+
 Standards Compliance:
 - NIST SSDF: PO.3 (Security requirements)
 - OWASP SAMM: Security by default
 - ISO/IEC 25010: Quality characteristics
 """
+import functools
 import re
 import sys
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Pattern, Sequence, Tuple
 
 # Approved open source licenses (SPDX identifiers)
 APPROVED_LICENSES = {
@@ -26,72 +34,8 @@ APPROVED_LICENSES = {
     "Unlicense",
 }
 
-
-def validate_project_slug(slug: str, field_name: str = "project_slug") -> bool:
-    """Validate project slug is in kebab-case format.
-
-    Args:
-        slug: The project slug to validate
-        field_name: The name of the field (for error messages)
-
-    Returns:
-        True if valid, exits with error if invalid
-
-    Examples:
-        Valid: my-project, service-123, api-v2
-        Invalid: MyProject, my_project, -project, project-
-    """
-    if not slug:
-        print(f"ERROR: {field_name} cannot be empty")
-        sys.exit(1)
-
-    if not re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", slug):
-        print(f"ERROR: {field_name} '{slug}' must be in kebab-case format")
-        print("  Requirements:")
-        print("    - Must start with a lowercase letter or digit")
-        print("    - Can contain lowercase letters, digits, and hyphens")
-        print("    - Cannot start or end with a hyphen")
-        print("    - Cannot have consecutive hyphens")
-        print("  Examples: my-project, api-service, web-app-v2")
-        sys.exit(1)
-
-    if len(slug) > 64:
-        print(f"ERROR: {field_name} '{slug}' is too long (max 64 characters)")
-        sys.exit(1)
-
-    print(f"✓ Validated {field_name}: {slug}")
-    return True
-
-
-def validate_python_package_name(name: str, field_name: str = "pkg_name") -> bool:
-    """Validate Python package name is a valid identifier.
-
-    Args:
-        name: The package name to validate
-        field_name: The name of the field (for error messages)
-
-    Returns:
-        True if valid, exits with error if invalid
-
-    Examples:
-        Valid: my_package, service_api, webapp
-        Invalid: my-package, 123package, package-name
-    """
-    if not name:
-        print(f"ERROR: {field_name} cannot be empty")
-        sys.exit(1)
-
-    if not re.match(r"^[a-z_][a-z0-9_]*$", name):
-        print(f"ERROR: {field_name} '{name}' must be a valid Python identifier")
-        print("  Requirements:")
-        print("    - Must start with a lowercase letter or underscore")
-        print("    - Can contain lowercase letters, digits, and underscores")
-        print("    - Must use snake_case format")
-        print("  Examples: my_package, api_service, web_app")
-        sys.exit(1)
-
-    # Check for Python reserved keywords
-    reserved = {
+PYTHON_RESERVED = frozenset(
+    {
         "and",
         "as",
         "assert",
@@ -125,10 +69,403 @@ def validate_python_package_name(name: str, field_name: str = "pkg_name") -> boo
         "False",
         "None",
     }
-    if name in reserved:
-        print(f"ERROR: {field_name} '{name}' is a Python reserved keyword")
+)
+
+_SLUG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+_PACKAGE_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+# RFC 5322 simplified pattern
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_LETTER_RE = re.compile(r"[a-zA-Z]")
+# Semantic versioning pattern (simplified)
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(?:-[a-zA-Z0-9.-]+)?(?:\+[a-zA-Z0-9.-]+)?$")
+# Go module path should have at least domain/path
+_GO_MODULE_RE = re.compile(r"^[a-zA-Z0-9.-]+(?:[./][a-zA-Z0-9._-]+)+$")
+_GO_MODULE_SEPARATOR_RE = re.compile(r"[./]")
+_GITHUB_ORG_RE = re.compile(r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$")
+
+Issue = Dict[str, Any]
+"""``{"field", "value", "message", "hints"}`` describing one failed rule.
+
+``message`` is the text the exiting shims print after ``ERROR:``; ``hints``
+are the indented lines printed after it. :func:`validate_context` adds the
+``template`` the context was checked against.
+"""
+
+Rule = Callable[..., Optional[Issue]]
+
+
+def _issue(field_name: str, value: Any, message: str, *hints: str) -> Issue:
+    return {"field": field_name, "value": value, "message": message, "hints": list(hints)}
+
+
+def check_project_slug(slug: str, field_name: str = "project_slug") -> Optional[Issue]:
+    """Return an issue unless ``slug`` is kebab-case (see :func:`validate_project_slug`)."""
+    if not slug:
+        return _issue(field_name, slug, f"{field_name} cannot be empty")
+    if not _SLUG_RE.match(slug):
+        return _issue(
+            field_name,
+            slug,
+            f"{field_name} '{slug}' must be in kebab-case format",
+            "  Requirements:",
+            "    - Must start with a lowercase letter or digit",
+            "    - Can contain lowercase letters, digits, and hyphens",
+            "    - Cannot start or end with a hyphen",
+            "    - Cannot have consecutive hyphens",
+            "  Examples: my-project, api-service, web-app-v2",
+        )
+    if len(slug) > 64:
+        return _issue(field_name, slug, f"{field_name} '{slug}' is too long (max 64 characters)")
+    return None
+
+
+def check_python_package_name(name: str, field_name: str = "pkg_name") -> Optional[Issue]:
+    """Return an issue unless ``name`` is a snake_case, non-reserved Python identifier."""
+    if not name:
+        return _issue(field_name, name, f"{field_name} cannot be empty")
+    if not _PACKAGE_RE.match(name):
+        return _issue(
+            field_name,
+            name,
+            f"{field_name} '{name}' must be a valid Python identifier",
+            "  Requirements:",
+            "    - Must start with a lowercase letter or underscore",
+            "    - Can contain lowercase letters, digits, and underscores",
+            "    - Must use snake_case format",
+            "  Examples: my_package, api_service, web_app",
+        )
+    if name in PYTHON_RESERVED:
+        return _issue(field_name, name, f"{field_name} '{name}' is a Python reserved keyword")
+    return None
+
+
+def check_email(email: str, field_name: str = "email") -> Optional[Issue]:
+    """Return an issue unless ``email`` looks like an email address."""
+    if not email:
+        return _issue(field_name, email, f"{field_name} cannot be empty")
+    if not _EMAIL_RE.match(email):
+        return _issue(
+            field_name,
+            email,
+            f"{field_name} '{email}' is not a valid email address",
+            "  Examples: user@example.com, dev.team@company.io",
+        )
+    return None
+
+
+def check_author_name(name: str, field_name: str = "author_name") -> Optional[Issue]:
+    """Return an issue unless ``name`` is 2-100 characters with at least one letter."""
+    if not name or not name.strip():
+        return _issue(field_name, name, f"{field_name} cannot be empty")
+    if len(name.strip()) < 2:
+        return _issue(field_name, name, f"{field_name} '{name}' is too short (minimum 2 characters)")
+    if len(name) > 100:
+        return _issue(field_name, name, f"{field_name} '{name}' is too long (max 100 characters)")
+    # Check for suspicious patterns (all special characters, etc.)
+    if not _LETTER_RE.search(name):
+        return _issue(field_name, name, f"{field_name} '{name}' must contain at least one letter")
+    return None
+
+
+def check_license(
+    license_id: str,
+    field_name: str = "license",
+    approved: Iterable[str] = APPROVED_LICENSES,
+    extra_approved: Iterable[str] = (),
+) -> Optional[Issue]:
+    """Return an issue unless ``license_id`` is one of the ``approved`` (plus ``extra_approved``) SPDX ids."""
+    if not license_id:
+        return _issue(field_name, license_id, f"{field_name} cannot be empty")
+    approved = set(approved) | set(extra_approved)
+    if license_id not in approved:
+        return _issue(
+            field_name,
+            license_id,
+            f"{license_id} is not an approved license",
+            f"  Approved licenses: {', '.join(sorted(approved))}",
+            "  See: https://spdx.org/licenses/",
+        )
+    return None
+
+
+def check_version(version: str, field_name: str = "version") -> Optional[Issue]:
+    """Return an issue unless ``version`` is a semantic version."""
+    if not version:
+        return _issue(field_name, version, f"{field_name} cannot be empty")
+    if not _SEMVER_RE.match(version):
+        return _issue(
+            field_name,
+            version,
+            f"{field_name} '{version}' is not a valid semantic version",
+            "  Format: MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD]",
+            "  Examples: 1.0.0, 2.1.3, 1.0.0-beta.1, 1.0.0+20130313",
+        )
+    return None
+
+
+def check_go_module_path(module_path: str, field_name: str = "module_path") -> Optional[Issue]:
+    """Return an issue unless ``module_path`` looks like ``domain/path``."""
+    if not module_path:
+        return _issue(field_name, module_path, f"{field_name} cannot be empty")
+    if not _GO_MODULE_RE.match(module_path):
+        return _issue(
+            field_name,
+            module_path,
+            f"{field_name} '{module_path}' is not a valid Go module path",
+            "  Format: domain.com/path/to/module",
+            "  Examples: github.com/user/project, example.com/my/module",
+        )
+    # Check for minimum components (at least 2 parts)
+    if len(_GO_MODULE_SEPARATOR_RE.split(module_path)) < 2:
+        return _issue(field_name, module_path, f"{field_name} '{module_path}' must have at least domain and path")
+    return None
+
+
+def check_github_org(org: str, field_name: str = "github_org") -> Optional[Issue]:
+    """Return an issue unless ``org`` is a valid GitHub user or organisation name."""
+    if not org:
+        return _issue(field_name, org, f"{field_name} cannot be empty")
+    if not _GITHUB_ORG_RE.match(org):
+        return _issue(field_name, org, f"Invalid {field_name} '{org}'. Must be a valid GitHub organization name.")
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(pattern: str) -> Pattern[str]:
+    return re.compile(pattern)
+
+
+def check_pattern(
+    value: str,
+    field_name: str,
+    pattern: str,
+    message: str = "{field} '{value}' has an invalid format",
+    hints: Iterable[str] = (),
+) -> Optional[Issue]:
+    """Return an issue unless ``value`` matches ``pattern`` (``message`` may use ``{field}``/``{value}``)."""
+    if not _compile(pattern).match(value):
+        return _issue(field_name, value, message.format(field=field_name, value=value), *hints)
+    return None
+
+
+def check_description(
+    description: str,
+    field_name: str = "description",
+    min_length: int = 10,
+    max_length: int = 500,
+) -> Optional[Issue]:
+    """Return an issue unless ``description`` is between ``min_length`` and ``max_length`` characters."""
+    if not description or not description.strip():
+        return _issue(
+            field_name,
+            description,
+            f"{field_name} cannot be empty",
+            f"  Please provide a brief description (at least {min_length} characters)",
+        )
+    desc_length = len(description.strip())
+    if desc_length < min_length:
+        return _issue(
+            field_name,
+            description,
+            f"{field_name} is too short ({desc_length} chars, minimum {min_length})",
+            "  Please provide a more detailed description",
+        )
+    if desc_length > max_length:
+        return _issue(
+            field_name,
+            description,
+            f"{field_name} is too long ({desc_length} chars, maximum {max_length})",
+            "  Please provide a more concise description",
+        )
+    return None
+
+
+RULES: Dict[str, Rule] = {
+    "project_slug": check_project_slug,
+    "python_package_name": check_python_package_name,
+    "email": check_email,
+    "author_name": check_author_name,
+    "license": check_license,
+    "version": check_version,
+    "go_module_path": check_go_module_path,
+    "github_org": check_github_org,
+    "description": check_description,
+    "pattern": check_pattern,
+}
+"""Rule names usable in a template's manifest ``validation`` list."""
+
+# Fallback for templates without a manifest ``validation`` list: rules by variable name.
+FIELD_RULES: Dict[str, Rule] = {
+    "project_slug": check_project_slug,
+    "pkg_name": check_python_package_name,
+    "module_path": check_go_module_path,
+    "author_name": check_author_name,
+    "author_email": check_email,
+    "license": check_license,
+    "description": check_description,
+    "project_description": check_description,
+}
+
+
+def compile_rules(spec: Sequence[Mapping[str, Any]]) -> Dict[str, Rule]:
+    """
+    Turn a manifest ``validation`` list into ``{variable: rule}`` in declaration order.
+
+    Each item names a ``variable`` and a ``rule`` from :data:`RULES`; any other
+    keys are passed to the rule as options (e.g. ``extra_approved`` for
+    ``license``, ``pattern``/``message`` for ``pattern``).
+    """
+    compiled: Dict[str, Rule] = {}
+    for item in spec:
+        options = dict(item)
+        variable = options.pop("variable", None)
+        rule_name = options.pop("rule", None)
+        if not variable or rule_name not in RULES:
+            raise ValueError(f"Invalid validation rule {dict(item)!r}: expected 'variable' and one of {sorted(RULES)}")
+        rule = RULES[rule_name]
+        compiled[str(variable)] = functools.partial(rule, **options) if options else rule
+    return compiled
+
+
+@functools.lru_cache(maxsize=None)
+def _manifest_rules(template: str) -> Optional[Dict[str, Rule]]:
+    try:
+        from .manifest import get_template_config  # pylint: disable=import-outside-toplevel
+
+        spec = get_template_config(template).get("validation")
+    except (ImportError, KeyError, OSError):  # run as a script, no manifest, or an unknown template
+        return None
+    return compile_rules(spec) if spec else None
+
+
+def rules_for(template: Optional[str]) -> Dict[str, Rule]:
+    """
+    Return the rules for ``template``: its manifest ``validation`` list, else :data:`FIELD_RULES`.
+
+    The manifest comes from the marshal snapshot :mod:`manifest` keeps, and the
+    compiled table is memoised per process.
+    """
+    compiled = _manifest_rules(template) if template else None
+    return FIELD_RULES if compiled is None else compiled
+
+
+def _check_fields(
+    template: Optional[str],
+    context: Mapping[str, Any],
+    rules: Mapping[str, Rule],
+    memo: Optional[Dict[Tuple[int, str, str], Optional[Issue]]] = None,
+) -> List[Issue]:
+    issues: List[Issue] = []
+    for field_name, rule in rules.items():
+        if field_name not in context:
+            continue
+        value = str(context[field_name])
+        key = (id(rule), field_name, value)
+        if memo is not None and key in memo:
+            issue = memo[key]
+        else:
+            issue = rule(value, field_name)
+            if memo is not None:
+                memo[key] = issue
+        if issue is not None:
+            issues.append({**issue, "template": template, "hints": list(issue["hints"])})
+    return issues
+
+
+def validate_context(template: Optional[str], context: Mapping[str, Any]) -> List[Issue]:
+    """
+    Check every known field of ``context`` in one pass without printing or exiting.
+
+    Fields without a rule are ignored; values are compared as strings, the
+    way Cookiecutter renders them into the hooks. Returns one issue per
+    failing field, in rule order (empty when the context is valid).
+    """
+    return _check_fields(template, context, rules_for(template))
+
+
+def validate_many(contexts: Iterable[Tuple[Optional[str], Mapping[str, Any]]]) -> List[List[Issue]]:
+    """
+    Validate ``(template, context)`` pairs; returns one issue list per pair, in order.
+
+    Rule tables are resolved once per template and each distinct
+    ``(rule, field, value)`` is checked once, so shared values (licenses,
+    authors, emails) across thousands of contexts cost a dictionary lookup.
+    """
+    tables: Dict[Optional[str], Dict[str, Rule]] = {}
+    memo: Dict[Tuple[int, str, str], Optional[Issue]] = {}
+    results: List[List[Issue]] = []
+    for template, context in contexts:
+        rules = tables.get(template)
+        if rules is None:
+            rules = tables[template] = rules_for(template)
+        results.append(_check_fields(template, context, rules, memo))
+    return results
+
+
+def _print_issue(issue: Issue) -> None:
+    print(f"ERROR: {issue['message']}")
+    for hint in issue["hints"]:
+        print(hint)
+
+
+def _exit_on(issue: Optional[Issue]) -> None:
+    if issue is None:
+        return
+    _print_issue(issue)
+    sys.exit(1)
+
+
+def run_pre_gen(template: str, context: Mapping[str, Any]) -> None:
+    """
+    Validate a Cookiecutter context for ``template`` from a ``pre_gen_project`` hook.
+
+    Every failing variable is reported before exiting with status 1, so one
+    run shows all problems; on success a summary of the checked values is printed.
+    """
+    rules = rules_for(template)
+    issues = _check_fields(template, context, rules)
+    if issues:
+        for issue in issues:
+            _print_issue(issue)
         sys.exit(1)
+    checked = [field_name for field_name in rules if field_name in context]
+    print_validation_summary([f"{field_name}: {str(context[field_name])[:50]}" for field_name in checked])
+
+
+def validate_project_slug(slug: str, field_name: str = "project_slug") -> bool:
+    """Validate project slug is in kebab-case format.
+
+    Args:
+        slug: The project slug to validate
+        field_name: The name of the field (for error messages)
+
+    Returns:
+        True if valid, exits with error if invalid
+
+    Examples:
+        Valid: my-project, service-123, api-v2
+        Invalid: MyProject, my_project, -project, project-
+    """
+    _exit_on(check_project_slug(slug, field_name))
+    print(f"✓ Validated {field_name}: {slug}")
+    return True
+
+
+def validate_python_package_name(name: str, field_name: str = "pkg_name") -> bool:
+    """Validate Python package name is a valid identifier.
+
+    Args:
+        name: The package name to validate
+        field_name: The name of the field (for error messages)
+
+    Returns:
+        True if valid, exits with error if invalid
 
+    Examples:
+        Valid: my_package, service_api, webapp
+        Invalid: my-package, 123package, package-name
+    """
+    _exit_on(check_python_package_name(name, field_name))
     print(f"✓ Validated {field_name}: {name}")
     return True
 
@@ -143,17 +480,7 @@ def validate_email(email: str, field_name: str = "email") -> bool:
     Returns:
         True if valid, exits with error if invalid
     """
-    if not email:
-        print(f"ERROR: {field_name} cannot be empty")
-        sys.exit(1)
-
-    # RFC 5322 simplified pattern
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(pattern, email):
-        print(f"ERROR: {field_name} '{email}' is not a valid email address")
-        print("  Examples: user@example.com, dev.team@company.io")
-        sys.exit(1)
-
+    _exit_on(check_email(email, field_name))
     print(f"✓ Validated {field_name}: {email}")
     return True
 
@@ -168,25 +495,7 @@ def validate_author_name(name: str, field_name: str = "author_name") -> bool:
     Returns:
         True if valid, exits with error if invalid
     """
-    if not name or not name.strip():
-        print(f"ERROR: {field_name} cannot be empty")
-        sys.exit(1)
-
-    # Check for minimum length
-    if len(name.strip()) < 2:
-        print(f"ERROR: {field_name} '{name}' is too short (minimum 2 characters)")
-        sys.exit(1)
-
-    # Check for maximum length
-    if len(name) > 100:
-        print(f"ERROR: {field_name} '{name}' is too long (max 100 characters)")
-        sys.exit(1)
-
-    # Check for suspicious patterns (all special characters, etc.)
-    if not re.search(r"[a-zA-Z]", name):
-        print(f"ERROR: {field_name} '{name}' must contain at least one letter")
-        sys.exit(1)
-
+    _exit_on(check_author_name(name, field_name))
     print(f"✓ Validated {field_name}: {name}")
     return True
 
@@ -201,16 +510,7 @@ def validate_license(license_id: str, field_name: str = "license") -> bool:
     Returns:
         True if valid, exits with error if invalid
     """
-    if not license_id:
-        print(f"ERROR: {field_name} cannot be empty")
-        sys.exit(1)
-
-    if license_id not in APPROVED_LICENSES:
-        print(f"ERROR: {license_id} is not an approved license")
-        print(f"  Approved licenses: {', '.join(sorted(APPROVED_LICENSES))}")
-        print("  See: https://spdx.org/licenses/")
-        sys.exit(1)
-
+    _exit_on(check_license(license_id, field_name))
     print(f"✓ Validated {field_name}: {license_id}")
     return True
 
@@ -225,18 +525,7 @@ def validate_version(version: str, field_name: str = "version") -> bool:
     Returns:
         True if valid, exits with error if invalid
     """
-    if not version:
-        print(f"ERROR: {field_name} cannot be empty")
-        sys.exit(1)
-
-    # Semantic versioning pattern (simplified)
-    pattern = r"^\d+\.\d+\.\d+(?:-[a-zA-Z0-9.-]+)?(?:\+[a-zA-Z0-9.-]+)?$"
-    if not re.match(pattern, version):
-        print(f"ERROR: {field_name} '{version}' is not a valid semantic version")
-        print("  Format: MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD]")
-        print("  Examples: 1.0.0, 2.1.3, 1.0.0-beta.1, 1.0.0+20130313")
-        sys.exit(1)
-
+    _exit_on(check_version(version, field_name))
     print(f"✓ Validated {field_name}: {version}")
     return True
 
@@ -255,24 +544,7 @@ def validate_go_module_path(module_path: str, field_name: str = "module_path") -
         Valid: github.com/user/project, example.com/my/module
         Invalid: github.com, not-a-url
     """
-    if not module_path:
-        print(f"ERROR: {field_name} cannot be empty")
-        sys.exit(1)
-
-    # Go module path should have at least domain/path
-    pattern = r"^[a-zA-Z0-9.-]+(?:[./][a-zA-Z0-9._-]+)+$"
-    if not re.match(pattern, module_path):
-        print(f"ERROR: {field_name} '{module_path}' is not a valid Go module path")
-        print("  Format: domain.com/path/to/module")
-        print("  Examples: github.com/user/project, example.com/my/module")
-        sys.exit(1)
-
-    # Check for minimum components (at least 2 parts)
-    parts = re.split(r"[./]", module_path)
-    if len(parts) < 2:
-        print(f"ERROR: {field_name} '{module_path}' must have at least domain and path")
-        sys.exit(1)
-
+    _exit_on(check_go_module_path(module_path, field_name))
     print(f"✓ Validated {field_name}: {module_path}")
     return True
 
@@ -294,29 +566,7 @@ def validate_description(
     Returns:
         True if valid, exits with error if invalid
     """
-    if not description or not description.strip():
-        print(f"ERROR: {field_name} cannot be empty")
-        print(
-            f"  Please provide a brief description (at least {min_length} characters)"
-        )
-        sys.exit(1)
-
-    desc_length = len(description.strip())
-
-    if desc_length < min_length:
-        print(
-            f"ERROR: {field_name} is too short ({desc_length} chars, minimum {min_length})"
-        )
-        print("  Please provide a more detailed description")
-        sys.exit(1)
-
-    if desc_length > max_length:
-        print(
-            f"ERROR: {field_name} is too long ({desc_length} chars, maximum {max_length})"
-        )
-        print("  Please provide a more concise description")
-        sys.exit(1)
-
+    _exit_on(check_description(description, field_name, min_length, max_length))
     print(
         f"✓ Validated {field_name}: {description[:50]}{'...' if len(description) > 50 else ''}"
     )
@@ -1,6 +1,7 @@
 """Post-generation setup hook for project-management template."""
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -40,7 +41,8 @@ def run_command(cmd: list[str], description: str) -> bool:
 
 
 def setup_git_repo() -> None:
-    if hooks.should_suppress_messages():
+    # Cached renders stay git-free; render_project initialises the real project.
+    if hooks.should_suppress_messages() or os.environ.get("AGENTIC_CANON_SKIP_GIT_INIT"):
         return
     print("\n🚀 Setting up project management automation...\n")
     if not (PROJECT_ROOT / ".git").exists():
@@ -1,47 +1,21 @@
-"""Pre-generation validation hook for project-management template."""
+#!/usr/bin/env python3
+"""Pre-generation validation for project-management template.
 
-import re
+The rules for each variable are declared under ``validation`` for this
+template in ``templates/manifest.yaml`` and run by the shared validator.
+"""
+import json
 import sys
+from pathlib import Path
 
+# cookiecutter's _template may be relative to another working directory, so
+# fall back to this hook's own location when it does not lead to _shared.
+for TEMPLATE_ROOT in (Path({{ cookiecutter._template | tojson }}).resolve(), Path(__file__).resolve().parents[1]):
+    if (TEMPLATE_ROOT.parent / "_shared").is_dir():
+        sys.path.insert(0, str(TEMPLATE_ROOT.parent))
+        break
 
-def validate_project_slug(slug: str) -> bool:
-    """Validate project slug is kebab-case."""
-    pattern = r"^[a-z][a-z0-9-]*[a-z0-9]$"
-    return bool(re.match(pattern, slug))
+from _shared import validation  # type: ignore  # pylint: disable=wrong-import-position
 
-
-def validate_github_org(org: str) -> bool:
-    """Validate GitHub organization name."""
-    pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$"
-    return bool(re.match(pattern, org))
-
-
-def main():
-    """Run pre-generation validation."""
-    project_slug = "{{ cookiecutter.project_slug }}"
-    github_org = "{{ cookiecutter.github_org }}"
-
-    errors = []
-
-    if not validate_project_slug(project_slug):
-        errors.append(
-            f"Invalid project_slug '{project_slug}'. "
-            "Must be lowercase kebab-case (e.g., 'my-project')."
-        )
-
-    if not validate_github_org(github_org):
-        errors.append(
-            f"Invalid github_org '{github_org}'. "
-            "Must be a valid GitHub organization name."
-        )
-
-    if errors:
-        for error in errors:
-            print(f"ERROR: {error}", file=sys.stderr)
-        sys.exit(1)
-
-    print("✅ Validation passed")
-
-
-if __name__ == "__main__":
-    main()
+# tojson emits an escaped string literal, so quotes and backslashes in answers stay intact.
+validation.run_pre_gen("project-management", json.loads({{ cookiecutter | jsonify | tojson }}))
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import shutil
+import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, Mapping, Sequence, cast
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, cast
 
 import nox  # type: ignore[import]
 
@@ -29,6 +32,7 @@ REPO_ROOT = Path(__file__).parent.resolve()
 APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
 RENDER_ROOT = APPLICATIONS_ROOT / "build" / "template-renders"
 RENDER_INDEX = RENDER_ROOT / "index.json"
+RENDER_LOGS = RENDER_ROOT / "_logs"
 TRUNK_SCRIPT = REPO_ROOT / ".dev" / "trunk-with-progress.sh"
 TRUNK_BIN = Path.home() / ".cache" / "trunk" / "bin" / "trunk"
 SYNC_MANIFEST_SCRIPT = REPO_ROOT / ".dev" / "scripts" / "sync-manifest.py"
@@ -80,6 +84,18 @@ def _arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("--context", action="append", dest="contexts")
     parser.add_argument("--feature", action="append", dest="features")
     parser.add_argument("--force", action="store_true")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Patch the previous render of each context when only template files changed.",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of parallel workers (0 = one per CPU).",
+    )
     return parser
 
 
@@ -193,6 +209,7 @@ def _run_installers(
     cache_cfg: Mapping[str, object] | None,
     *,
     force: bool,
+    strategy: str | None = None,
 ) -> None:
     if not cache_cfg:
         return
@@ -220,7 +237,13 @@ def _run_installers(
             with session.chdir(str(path)):
                 session.run(*command, external=True)
 
-        cache_utils.cache_node_modules(project_path, key_material, _node_installer, force=force)
+        cache_utils.cache_node_modules(
+            project_path,
+            key_material,
+            _node_installer,
+            force=force,
+            strategy=strategy,
+        )
 
     # Python / pip dependencies
     pip_cfg = installers.get("pip")
@@ -235,7 +258,13 @@ def _run_installers(
             with session.chdir(str(path)):
                 session.run(*command, external=True)
 
-        cache_utils.cache_pip_install(project_path, key_material, _pip_installer, force=force)
+        cache_utils.cache_pip_install(
+            project_path,
+            key_material,
+            _pip_installer,
+            force=force,
+            strategy=strategy,
+        )
 
     # Go module downloads
     go_cfg = installers.get("go")
@@ -253,7 +282,13 @@ def _run_installers(
             with session.chdir(str(path)):
                 session.run(*command, external=True, env=env)
 
-        cache_utils.cache_go_modules(project_path, key_material, _go_installer, force=force)
+        cache_utils.cache_go_modules(
+            project_path,
+            key_material,
+            _go_installer,
+            force=force,
+            strategy=strategy,
+        )
 
 
 @nox.session
@@ -306,8 +341,9 @@ def render_templates(session: nox.Session) -> None:
                         if candidate not in sys.path:
                             sys.path.insert(0, candidate)
 
-        from cookiecutter.main import cookiecutter  # type: ignore[import]  # pylint: disable=import-outside-toplevel
         from templates._shared import cache as cache_utils  # pylint: disable=import-outside-toplevel
+        from templates._shared import render as render_utils  # pylint: disable=import-outside-toplevel
+        from templates._shared import store as store_utils  # pylint: disable=import-outside-toplevel
 
         templates = _load_manifest_templates()
         targets = list(_iter_render_targets(templates, args))
@@ -321,45 +357,40 @@ def render_templates(session: nox.Session) -> None:
         session.env.setdefault("AGENTIC_CANON_SKIP_GIT_INIT", "1")
         session.env.setdefault("AGENTIC_CANON_SKIP_MESSAGES", "1")
 
+        render_targets: list[render_utils.RenderTarget] = []
         for template_name, context_name, extra_context, template_cfg in targets:
             root_value_obj = template_cfg.get("root")  # type: ignore[call-overload]
             if not isinstance(root_value_obj, str):
                 session.error(f"Template '{template_name}' is missing a valid 'root' path")
-            template_root = Path(cast(str, root_value_obj))
-            session.log(f"Rendering template '{template_name}' context '{context_name}'")
-
-            context_payload = dict(extra_context)
-            slug_value = str(context_payload.get("project_slug") or template_name)
-
-            def _produce(destination: Path, *,
-                         cookiecutter_func=cookiecutter,
-                         template_root_path=template_root,
-                         payload=context_payload,
-                         slug=slug_value) -> None:
-                cookiecutter(
-                    str(template_root_path),
-                    no_input=True,
-                    extra_context=payload,
-                    output_dir=str(destination),
-                )
-                generated = destination / slug
-                if generated.exists():
-                    for item in generated.iterdir():
-                        shutil.move(str(item), destination)
-                    shutil.rmtree(generated)
-
-            cache_dir = cache_utils.prime_template_cache(
-                template_name,
-                extra_context,
-                _produce,
-                force=args.force,
-            )
+            render_targets.append((template_name, Path(cast(str, root_value_obj)), extra_context))
+
+        jobs = render_utils.resolve_jobs(args.jobs)
+        session.log(f"Rendering {len(render_targets)} template context(s) with {jobs} worker(s)")
+        cache_dirs = render_utils.render_many(
+            render_targets,
+            jobs=jobs,
+            force=args.force,
+            incremental=args.incremental,
+        )
 
+        # Materialise renders and run installers in manifest order so index.json is stable.
+        for target, render_target, cache_dir in zip(targets, render_targets, cache_dirs):
+            template_name, context_name, _context, template_cfg = target
+            session.log(f"Rendered template '{template_name}' context '{context_name}'")
             render_path = RENDER_ROOT / template_name / context_name
-            cache_utils.copy_from_cache(cache_dir, render_path)
+            strategy = cache_utils.resolve_strategy(template_name)
+            # lint_templates/format_templates run Trunk in these directories and edit files in place.
+            render_strategy = cache_utils.editable_strategy(strategy)
+            try:
+                cache_utils.copy_from_cache(cache_dir, render_path, strategy=render_strategy, existing="replace")
+            except (store_utils.StoreIntegrityError, FileNotFoundError) as exc:
+                # The entry was tampered with or evicted by a concurrent `cache_gc` run.
+                session.warn(f"{exc}; re-rendering '{template_name}' context '{context_name}'")
+                cache_dir = render_utils.render_cached(*render_target)
+                cache_utils.copy_from_cache(cache_dir, render_path, strategy=render_strategy, existing="replace")
             cache_cfg = template_cfg.get("cache", {}) if isinstance(template_cfg, Mapping) else {}
             if isinstance(cache_cfg, Mapping):
-                _run_installers(session, render_path, cache_cfg, force=args.force)
+                _run_installers(session, render_path, cache_cfg, force=args.force, strategy=strategy)
 
             index.append(
                 {
@@ -397,6 +428,8 @@ def _copy_trunk_configuration(project_path: Path, template_cfg: Mapping[str, obj
         return
 
     target_trunk = project_path / ".trunk"
+    if target_trunk.is_symlink() and Path(os.readlink(target_trunk)) == trunk_root:
+        return
     if target_trunk.exists():
         if target_trunk.is_symlink():
             target_trunk.unlink()
@@ -408,9 +441,82 @@ def _copy_trunk_configuration(project_path: Path, template_cfg: Mapping[str, obj
         shutil.copytree(trunk_root, target_trunk, dirs_exist_ok=True)
 
 
+_GIT_SKELETONS: Dict[str, Path] = {}
+
+
+def _git_skeleton(session: nox.Session, default_branch: str) -> Path:
+    """
+    Return a ``.git`` directory holding one empty commit on ``default_branch``.
+
+    It is built once per process with a fixed identity and dates (so the commit
+    id is stable) and copied into each render.
+    """
+    cached = _GIT_SKELETONS.get(default_branch)
+    if cached is not None and cached.is_dir():
+        return cached
+
+    import atexit  # pylint: disable=import-outside-toplevel
+    import tempfile  # pylint: disable=import-outside-toplevel
+
+    workdir = Path(tempfile.mkdtemp(prefix="agentic-canon-git-skeleton-"))
+    atexit.register(shutil.rmtree, workdir, True)
+    env = {
+        "GIT_AUTHOR_NAME": "Template Bot",
+        "GIT_AUTHOR_EMAIL": "template@example.com",
+        "GIT_AUTHOR_DATE": "2000-01-01T00:00:00+0000",
+        "GIT_COMMITTER_NAME": "Template Bot",
+        "GIT_COMMITTER_EMAIL": "template@example.com",
+        "GIT_COMMITTER_DATE": "2000-01-01T00:00:00+0000",
+    }
+    with session.chdir(str(workdir)):
+        session.run("git", "init", "-q", external=True)
+        session.run("git", "symbolic-ref", "HEAD", f"refs/heads/{default_branch}", external=True)
+        session.run("git", "config", "user.name", "Template Bot", external=True)
+        session.run("git", "config", "user.email", "template@example.com", external=True)
+        session.run(
+            "git",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "Initial commit",
+            external=True,
+            env=env,
+        )
+    skeleton = workdir / ".git"
+    # Sample hooks are the bulk of a fresh repo and nothing runs them.
+    for sample in (skeleton / "hooks").glob("*.sample"):
+        sample.unlink()
+    _GIT_SKELETONS[default_branch] = skeleton
+    return skeleton
+
+
+def _has_head_commit(git_dir: Path, default_branch: str) -> bool:
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return False
+    if head != f"ref: refs/heads/{default_branch}":
+        return False
+    if (git_dir / "refs" / "heads" / default_branch).exists():
+        return True
+    packed = git_dir / "packed-refs"
+    if not packed.is_file():
+        return False
+    ref = f" refs/heads/{default_branch}"
+    return any(line.endswith(ref) for line in packed.read_text(encoding="utf-8").splitlines())
+
+
 def _ensure_git_repo(session: nox.Session, project_path: Path, default_branch: str = "main") -> None:
+    git_dir = project_path / ".git"
+    if not git_dir.exists():
+        shutil.copytree(_git_skeleton(session, default_branch), git_dir, symlinks=True)
+        return
+    if _has_head_commit(git_dir, default_branch):
+        return
+
+    # A repository without a commit on the default branch (e.g. left by a template hook).
     with session.chdir(str(project_path)):
-        session.run("git", "init", "-q", external=True)
         session.run(
             "git",
             "symbolic-ref",
@@ -418,112 +524,286 @@ def _ensure_git_repo(session: nox.Session, project_path: Path, default_branch: s
             f"refs/heads/{default_branch}",
             external=True,
         )
-        head_ref = project_path / ".git" / "refs" / "heads" / default_branch
-        if not head_ref.exists():
-            session.run("git", "config", "user.name", "Template Bot", external=True)
-            session.run(
-                "git", "config", "user.email", "template@example.com", external=True
-            )
-            session.run(
-                "git",
-                "commit",
-                "--allow-empty",
-                "-m",
-                "Initial commit",
-                external=True,
-            )
+        session.run("git", "config", "user.name", "Template Bot", external=True)
+        session.run("git", "config", "user.email", "template@example.com", external=True)
+        session.run(
+            "git",
+            "commit",
+            "--allow-empty",
+            "-m",
+            "Initial commit",
+            external=True,
+        )
 
 
-@nox.session
-def lint_templates(session: nox.Session) -> None:
-    """Run Trunk checks across rendered template variants."""
-    with _session_timer(session, "lint_templates"):
-        parser = _arg_parser()
-        args = parser.parse_args(session.posargs)
+def _clean_state_path() -> Path:
+    from templates._shared import cache as cache_utils  # pylint: disable=import-outside-toplevel
 
-        templates = _load_manifest_templates()
-        entries = _load_render_index()
-        if not entries:
-            session.error("No rendered templates found. Run `nox -s render_templates` first.")
+    return cache_utils.CACHE_ROOT / "lint" / "clean.json"
 
-        _ensure_trunk(session)
 
-        for entry in entries:
-            template_name = entry["template"]
-            context_name = entry["context"]
-            if args.templates and template_name not in args.templates:
-                continue
-            if args.contexts and context_name not in args.contexts:
-                continue
+def _load_clean_state() -> Dict[str, str]:
+    try:
+        data = json.loads(_clean_state_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {str(key): str(value) for key, value in data.items()} if isinstance(data, dict) else {}
 
-            project_path = Path(entry["path"])
-            if not project_path.exists():
-                session.warn(f"Rendered project missing at {project_path}; skipping.")
-                continue
 
-            template_cfg = templates.get(template_name, {})
-            _copy_trunk_configuration(project_path, template_cfg)
-            _ensure_git_repo(session, project_path)
+def _save_clean_state(state: Mapping[str, str]) -> None:
+    path = _clean_state_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}")
+    temp_path.write_text(json.dumps(dict(state), indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(temp_path, path)
 
-            session.log(f"[lint] {template_name} :: {context_name}")
-            with session.chdir(str(project_path)):
-                session.run(
-                    str(TRUNK_SCRIPT),
-                    "check",
-                    "--all",
-                    external=True,
-                )
 
+def _trunk_config_digest() -> str:
+    digest = hashlib.sha256()
+    trunk_root = REPO_ROOT / ".trunk"
+    candidates = [trunk_root / "trunk.yaml"]
+    configs = trunk_root / "configs"
+    if configs.is_dir():
+        candidates.extend(sorted(path for path in configs.rglob("*") if path.is_file()))
+    for path in candidates:
+        if path.is_file():
+            digest.update(path.relative_to(trunk_root).as_posix().encode("utf-8") + b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _variant_digest(entry: Mapping[str, str], template_cfg: Mapping[str, object], action: str) -> Optional[str]:
+    """
+    Fingerprint what a Trunk run over ``entry`` depends on, or ``None`` if unknown.
+
+    Rendered content is identified by the tree manifest of the render cache entry
+    recorded in ``index.json``; renders without one are never skipped.
+    """
+    from templates._shared import store as store_utils  # pylint: disable=import-outside-toplevel
+
+    cache_dir = entry.get("cache_dir")
+    manifest = store_utils.read_tree(Path(cache_dir)) if cache_dir else None
+    if manifest is None:
+        return None
+    digest = hashlib.sha256()
+    digest.update(action.encode("utf-8") + b"\0")
+    digest.update(json.dumps(manifest, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    digest.update(json.dumps(template_cfg.get("trunk", {}), sort_keys=True, default=str).encode("utf-8"))
+    digest.update(_trunk_config_digest().encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _restore_render(entry: Mapping[str, str]) -> bool:
+    """
+    Overwrite the render's files in ``entry["path"]`` with the cache entry they came from.
+
+    A previous ``trunk fmt`` may have edited the worktree; merging the entry back
+    (rather than replacing the directory) keeps installer outputs such as
+    ``node_modules``. Returns ``False`` when the entry can no longer be restored.
+    """
+    from templates._shared import cache as cache_utils  # pylint: disable=import-outside-toplevel
+    from templates._shared import store as store_utils  # pylint: disable=import-outside-toplevel
 
-@nox.session
-def format_templates(session: nox.Session) -> None:
-    """Format rendered templates and fail if formatting introduces changes."""
-    with _session_timer(session, "format_templates"):
-        parser = _arg_parser()
-        args = parser.parse_args(session.posargs)
+    strategy = cache_utils.editable_strategy(cache_utils.resolve_strategy(entry["template"]))
+    try:
+        cache_utils.copy_from_cache(Path(entry["cache_dir"]), Path(entry["path"]), strategy=strategy, existing="merge")
+    except (store_utils.StoreIntegrityError, FileNotFoundError, OSError):
+        return False
+    return True
+
+
+def _matches_entry(project_path: Path, cache_dir: Path) -> bool:
+    """True when every file and symlink of the cache entry's tree is byte-identical in ``project_path``."""
+    from templates._shared import store as store_utils  # pylint: disable=import-outside-toplevel
+
+    manifest = store_utils.read_tree(cache_dir)
+    if manifest is None:
+        return False
+    for item in manifest.get("entries", []):
+        path = project_path / item["path"]
+        try:
+            if item["type"] == "file" and (path.is_symlink() or store_utils.hash_file(path) != item["digest"]):
+                return False
+            if item["type"] == "symlink" and os.readlink(path) != item["target"]:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _run_trunk_variant(
+    project_path: Path,
+    action: str,
+    env: Mapping[str, str],
+    log_path: Optional[Path],
+) -> Optional[str]:
+    """Run ``trunk <action> --all`` in ``project_path``; return a failure reason or ``None``."""
+    log_handle = None
+    if log_path is not None:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_handle = log_path.open("w", encoding="utf-8")
+    try:
 
-        templates = _load_manifest_templates()
-        entries = _load_render_index()
-        if not entries:
-            session.error("No rendered templates found. Run `nox -s render_templates` first.")
+        def _run(*command: str) -> subprocess.CompletedProcess:
+            return subprocess.run(
+                list(command),
+                cwd=project_path,
+                env=dict(env),
+                stdout=log_handle,
+                stderr=subprocess.STDOUT if log_handle is not None else None,
+                check=False,
+            )
 
-        _ensure_trunk(session)
+        if action == "fmt":
+            # Stage the render so the formatter's edits show up as a worktree diff.
+            _run("git", "add", "-A")
+        if _run(str(TRUNK_SCRIPT), action, "--all").returncode != 0:
+            return f"trunk {action} failed"
+        if action == "fmt":
+            changed = subprocess.run(
+                ["git", "diff", "--name-only"],
+                cwd=project_path,
+                env=dict(env),
+                capture_output=True,
+                text=True,
+                check=False,
+            ).stdout.split()
+            if changed:
+                if log_handle is not None:
+                    log_handle.write("Formatting changed:\n" + "\n".join(changed) + "\n")
+                return f"formatting produced changes in {len(changed)} file(s)"
+        return None
+    finally:
+        if log_handle is not None:
+            log_handle.close()
 
-        for entry in entries:
-            template_name = entry["template"]
-            context_name = entry["context"]
-            if args.templates and template_name not in args.templates:
-                continue
-            if args.contexts and context_name not in args.contexts:
-                continue
 
-            project_path = Path(entry["path"])
-            if not project_path.exists():
-                session.warn(f"Rendered project missing at {project_path}; skipping.")
-                continue
+def _log_tail(path: Path, lines: int = 20) -> str:
+    try:
+        return "\n".join(path.read_text(encoding="utf-8", errors="replace").splitlines()[-lines:])
+    except OSError:
+        return ""
+
+
+def _trunk_templates(session: nox.Session, action: str, label: str) -> None:
+    """
+    Run ``trunk <action> --all`` over every selected rendered variant.
+
+    Variants are prepared one at a time and then run on ``--jobs`` workers.
+    Parallel runs write one log per variant under ``build/template-renders/_logs``.
+    A variant whose rendered content, Trunk configuration and action all match
+    its last clean run is skipped unless ``--force`` is given. Before Trunk runs,
+    the render is restored from its cache entry, and a clean result is only
+    recorded when the checked files are still byte-identical to that entry.
+    """
+    from templates._shared import render as render_utils  # pylint: disable=import-outside-toplevel
+
+    parser = _arg_parser()
+    args = parser.parse_args(session.posargs)
+
+    templates = _load_manifest_templates()
+    entries = _load_render_index()
+    if not entries:
+        session.error("No rendered templates found. Run `nox -s render_templates` first.")
+
+    _ensure_trunk(session)
+
+    clean_state = _load_clean_state()
+    pending: List[Dict[str, object]] = []
+    for entry in entries:
+        template_name = entry["template"]
+        context_name = entry["context"]
+        if args.templates and template_name not in args.templates:
+            continue
+        if args.contexts and context_name not in args.contexts:
+            continue
+
+        project_path = Path(entry["path"])
+        if not project_path.exists():
+            session.warn(f"Rendered project missing at {project_path}; skipping.")
+            continue
 
-            template_cfg = templates.get(template_name, {})
-            _copy_trunk_configuration(project_path, template_cfg)
-            _ensure_git_repo(session, project_path)
-
-            session.log(f"[format] {template_name} :: {context_name}")
-            with session.chdir(str(project_path)):
-                session.run(
-                    str(TRUNK_SCRIPT),
-                    "fmt",
-                    "--all",
-                    external=True,
-                )
-                git_status = session.run(
-                    "git",
-                    "status",
-                    "--porcelain",
-                    external=True,
-                    silent=True,
-                )
-                stdout = getattr(git_status, "stdout", "")
-                if isinstance(stdout, str) and stdout.strip():
-                    session.error(f"Formatting produced changes in {project_path}")
+        template_cfg = templates.get(template_name, {})
+        state_key = f"{action}:{template_name}:{context_name}"
+        digest = _variant_digest(entry, template_cfg, action)
+        if not args.force and digest is not None and clean_state.get(state_key) == digest:
+            session.log(f"[{label}] {template_name} :: {context_name} unchanged since last clean run; skipping")
+            continue
+        if digest is not None and not _restore_render(entry):
+            session.warn(f"Cache entry for {template_name} :: {context_name} is gone; its result will not be recorded.")
+            digest = None
+
+        _copy_trunk_configuration(project_path, template_cfg)
+        _ensure_git_repo(session, project_path)
+        pending.append(
+            {
+                "name": f"{template_name} :: {context_name}",
+                "path": project_path,
+                "key": state_key,
+                "digest": digest,
+                "cache_dir": entry.get("cache_dir"),
+                "log": RENDER_LOGS / f"{action}-{template_name}-{context_name}.log",
+            }
+        )
+
+    if not pending:
+        return
+
+    jobs = min(render_utils.resolve_jobs(args.jobs), len(pending))
+    env = {**os.environ, **{key: value for key, value in session.env.items() if value is not None}}
+    if jobs > 1:
+        # Download linters once so parallel runs share Trunk's tool cache instead of racing to fill it.
+        session.run(str(TRUNK_SCRIPT), "install", external=True)
+        session.log(f"[{label}] Running {len(pending)} variant(s) with {jobs} worker(s)")
+
+    def _run_variant(variant: Mapping[str, object]) -> Optional[str]:
+        log_path = cast(Path, variant["log"]) if jobs > 1 else None
+        if log_path is None:
+            session.log(f"[{label}] {variant['name']}")
+        return _run_trunk_variant(cast(Path, variant["path"]), action, env, log_path)
+
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            failures = list(executor.map(_run_variant, pending))
+    else:
+        failures = [_run_variant(variant) for variant in pending]
+
+    failed: List[str] = []
+    for variant, failure in zip(pending, failures):
+        name = cast(str, variant["name"])
+        if failure is None:
+            # `trunk fmt` edits files in place, so only content identical to the entry counts as clean.
+            if variant["digest"] is not None and _matches_entry(
+                cast(Path, variant["path"]), Path(cast(str, variant["cache_dir"]))
+            ):
+                clean_state[cast(str, variant["key"])] = cast(str, variant["digest"])
+            if jobs > 1:
+                session.log(f"[{label}] {name}: clean")
+            continue
+        failed.append(name)
+        clean_state.pop(cast(str, variant["key"]), None)
+        if jobs > 1:
+            session.warn(f"[{label}] {name}: {failure} (log: {variant['log']})\n{_log_tail(cast(Path, variant['log']))}")
+        else:
+            session.warn(f"[{label}] {name}: {failure}")
+
+    _save_clean_state(clean_state)
+    if failed:
+        session.error(f"{label} failed for {len(failed)} variant(s): {', '.join(failed)}")
+
+
+@nox.session
+def lint_templates(session: nox.Session) -> None:
+    """Run Trunk checks across rendered template variants."""
+    with _session_timer(session, "lint_templates"):
+        _trunk_templates(session, "check", "lint")
+
+
+@nox.session
+def format_templates(session: nox.Session) -> None:
+    """Format rendered templates and fail if formatting introduces changes."""
+    with _session_timer(session, "format_templates"):
+        _trunk_templates(session, "fmt", "format")
 
 
 @nox.session
@@ -555,6 +835,38 @@ def validate_templates_all(session: nox.Session) -> None:
         session.notify("format_templates", notify_args)
 
 
+@nox.session(python=False)
+def cache_gc(session: nox.Session) -> None:
+    """Evict stale and least recently used entries from the shared template cache."""
+    with _session_timer(session, "cache_gc"):
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument("--max-size")
+        parser.add_argument("--max-age-days", type=float)
+        parser.add_argument("--dry-run", action="store_true")
+        args = parser.parse_args(session.posargs)
+
+        from templates._shared import eviction  # pylint: disable=import-outside-toplevel
+
+        try:
+            max_bytes = eviction.parse_size(args.max_size) if args.max_size is not None else None
+        except ValueError as exc:
+            session.error(str(exc))
+        report = eviction.collect_garbage(
+            max_bytes=max_bytes,
+            max_age_days=args.max_age_days,
+            dry_run=args.dry_run,
+        )
+        verb = "Would evict" if args.dry_run else "Evicted"
+        derived = sum(stats["evicted"] for stats in report["auxiliary"].values())
+        session.log(
+            f"{verb} {len(report['evicted'])} of {report['scanned']} entries, "
+            f"{report['objects_removed']} objects and {derived} derived cache files; "
+            f"{eviction.format_size(report['bytes_before'])} -> {eviction.format_size(report['bytes_after'])}"
+        )
+        if report["busy"]:
+            session.log(f"Skipped {len(report['busy'])} entries in use")
+
+
 @nox.session
 def sync_manifest(session: nox.Session) -> None:
     """Synchronise manifest.json from manifest.yaml."""
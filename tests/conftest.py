@@ -2,28 +2,56 @@
 
 from __future__ import annotations
 
+import ast
 import importlib
-import json
+import os
+import shutil
+import sys
+import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Tuple
 
 import pytest
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
 TEMPLATES_ROOT = APPLICATIONS_ROOT / "templates"
+TESTS_ROOT = Path(__file__).resolve().parent
 
-_BAKE_CACHE: Dict[str, Any] = {}
+if str(APPLICATIONS_ROOT) not in sys.path:
+    sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+_HOOK_ENV = {"AGENTIC_CANON_SKIP_GIT_INIT": "1", "AGENTIC_CANON_SKIP_MESSAGES": "1"}
+_CACHE_ENV = (
+    "AGENTIC_CANON_CACHE_DIR",
+    "AGENTIC_CANON_OBJECT_STORE_DIR",
+    "AGENTIC_CANON_NODE_CACHE_DIR",
+    "AGENTIC_CANON_PIP_CACHE_DIR",
+    "AGENTIC_CANON_GO_CACHE_DIR",
+    "AGENTIC_CANON_WHEELHOUSE_DIR",
+)
+_PREWARM_FAILURES: List[Tuple[str, BaseException]] = []
 
 
 @pytest.fixture(autouse=True)
 def _patch_hook_environment(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("AGENTIC_CANON_SKIP_GIT_INIT", "1")
-    monkeypatch.setenv("AGENTIC_CANON_SKIP_MESSAGES", "1")
+    for name, value in _HOOK_ENV.items():
+        monkeypatch.setenv(name, value)
 
 
 def pytest_configure(config):
-    """Ensure pytest-cookies is registered exactly once."""
+    """
+    Point the Agentic Canon caches at a session temp dir and register pytest-cookies once.
+
+    ``_shared.cache`` reads its roots at import time, so the environment is set
+    here, before any test module is collected. xdist workers inherit it from
+    the controller and share the controller's prewarmed cache.
+    """
+    if not hasattr(config, "workerinput"):
+        config._agentic_canon_cache = tempfile.mkdtemp(prefix="agentic-canon-cache-")  # pylint: disable=protected-access
+        for name in _CACHE_ENV:
+            os.environ.pop(name, None)
+        os.environ["AGENTIC_CANON_CACHE_DIR"] = config._agentic_canon_cache  # pylint: disable=protected-access
     if not (
         config.pluginmanager.hasplugin("pytest_cookies")
         or config.pluginmanager.hasplugin("cookies")
@@ -32,33 +60,162 @@ def pytest_configure(config):
         config.pluginmanager.register(plugin, "pytest_cookies")
 
 
+def pytest_unconfigure(config):
+    cache_dir = getattr(config, "_agentic_canon_cache", None)
+    if cache_dir:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    """List prewarm renders that failed, so cache or hook errors are not silently lost."""
+    if not _PREWARM_FAILURES:
+        return
+    terminalreporter.section("bake_template prewarm failures")
+    for template, exc in _PREWARM_FAILURES:
+        terminalreporter.write_line(f"{template}: {type(exc).__name__}: {exc}")
+
+
+def _resolve_template(template: str) -> Path:
+    candidate = Path(template)
+    if not candidate.is_absolute():
+        repo_candidate = REPO_ROOT / template
+        if repo_candidate.exists():
+            candidate = repo_candidate
+        else:
+            template_rel = template.split("/", 1)[1] if template.startswith("templates/") else template
+            candidate = TEMPLATES_ROOT / template_rel
+    return candidate
+
+
+def _cacheable_template(candidate: Path) -> bool:
+    """True when ``candidate`` is a manifest template, so renders can go through the shared cache."""
+    from templates._shared import sources  # type: ignore  # pylint: disable=import-outside-toplevel
+
+    return sources.template_root(candidate.name) == candidate.resolve()
+
+
+def _selected_test_files(config: pytest.Config) -> List[Path]:
+    invocation_dir = Path(config.invocation_params.dir)
+    selected = [(invocation_dir / str(arg).split("::", 1)[0]).resolve() for arg in config.args]
+    return [
+        path
+        for path in sorted(TESTS_ROOT.glob("test_*.py"))
+        if any(path == target or target in path.parents for target in selected)
+    ]
+
+
+def _bake_contexts(paths: Iterable[Path]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Find literal ``bake_template("<template>", {...})`` calls in ``paths``."""
+    found: List[Tuple[str, Dict[str, Any]]] = []
+    for path in paths:
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        except (OSError, SyntaxError):
+            continue
+        for node in ast.walk(tree):
+            if not (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id == "bake_template"
+                and len(node.args) == 2
+            ):
+                continue
+            try:
+                template, context = ast.literal_eval(node.args[0]), ast.literal_eval(node.args[1])
+            except ValueError:
+                continue
+            if isinstance(template, str) and isinstance(context, dict):
+                found.append((template, context))
+    return found
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """
+    Render every ``bake_template`` context of the selected tests into the shared cache.
+
+    This runs once, in the xdist controller (or the only process without
+    xdist), on a process pool before any worker starts. Workers then copy
+    ready cache entries instead of each re-baking the same templates. Failed
+    renders are listed in the terminal summary; the owning test reproduces
+    the failure and decides whether it was expected.
+    """
+    if hasattr(session.config, "workerinput"):
+        return
+    try:
+        from templates._shared import render  # type: ignore  # pylint: disable=import-outside-toplevel
+
+        importlib.import_module("cookiecutter.main")
+    except ImportError:
+        return
+
+    targets = []
+    seen = set()
+    for template, context in _bake_contexts(_selected_test_files(session.config)):
+        candidate = _resolve_template(template)
+        key = (str(candidate), repr(sorted(context.items())))
+        if key in seen or not candidate.exists() or not _cacheable_template(candidate):
+            continue
+        if not render.post_gen_cacheable(candidate.name):
+            continue
+        seen.add(key)
+        targets.append((candidate.name, candidate.resolve(), context))
+    if not targets:
+        return
+
+    previous = {name: os.environ.get(name) for name in _HOOK_ENV}
+    os.environ.update(_HOOK_ENV)
+    try:
+        results = render.render_many(targets, jobs=0, return_exceptions=True)
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    _PREWARM_FAILURES.extend(
+        (name, result) for (name, _, _), result in zip(targets, results) if isinstance(result, BaseException)
+    )
+
+
 @pytest.fixture
-def bake_template(cookies):
-    """Bake templates with an in-memory cache to avoid re-rendering."""
+def bake_template(tmp_path_factory):
+    """
+    Bake templates through the shared on-disk template cache.
+
+    Manifest templates are served by :func:`render.render_project`, so each
+    template/context is rendered once per cache (prewarmed in
+    :func:`pytest_sessionstart`) and every xdist worker copies the ready entry
+    under its per-entry lock. Other template paths are rendered directly.
+    """
+    from pytest_cookies.plugin import Result  # pylint: disable=import-outside-toplevel
+    from templates._shared import engine  # type: ignore  # pylint: disable=import-outside-toplevel
+    from templates._shared import render  # type: ignore  # pylint: disable=import-outside-toplevel
 
     def _bake(template: str, extra_context: dict[str, Any]):
-        candidate = Path(template)
-        if not candidate.is_absolute():
-            repo_candidate = REPO_ROOT / template
-            if repo_candidate.exists():
-                candidate = repo_candidate
-            else:
-                template_rel = template.split("/", 1)[1] if template.startswith("templates/") else template
-                candidate = TEMPLATES_ROOT / template_rel
-
+        candidate = _resolve_template(template)
         if not candidate.exists():
             raise FileNotFoundError(f"Template path does not exist: {candidate}")
 
-        cache_key = json.dumps(
-            {"template": str(candidate), "context": extra_context}, sort_keys=True
-        )
-        cached = _BAKE_CACHE.get(cache_key)
-        if cached is not None:
-            return cached
-
-        result = cookies.bake(template=str(candidate), extra_context=extra_context)
-        if result.exception is None and result.exit_code == 0:
-            _BAKE_CACHE[cache_key] = result
-        return result
+        output_dir = tmp_path_factory.mktemp("bake")
+        exception = None
+        exit_code = 0
+        project_dir = None
+        context = None
+        try:
+            full_context = engine.build_context(candidate, extra_context, output_dir, default_context={})
+            context = full_context["cookiecutter"]
+            if _cacheable_template(candidate):
+                project_dir = str(render.render_project(candidate.name, candidate, extra_context, output_dir))
+            else:
+                project_dir = str(engine.generate_project(candidate, full_context, output_dir))
+        except SystemExit as exc:
+            if exc.code != 0:
+                exception = exc
+            exit_code = exc.code
+        except Exception as exc:  # noqa: BLE001 - mirrors pytest-cookies' Cookies.bake()
+            exception = exc
+            exit_code = -1
+
+        return Result(exception=exception, exit_code=exit_code, project_dir=project_dir, context=context)
 
     return _bake
@@ -0,0 +1,93 @@
+"""Tests for batch project generation from spec files."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
+
+sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+pytest.importorskip("cookiecutter.main", reason="cookiecutter is required for batch generation")
+
+from templates._shared import batch  # type: ignore  # noqa: E402
+from templates._shared import cache as cache_utils  # type: ignore  # noqa: E402
+
+
+@pytest.fixture
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "cache" / "templates"
+    monkeypatch.setattr(cache_utils, "TEMPLATE_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(cache_utils, "OBJECT_STORE_DIR", tmp_path / "cache" / "objects")
+    return cache_dir
+
+
+def _docs(slug: str, **extra: str) -> dict:
+    return {"template": "docs-only", "context": {"project_name": slug.title(), "project_slug": slug, **extra}}
+
+
+def test_load_spec_formats(tmp_path: Path) -> None:
+    jsonl = tmp_path / "spec.jsonl"
+    jsonl.write_text("# platform rollout\n" + json.dumps(_docs("docs-a")) + "\n\n", encoding="utf-8")
+    yaml_spec = tmp_path / "spec.yaml"
+    yaml_spec.write_text(
+        "projects:\n  - template: docs-only\n    context:\n      project_slug: docs-b\n",
+        encoding="utf-8",
+    )
+
+    assert batch.load_spec(jsonl) == [_docs("docs-a")]
+    assert batch.load_spec(yaml_spec) == [{"template": "docs-only", "context": {"project_slug": "docs-b"}}]
+
+
+def test_prepare_batch_reports_every_problem(tmp_path: Path) -> None:
+    jobs = batch.prepare_batch(
+        [
+            _docs("docs-a"),
+            {"template": "go-service", "context": {"project_slug": "Bad_Slug", "colour": "red"}},
+            {"template": "missing-template"},
+            _docs("docs-a"),
+            "not-a-mapping",
+        ],
+        tmp_path,
+    )
+
+    assert jobs[0]["errors"] == []
+    assert jobs[0]["project_dir"] == str(tmp_path.resolve() / "docs-a")
+    assert any("colour" in error for error in jobs[1]["errors"])
+    assert any("kebab-case" in error for error in jobs[1]["errors"])
+    assert jobs[2]["errors"] == ["unknown template 'missing-template'"]
+    assert jobs[3]["errors"] == [f"project dir {tmp_path.resolve() / 'docs-a'} is also generated by entry 1"]
+    assert jobs[4]["errors"]
+
+
+def test_run_batch_validates_before_rendering(isolated_cache: Path, tmp_path: Path) -> None:
+    entries = [_docs("docs-a"), _docs("docs-b", author_email="not-an-email")]
+
+    report = batch.run_batch(entries, output_dir=tmp_path / "out", jobs=1)
+
+    assert [result["status"] for result in report["results"]] == ["skipped", "invalid"]
+    assert not (tmp_path / "out").exists()
+
+
+def test_run_batch_generates_valid_entries_in_spec_order(isolated_cache: Path, tmp_path: Path) -> None:
+    entries = [_docs("docs-a"), {"template": "missing-template"}, _docs("docs-b")]
+    seen: list[int] = []
+
+    report = batch.run_batch(
+        entries,
+        output_dir=tmp_path / "out",
+        jobs=1,
+        keep_going=True,
+        on_result=lambda result: seen.append(result["index"]),
+    )
+
+    assert [result["status"] for result in report["results"]] == ["generated", "invalid", "generated"]
+    assert (report["generated"], report["invalid"], report["total"]) == (2, 1, 3)
+    assert sorted(seen) == [1, 3]
+    assert (tmp_path / "out" / "docs-a" / "README.md").exists()
+    assert (tmp_path / "out" / "docs-b" / "README.md").exists()
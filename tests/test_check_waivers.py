@@ -0,0 +1,120 @@
+"""Tests for the incremental waiver index in tools/check_waivers.py."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+import check_waivers  # type: ignore  # noqa: E402
+
+TODAY = date(2025, 6, 10)
+
+
+def _waiver(directory: Path, waiver_id: str, expires: str) -> Path:
+    path = directory / f"{waiver_id}.yml"
+    path.write_text(
+        f"id: {waiver_id}\ncontrol: SLSA-L3\ncategory: supply-chain\nowner: a\napprover: b\n"
+        f"created: 2025-01-01\nexpires: {expires}\ndescription: demo\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def waivers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(check_waivers, "REPO_ROOT", tmp_path)
+    directory = tmp_path / "waivers"
+    directory.mkdir()
+    _waiver(directory, "late", "2025-06-01")
+    _waiver(directory, "soon", "2025-06-15")
+    _waiver(directory, "later", "2025-09-01")
+    (directory / "broken.yml").write_text("id: broken\n", encoding="utf-8")
+    return directory
+
+
+def _evaluate(waivers: Path, **kwargs):  # type: ignore[no-untyped-def]
+    return check_waivers._evaluate_waivers(
+        7, today=TODAY, waiver_dir=waivers, index_path=waivers.parent / "index.json", **kwargs
+    )
+
+
+def test_range_query_buckets_waivers(waivers: Path) -> None:
+    results = _evaluate(waivers)
+
+    assert [(w["id"], w["days_until_expiry"]) for w in results["upcoming"]] == [("soon", 5)]
+    assert [(w["id"], w["expires"]) for w in results["expired"]] == [("late", "2025-06-01")]
+    assert results["invalid"][0]["__path"] == "waivers/broken.yml"
+
+
+def test_index_reparses_only_changed_files(waivers: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _evaluate(waivers)
+    loaded: list[str] = []
+    original = check_waivers._load_waiver
+
+    def _spy(path):  # type: ignore[no-untyped-def]
+        loaded.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(check_waivers, "_load_waiver", _spy)
+    _waiver(waivers, "later", "2025-06-12")
+    results = _evaluate(waivers)
+
+    assert loaded == ["later.yml"]
+    assert [w["id"] for w in results["upcoming"]] == ["later", "soon"]
+
+
+def test_since_reports_only_edits_and_status_changes(waivers: Path) -> None:
+    index_path = waivers.parent / "index.json"
+    today = date.today()
+    _waiver(waivers, "window", (today + timedelta(days=10)).isoformat())
+    check_waivers.update_index(waivers, index_path)
+    since = datetime.now(timezone.utc)
+
+    def _ids(day: date) -> dict[str, list[str]]:
+        results = check_waivers._evaluate_waivers(7, today=day, since=since, waiver_dir=waivers, index_path=index_path)
+        return {key: [w["__path"] for w in value] for key, value in results.items()}
+
+    assert _ids(today) == {"upcoming": [], "expired": [], "invalid": []}
+    # Three days on, "window" has moved into the warning period without being edited.
+    assert _ids(today + timedelta(days=3))["upcoming"] == ["waivers/window.yml"]
+
+    edited = _waiver(waivers, "soon", (today + timedelta(days=2)).isoformat())
+    os.utime(edited, (since.timestamp() + 1, since.timestamp() + 1))
+    assert _ids(today)["upcoming"] == ["waivers/soon.yml"]
+
+
+def test_since_uses_edit_time_not_index_time(waivers: Path) -> None:
+    """A cold index must not make every waiver look freshly edited."""
+    old = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for path in waivers.glob("*.yml"):
+        os.utime(path, (old.timestamp(), old.timestamp()))
+
+    results = _evaluate(waivers, since=datetime(2025, 6, 9, tzinfo=timezone.utc))
+
+    assert results == {"upcoming": [], "expired": [], "invalid": []}
+
+
+def test_since_only_filters_the_report(
+    waivers: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(check_waivers, "WAIVER_DIR", waivers)
+    monkeypatch.setattr(check_waivers, "INDEX_PATH", waivers.parent / "index.json")
+    output = waivers.parent / "github_output"
+    monkeypatch.setenv("GITHUB_OUTPUT", str(output))
+    future = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+
+    assert check_waivers.main(["--json", "--since", future]) == 1
+
+    assert json.loads(capsys.readouterr().out) == {"upcoming": [], "expired": [], "invalid": []}
+    written = dict(line.split("=", 1) for line in output.read_text(encoding="utf-8").splitlines())
+    assert [w["id"] for w in json.loads(written["invalid"])] == ["broken"]
+    assert len(json.loads(written["expired"])) == 3
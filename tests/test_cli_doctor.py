@@ -0,0 +1,103 @@
+"""Tests for the concurrent, cached `agentic-canon doctor` probes."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
+
+sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+from agentic_canon_cli import cli  # type: ignore  # noqa: E402
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake tools are POSIX shell scripts")
+
+# Resolved before the tests narrow PATH down to the fake tools.
+SLEEP = shutil.which("sleep") or "/bin/sleep"
+
+
+def _fake_tool(bin_dir: Path, name: str, *, delay: float = 0.0) -> None:
+    script = bin_dir / name
+    script.write_text(f"#!/bin/sh\n{SLEEP} {delay}\necho '{name} version 1.0'\n", encoding="utf-8")
+    script.chmod(0o755)
+
+
+@pytest.fixture
+def fake_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    cache_file = tmp_path / "cache" / "doctor.json"
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setattr(cli, "_doctor_cache_path", lambda: cache_file)
+    return bin_dir
+
+
+def test_probes_run_concurrently(fake_path: Path) -> None:
+    for name in ("git", "gh", "cookiecutter", "pre-commit"):
+        _fake_tool(fake_path, name, delay=0.5)
+
+    started = time.perf_counter()
+    checks = cli.run_doctor_probes()
+    elapsed = time.perf_counter() - started
+
+    assert [check["version"] for check in checks] == [
+        "git version 1.0",
+        "gh version 1.0",
+        "cookiecutter version 1.0",
+        "pre-commit version 1.0",
+    ]
+    assert all(check["ok"] and not check["cached"] for check in checks)
+    assert elapsed < 1.5
+
+
+def test_results_are_cached_until_path_changes(fake_path: Path) -> None:
+    _fake_tool(fake_path, "git")
+
+    first = {check["command"]: check for check in cli.run_doctor_probes()}
+    second = {check["command"]: check for check in cli.run_doctor_probes()}
+    assert not first["git"]["cached"] and second["git"]["cached"]
+    assert second["gh"]["cached"] and second["gh"]["version"] == "Not installed"
+
+    # Installing a tool touches its PATH entry, which invalidates the "missing" results.
+    _fake_tool(fake_path, "gh")
+    os.utime(fake_path, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+    third = {check["command"]: check for check in cli.run_doctor_probes()}
+    assert third["gh"]["ok"] and not third["gh"]["cached"]
+
+
+def test_timed_out_probe_is_reported_and_not_cached(
+    fake_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_tool(fake_path, "git", delay=5)
+    monkeypatch.setattr(cli, "DOCTOR_PROBE_TIMEOUT", 0.2)
+
+    checks = {check["command"]: check for check in cli.run_doctor_probes()}
+
+    assert not checks["git"]["ok"]
+    assert checks["git"]["version"].startswith("Timed out")
+    assert "git" not in json.loads(cli._doctor_cache_path().read_text())["probes"]
+
+
+def test_doctor_json_output(fake_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    for name in ("git", "gh", "cookiecutter", "pre-commit"):
+        _fake_tool(fake_path, name)
+
+    assert cli.cmd_doctor(as_json=True) == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["ok"] is True
+    assert [check["name"] for check in report["checks"]] == [
+        "Python version",
+        "Git",
+        "GitHub CLI",
+        "Cookiecutter",
+        "pre-commit",
+    ]
@@ -0,0 +1,83 @@
+"""Tests for the project inspection engine behind `validate` and `audit`."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
+
+sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+from agentic_canon_cli import inspection  # type: ignore  # noqa: E402
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "README.md").write_text("# Demo\n", encoding="utf-8")
+    (tmp_path / ".gitignore").write_text("build/\n*.pem\n", encoding="utf-8")
+    workflows = tmp_path / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "ci.yml").write_text("name: CI\non: push\n", encoding="utf-8")
+    (workflows / "scan.yaml").write_text("jobs:\n  analyse:\n    uses: github/CodeQL-action\n", encoding="utf-8")
+    (tmp_path / ".github" / "CODEOWNERS").write_text("* @demo\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_each_directory_is_scanned_once(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    scanned: list[str] = []
+    original = os.scandir
+
+    def _spy(path):  # type: ignore[no-untyped-def]
+        scanned.append(str(path))
+        return original(path)
+
+    monkeypatch.setattr(inspection.os, "scandir", _spy)
+    index = inspection.ProjectIndex(project)
+    inspection.validate_rules(index)
+    inspection.audit_rules(index)
+
+    assert sorted(scanned) == sorted({str(project), str(project / ".github"), str(project / ".github" / "workflows")})
+
+
+def test_validate_rules(project: Path) -> None:
+    results = inspection.validate_rules(inspection.ProjectIndex(project))
+
+    assert results["issues"] == []
+    assert ".github/workflows/ (2 workflows)" in results["passed"]
+    assert "Missing recommended file: SECURITY.md" in results["warnings"]
+
+
+def test_audit_rules(project: Path) -> None:
+    items = {name: (status, detail) for name, status, detail in inspection.audit_rules(inspection.ProjectIndex(project))}
+
+    assert items["Secrets in .gitignore"][0] is True
+    assert items["Security workflows"] == (True, "Found: scan.yaml")
+    assert items["Code ownership"][0] is True
+    assert items["Security policy"][0] is False
+
+
+def test_stream_search_finds_keywords_across_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(inspection, "_CHUNK_SIZE", 8)
+    target = tmp_path / "workflow.yml"
+    target.write_text("x" * 13 + "VulnerAbility scan\n", encoding="utf-8")
+    matcher = inspection.compile_keywords(inspection.SECURITY_KEYWORDS)
+
+    assert inspection.stream_search(target, matcher, overlap=len("vulnerability") - 1) == "VulnerAbility"
+    assert inspection.stream_search(tmp_path / "missing.yml", matcher, overlap=12) is None
+
+
+def test_validate_runs_when_cli_is_executed_as_a_script(project: Path) -> None:
+    script = APPLICATIONS_ROOT / "agentic_canon_cli" / "cli.py"
+    result = subprocess.run(
+        [sys.executable, str(script), "validate"], cwd=project, capture_output=True, text=True, check=False
+    )
+
+    assert "ImportError" not in result.stderr
+    assert "Validating Project Structure" in result.stdout
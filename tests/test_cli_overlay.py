@@ -0,0 +1,78 @@
+"""Tests for the manifest-driven overlay behind `agentic-canon repo-init`."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
+
+sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+from agentic_canon_cli import overlay  # type: ignore  # noqa: E402
+
+
+@pytest.fixture
+def rendered(tmp_path: Path) -> Path:
+    source = tmp_path / "rendered"
+    workflows = source / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "todos.yml").write_bytes(b"name: TODOs\n")
+    (workflows / "stale.yml").write_bytes(b"\n  \n")
+    (source / ".github" / "ISSUE_TEMPLATE").mkdir()
+    (source / ".github" / "ISSUE_TEMPLATE" / "bug.md").write_bytes("caf\xe9 ✓\r\n".encode("utf-8"))
+    (source / ".github" / "CODEOWNERS").write_bytes(b"* @demo\n")
+    (source / "TASKS.md").write_bytes(b"# Tasks\n")
+    (source / "unrelated.txt").write_bytes(b"not in the manifest\n")
+    return source
+
+
+def test_overlay_copies_manifest_files_in_order(rendered: Path, tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    target.mkdir()
+
+    results = overlay.apply_overlay(rendered, target)
+
+    assert results == [
+        {"path": ".github/workflows/todos.yml", "status": "created"},
+        {"path": ".github/CODEOWNERS", "status": "created"},
+        {"path": ".github/ISSUE_TEMPLATE/bug.md", "status": "created"},
+        {"path": "TASKS.md", "status": "created"},
+    ]
+    # Bytes are copied verbatim, including line endings.
+    assert (target / ".github" / "ISSUE_TEMPLATE" / "bug.md").read_bytes() == "caf\xe9 ✓\r\n".encode("utf-8")
+    assert not (target / ".github" / "workflows" / "stale.yml").exists()
+    assert not (target / "unrelated.txt").exists()
+
+
+def test_overlay_skips_identical_and_kept_files(rendered: Path, tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    overlay.apply_overlay(rendered, target)
+    codeowners = target / ".github" / "CODEOWNERS"
+    os.utime(codeowners, (1, 1))
+    (target / ".github" / "workflows" / "todos.yml").write_bytes(b"name: Local edit\n")
+    (target / "TASKS.md").write_bytes(b"# My tasks\n")
+
+    statuses = {result["path"]: result["status"] for result in overlay.apply_overlay(rendered, target, max_workers=1)}
+
+    assert statuses[".github/CODEOWNERS"] == "unchanged"
+    assert codeowners.stat().st_mtime == 1
+    assert statuses[".github/workflows/todos.yml"] == "updated"
+    assert (target / ".github" / "workflows" / "todos.yml").read_bytes() == b"name: TODOs\n"
+    assert statuses["TASKS.md"] == "kept"
+    assert (target / "TASKS.md").read_bytes() == b"# My tasks\n"
+    assert not [path for path in target.rglob(".*.*") if path.is_file() and path.name.startswith(".todos")]
+
+
+def test_overlay_loads_when_cli_is_executed_as_a_script(tmp_path: Path) -> None:
+    script = APPLICATIONS_ROOT / "agentic_canon_cli" / "cli.py"
+    code = f"import runpy; ns = runpy.run_path({str(script)!r}); print(ns['_load_cli_module']('overlay').__name__)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, capture_output=True, text=True, check=False)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "agentic_canon_cli.overlay"
@@ -0,0 +1,97 @@
+"""Startup-time regression tests for the Agentic Canon CLI."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCAFFOLDER_ROOT = REPO_ROOT / "applications" / "scaffolder"
+
+# Subcommand dependencies that must not load just to parse arguments.
+DEFERRED_MODULES = ("subprocess", "cookiecutter", "jinja2", "yaml", "templates._shared")
+
+
+def _deferred(modules: list[str]) -> list[str]:
+    return [
+        name
+        for name in modules
+        if any(name == module or name.startswith(f"{module}.") for module in DEFERRED_MODULES)
+    ]
+
+
+def test_help_imports_no_subcommand_dependencies(monkeypatch: pytest.MonkeyPatch) -> None:
+    """`--help` startup is judged by what it imports (`-X importtime`), not by wall-clock time."""
+    monkeypatch.syspath_prepend(str(SCAFFOLDER_ROOT))
+    from agentic_canon_cli.cli import parse_import_times  # noqa: E402
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "agentic_canon_cli", "--help"],
+        cwd=SCAFFOLDER_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    imported = [row["module"] for row in parse_import_times(result.stderr.splitlines())]
+    assert "agentic_canon_cli.cli" in imported
+    assert _deferred(imported) == []
+
+
+def test_parsing_arguments_defers_subcommand_imports() -> None:
+    script = (
+        "import json, sys\n"
+        "from agentic_canon_cli import cli\n"
+        "cli.build_parser().parse_args(['gc', '--dry-run'])\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=SCAFFOLDER_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert _deferred(json.loads(result.stdout)) == []
+
+
+def test_profile_imports_reports_breakdown() -> None:
+    env = os.environ.copy()
+    env["AGENTIC_CANON_PROFILE_IMPORTS"] = "5"
+    result = subprocess.run(
+        [sys.executable, "-m", "agentic_canon_cli", "--help"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "usage:" in result.stdout
+    assert "Import profile:" in result.stderr
+    assert "import time:" not in result.stderr
+    table = result.stderr.split("cumul ms  module\n", 1)[1].strip().splitlines()
+    assert len(table) == 5
+
+
+def test_parse_import_times(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.syspath_prepend(str(SCAFFOLDER_ROOT))
+    from agentic_canon_cli.cli import parse_import_times  # noqa: E402
+
+    rows = parse_import_times(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:      1115 |       1115 |     gettext",
+            "import time:      1387 |       2501 |   argparse",
+            "unrelated stderr line",
+        ]
+    )
+    assert rows == [
+        {"module": "gettext", "depth": 2, "self_us": 1115, "cumulative_us": 1115},
+        {"module": "argparse", "depth": 1, "self_us": 1387, "cumulative_us": 2501},
+    ]
@@ -0,0 +1,110 @@
+"""Tests for the cached virtualenv provisioning used by `agentic-canon fix`."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
+
+sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+from agentic_canon_cli import cli  # type: ignore  # noqa: E402
+from templates._shared import cache as cache_utils  # type: ignore  # noqa: E402
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="venv layout differs on Windows")
+
+
+@pytest.fixture
+def offline_installs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Isolate the cache and replace pip with a fake that drops a console script."""
+    root = tmp_path / "cache"
+    monkeypatch.setattr(cache_utils, "PIP_CACHE_DIR", root / "installers" / "pip")
+    monkeypatch.setattr(cache_utils, "OBJECT_STORE_DIR", root / "objects")
+    monkeypatch.setattr(cache_utils, "WHEELHOUSE_DIR", root / "installers" / "wheelhouse")
+    installs: list[Path] = []
+
+    def _fake_install(venv_python: Path, requirements: Path, wheelhouse):  # type: ignore[no-untyped-def]
+        installs.append(venv_python)
+        script = venv_python.parent / "demo-tool"
+        script.write_text(f"#!{venv_python}\nimport demo\n", encoding="utf-8")
+        script.chmod(0o755)
+        return True, "requirements installed"
+
+    original_run = cli._run_command
+
+    def _run_without_ensurepip(cmd, cwd=None):  # type: ignore[no-untyped-def]
+        # Bootstrapping pip into every test venv is slow and the fake installer never uses it.
+        if cmd[1:3] == ["-m", "venv"]:
+            cmd = [*cmd, "--without-pip"]
+        return original_run(cmd, cwd)
+
+    monkeypatch.setattr(cli, "_install_requirements", _fake_install)
+    monkeypatch.setattr(cli, "_run_command", _run_without_ensurepip)
+    return installs
+
+
+def _checkout(base: Path, name: str, monkeypatch: pytest.MonkeyPatch) -> Path:
+    project = base / name
+    project.mkdir()
+    (project / "requirements.txt").write_text("demo==1.0\n", encoding="utf-8")
+    monkeypatch.chdir(project)
+    return project
+
+
+def test_fresh_checkout_restores_relocated_venv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, offline_installs: list[Path]
+) -> None:
+    first = _checkout(tmp_path, "first", monkeypatch)
+    assert cli._ensure_virtualenv() == (True, "Python virtual environment built and cached")
+    assert cli._ensure_virtualenv() == (True, "Python virtual environment up to date")
+
+    second = _checkout(tmp_path, "second", monkeypatch)
+    assert cli._ensure_virtualenv() == (True, "Python virtual environment restored from cache")
+
+    assert len(offline_installs) == 1
+    script = (second / ".venv" / "bin" / "demo-tool").read_text(encoding="utf-8")
+    assert script.startswith(f"#!{second / '.venv' / 'bin' / 'python'}\n")
+    assert str(first) not in (second / ".venv" / "bin" / "activate").read_text(encoding="utf-8")
+    assert (second / ".venv" / "bin" / "python").exists()
+    assert cli._read_venv_marker(second / ".venv")["root"] == str(second)
+
+
+def test_requirement_change_rebuilds_venv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, offline_installs: list[Path]
+) -> None:
+    project = _checkout(tmp_path, "project", monkeypatch)
+    cli._ensure_virtualenv()
+    (project / "requirements.txt").write_text("demo==2.0\n", encoding="utf-8")
+
+    assert cli._ensure_virtualenv() == (True, "Python virtual environment built and cached")
+    assert len(offline_installs) == 2
+
+
+def test_unmanaged_venv_is_upgraded_in_place(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, offline_installs: list[Path]
+) -> None:
+    project = _checkout(tmp_path, "project", monkeypatch)
+    venv_python = project / ".venv" / "bin" / "python"
+    venv_python.parent.mkdir(parents=True)
+    venv_python.symlink_to(sys.executable)
+    (project / ".venv" / "keep-me").write_text("user data\n", encoding="utf-8")
+
+    assert cli._ensure_virtualenv() == (True, "Python virtual environment ready")
+    assert offline_installs == [venv_python.absolute()]
+    assert (project / ".venv" / "keep-me").exists()
+
+
+def test_relocate_only_rewrites_whole_path_components(tmp_path: Path) -> None:
+    venv = tmp_path / "new" / ".venv"
+    (venv / "bin").mkdir(parents=True)
+    (venv / "pyvenv.cfg").write_text("command = python -m venv /src/app/.venv\n", encoding="utf-8")
+    (venv / "bin" / "activate").write_text('VIRTUAL_ENV="/src/app/.venv"\nOTHER=/src/application\n', encoding="utf-8")
+
+    assert cli._relocate_virtualenv(venv, "/src/app", str(tmp_path / "new")) == 2
+    assert (venv / "bin" / "activate").read_text(encoding="utf-8") == (
+        f'VIRTUAL_ENV="{tmp_path / "new"}/.venv"\nOTHER=/src/application\n'
+    )
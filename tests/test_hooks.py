@@ -0,0 +1,296 @@
+"""Tests for the shared post-generation hook helpers."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
+
+sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+from templates._shared import hooks  # type: ignore  # noqa: E402
+
+
+def _workflow(tmp_path: Path, content: str) -> Path:
+    target = tmp_path / ".github" / "workflows" / "ci.yml"
+    target.parent.mkdir(parents=True)
+    target.write_text(content, encoding="utf-8")
+    return target
+
+
+def test_replace_workflow_placeholders_single_pass(tmp_path: Path) -> None:
+    target = _workflow(tmp_path, "a: NODE_VERSION_MATRIX\nb: NODE_VERSION\nc: TOKEN_EXPR\n")
+
+    hooks.replace_workflow_placeholders(
+        tmp_path,
+        [
+            {
+                "path": ".github/workflows/ci.yml",
+                "replacements": {
+                    "NODE_VERSION": "${{ env.NODE }}",
+                    "NODE_VERSION_MATRIX": "${{ matrix.node-version }}",
+                    # Substituted text is never rescanned for other placeholders.
+                    "TOKEN_EXPR": "NODE_VERSION",
+                },
+            }
+        ],
+    )
+
+    assert target.read_text(encoding="utf-8") == (
+        "a: ${{ matrix.node-version }}\nb: ${{ env.NODE }}\nc: NODE_VERSION\n"
+    )
+
+
+def test_replace_workflow_placeholders_skips_unchanged_files(tmp_path: Path) -> None:
+    target = _workflow(tmp_path, "name: ci\n")
+    os.utime(target, (0, 0))
+
+    hooks.replace_workflow_placeholders(
+        tmp_path,
+        [
+            {"path": ".github/workflows/ci.yml", "replacements": {"UNUSED_EXPR": "x"}},
+            {"path": ".github/workflows/missing.yml", "replacements": {"UNUSED_EXPR": "x"}},
+        ],
+    )
+
+    assert target.stat().st_mtime == 0
+
+
+def _report(tmp_path: Path) -> dict:
+    return json.loads((tmp_path / hooks.BOOTSTRAP_REPORT).read_text(encoding="utf-8"))
+
+
+def test_run_commands_records_timing_report(tmp_path: Path) -> None:
+    results = hooks.run_commands(
+        tmp_path,
+        [
+            "echo first > first.txt",
+            [sys.executable, "-c", "import sys; sys.exit(3)"],
+            "cat first.txt",
+        ],
+    )
+
+    assert [result["status"] for result in results] == ["ok", "failed", "ok"]
+    assert results[1]["exit_code"] == 3
+    assert results[2]["stdout"] == "first\n"
+    report = _report(tmp_path)
+    assert [entry["name"] for entry in report["commands"]] == ["echo first > first.txt", results[1]["name"], "cat first.txt"]
+    assert all(entry["duration_seconds"] >= 0 for entry in report["commands"])
+
+
+def test_run_commands_parallel_groups_and_needs(tmp_path: Path) -> None:
+    sleeper = "python -c 'import time; time.sleep(0.5)'"
+    started = time.monotonic()
+    results = hooks.run_commands(
+        tmp_path,
+        [
+            {"parallel": [{"name": "a", "run": sleeper}, {"name": "b", "run": sleeper}, {"name": "c", "run": sleeper}]},
+            {"name": "broken", "run": "exit 1"},
+            {"name": "after-broken", "run": "echo never", "needs": ["broken"]},
+            {"name": "after-a", "run": "echo ok", "needs": "a"},
+        ],
+        max_workers=3,
+    )
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.4
+    statuses = {result["name"]: result["status"] for result in results}
+    assert statuses == {"a": "ok", "b": "ok", "c": "ok", "broken": "failed", "after-broken": "skipped", "after-a": "ok"}
+    group_starts = [result["started_at"] for result in results[:3]]
+    assert max(group_starts) < 0.4
+
+
+def test_run_commands_skips_unknown_needs_and_continues(tmp_path: Path) -> None:
+    results = hooks.run_commands(
+        tmp_path,
+        [
+            {"name": "x", "run": "touch x", "needs": ["missing"]},
+            {"name": "y", "run": "touch y", "needs": ["x"]},
+            {"name": "z", "run": "touch z"},
+        ],
+    )
+
+    assert [(result["name"], result["status"]) for result in results] == [("x", "skipped"), ("y", "skipped"), ("z", "ok")]
+    assert results[0]["stderr"] == "needs unknown step(s): missing"
+    assert not (tmp_path / "x").exists() and (tmp_path / "z").exists()
+    report = json.loads((tmp_path / hooks.BOOTSTRAP_REPORT).read_text(encoding="utf-8"))
+    assert report["commands"][0]["status"] == "skipped"
+
+
+def _removals(plan: dict) -> list:
+    return [path for stage in plan["stages"] for path in stage["removals"]]
+
+
+def _rewritten(plan: dict) -> list:
+    return [rewrite["path"] for stage in plan["stages"] for rewrite in stage["rewrites"]]
+
+
+def test_plan_post_gen_skips_rewrites_of_removed_files() -> None:
+    plan = hooks.plan_post_gen("python-service", {"enable_security_gates": "no", "include_jupyter_book": "yes"})
+
+    assert [stage["source"] for stage in plan["stages"]] == ["hooks.workflows", "options.enable_security_gates=no"]
+    assert ".github/workflows/security.yml" in _removals(plan)
+    assert _rewritten(plan) == [".github/workflows/ci.yml", ".github/workflows/docs.yml"]
+    assert _removals(hooks.plan_post_gen("python-service", {"include_jupyter_book": "no"})) == [
+        "docs/_config.yml",
+        "docs/_toc.yml",
+        "docs/intro.md",
+        "notebooks",
+    ]
+
+
+def test_finalise_stages_drops_nested_and_duplicate_removals() -> None:
+    first = hooks._plan_actions(
+        "options.a=yes",
+        {
+            "remove": ["docs/api", "docs", "./docs/intro.md", "tests/contract/"],
+            "workflows": [
+                {"path": "docs/conf.yml", "replacements": {"A": "b"}},
+                {"path": "ci.yml", "replacements": {"A": "b"}},
+            ],
+        },
+    )
+    second = hooks._plan_actions("options.b=yes", {"remove": ["docs"], "workflows": {"path": "ci.yml", "replacements": {"A": "c"}}})
+
+    finalised = hooks._finalise_stages([first, second])
+
+    assert [stage["removals"] for stage in finalised] == [["docs", "tests/contract"], []]
+    # Both ci.yml passes are kept, in order; the second one simply finds nothing left to replace.
+    assert [stage["rewrites"] for stage in finalised] == [
+        [{"path": "ci.yml", "replacements": {"A": "b"}}],
+        [{"path": "ci.yml", "replacements": {"A": "c"}}],
+    ]
+
+
+def _fake_config(monkeypatch: pytest.MonkeyPatch, config: dict) -> None:
+    monkeypatch.setattr(hooks, "get_template_config", lambda name: config)
+
+
+def test_apply_plan_keeps_per_option_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _workflow(tmp_path, "value: FIRST\n")
+    (tmp_path / "extra.txt").write_text("extra\n", encoding="utf-8")
+    _fake_config(
+        monkeypatch,
+        {
+            "hooks": {
+                "options": {
+                    "one": {
+                        "cases": {
+                            "yes": {
+                                "workflows": {"path": ".github/workflows/ci.yml", "replacements": {"FIRST": "SECOND"}},
+                                "commands": ["ls > seen-by-one.txt"],
+                            }
+                        }
+                    },
+                    "two": {
+                        "cases": {
+                            "yes": {
+                                "remove": ["extra.txt"],
+                                "workflows": {"path": ".github/workflows/ci.yml", "replacements": {"SECOND": "third"}},
+                            }
+                        }
+                    },
+                },
+                "cleanup": {"remove_after_render": ["seen-by-one.txt"]},
+                "commands": ["cat .github/workflows/ci.yml > final.txt"],
+            }
+        },
+    )
+
+    plan = hooks.run_post_gen("example", tmp_path, {"one": "yes", "two": "yes"})
+
+    assert [stage["source"] for stage in plan["stages"]] == [
+        "options.one=yes",
+        "options.two=yes",
+        "cleanup",
+        "commands",
+    ]
+    # Option one's command ran before option two removed extra.txt; cleanup then removed its output.
+    assert not (tmp_path / "seen-by-one.txt").exists()
+    assert not (tmp_path / "extra.txt").exists()
+    # Chained placeholders are applied stage after stage, and the hook command sees the result.
+    assert (tmp_path / "final.txt").read_text(encoding="utf-8") == "value: third\n"
+    report = json.loads((tmp_path / hooks.BOOTSTRAP_REPORT).read_text(encoding="utf-8"))
+    assert [entry["command"] for entry in report["commands"]] == [
+        "ls > seen-by-one.txt",
+        "cat .github/workflows/ci.yml > final.txt",
+    ]
+
+
+def test_command_sees_files_before_a_later_removal(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "notes.md").write_text("notes\n", encoding="utf-8")
+    _fake_config(
+        monkeypatch,
+        {
+            "hooks": {
+                "options": {
+                    "one": {"cases": {"yes": {"commands": ["cp notes.md copied.md"]}}},
+                    "two": {"cases": {"yes": {"remove": ["notes.md"]}}},
+                },
+            }
+        },
+    )
+
+    hooks.run_post_gen("example", tmp_path, {"one": "yes", "two": "yes"})
+
+    assert (tmp_path / "copied.md").read_text(encoding="utf-8") == "notes\n"
+    assert not (tmp_path / "notes.md").exists()
+
+
+def test_overlapping_placeholders_first_stage_wins(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    target = _workflow(tmp_path, "token: TOKEN_EXPR\n")
+    _fake_config(
+        monkeypatch,
+        {
+            "hooks": {
+                "workflows": [{"path": ".github/workflows/ci.yml", "replacements": {"TOKEN_EXPR": "first"}}],
+                "options": {
+                    "one": {
+                        "cases": {
+                            "yes": {"workflows": {"path": ".github/workflows/ci.yml", "replacements": {"TOKEN_EXPR": "second"}}}
+                        }
+                    }
+                },
+            }
+        },
+    )
+
+    hooks.run_post_gen("example", tmp_path, {"one": "yes"})
+
+    assert target.read_text(encoding="utf-8") == "token: first\n"
+
+
+def test_run_post_gen_dry_run_leaves_project_untouched(tmp_path: Path) -> None:
+    security = _workflow(tmp_path, "token: GITHUB_TOKEN_EXPR\n").with_name("security.yml")
+    security.write_text("token: GITHUB_TOKEN_EXPR\n", encoding="utf-8")
+
+    plan = hooks.run_post_gen("python-service", tmp_path, {"enable_security_gates": "no"}, dry_run=True)
+
+    assert security.exists()
+    assert ".github/workflows/security.yml" in _removals(plan)
+
+    hooks.run_post_gen("python-service", tmp_path, {"enable_security_gates": "no"})
+    assert not security.exists()
+    assert (tmp_path / ".github" / "workflows" / "ci.yml").read_text(encoding="utf-8") == "token: GITHUB_TOKEN_EXPR\n"
+
+
+def test_cli_only_prints_the_plan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(hooks, "apply_plan", lambda *args, **kwargs: pytest.fail("the CLI must not apply plans"))
+
+    assert hooks.main(["python-service", "--context", "default"]) == 0
+
+    plan = json.loads(capsys.readouterr().out)
+    assert plan["template"] == "python-service"
+    assert list(tmp_path.iterdir()) == []
+    with pytest.raises(SystemExit):
+        hooks.main(["python-service", "--project", str(tmp_path)])
@@ -0,0 +1,91 @@
+"""Tests for the compiled manifest snapshot used by load_manifest()."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
+
+sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+from templates._shared import manifest as manifest_utils  # type: ignore  # noqa: E402
+
+yaml = pytest.importorskip("yaml")
+
+
+@pytest.fixture
+def manifest_copy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    source = tmp_path / "manifest.yaml"
+    shutil.copyfile(manifest_utils.MANIFEST_YAML, source)
+    monkeypatch.setattr(manifest_utils, "MANIFEST_YAML", source)
+    monkeypatch.setattr(manifest_utils, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    return source
+
+
+def _count_parses(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    original = yaml.load
+
+    def _spy(stream, Loader):  # noqa: N803 - mirrors yaml.load
+        calls.append(1)
+        return original(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, "load", _spy)
+    return calls
+
+
+def test_snapshot_skips_yaml_parsing(manifest_copy: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_parses(monkeypatch)
+
+    first = manifest_utils._load_from_yaml()
+    second = manifest_utils._load_from_yaml()
+
+    assert len(calls) == 1
+    assert first == second == yaml.safe_load(manifest_copy.read_text(encoding="utf-8"))
+    assert manifest_utils._snapshot_path(manifest_copy).exists()
+
+
+def test_snapshot_revalidates_by_hash(manifest_copy: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_parses(monkeypatch)
+    manifest_utils._load_from_yaml()
+
+    # A touch without a content change is served from the snapshot.
+    stat_result = manifest_copy.stat()
+    os.utime(manifest_copy, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+    manifest_utils._load_from_yaml()
+    assert len(calls) == 1
+
+    manifest_copy.write_text(
+        manifest_copy.read_text(encoding="utf-8") + "\nsnapshot_probe: true\n", encoding="utf-8"
+    )
+    data = manifest_utils._load_from_yaml()
+    assert len(calls) == 2
+    assert data["snapshot_probe"] is True
+
+
+def test_corrupt_snapshot_is_ignored(manifest_copy: Path) -> None:
+    expected = manifest_utils._load_from_yaml()
+    manifest_utils._snapshot_path(manifest_copy).write_bytes(b"not marshal data")
+
+    assert manifest_utils._load_from_yaml() == expected
+
+
+def test_manifest_load_rejects_unknown_needs(manifest_copy: Path) -> None:
+    data = yaml.safe_load(manifest_copy.read_text(encoding="utf-8"))
+    data["templates"]["go-service"]["bootstrap"] = [
+        {"name": "deps", "run": "go mod download"},
+        {"parallel": [{"name": "vet", "run": "go vet ./...", "needs": ["deps"]}]},
+        {"name": "docs", "run": "make docs", "needs": ["dpes"]},
+    ]
+    manifest_copy.write_text(yaml.safe_dump(data), encoding="utf-8")
+
+    with pytest.raises(ValueError, match=r"go-service commands: 'docs' needs unknown step\(s\): dpes"):
+        manifest_utils._load_from_yaml()
+    shipped = APPLICATIONS_ROOT / "templates" / "manifest.yaml"
+    assert manifest_utils.validate_manifest(yaml.safe_load(shipped.read_text(encoding="utf-8"))) == []
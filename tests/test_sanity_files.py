@@ -0,0 +1,59 @@
+"""Tests for the single-walk file checks behind sections 15, 16 and 19 of sanity-check.sh."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = REPO_ROOT / ".dev" / "scripts" / "sanity-files.py"
+
+_spec = importlib.util.spec_from_file_location("sanity_files", SCRIPT)
+sanity_files = importlib.util.module_from_spec(_spec)  # type: ignore[arg-type]
+_spec.loader.exec_module(sanity_files)  # type: ignore[union-attr]
+
+
+def _tree(root: Path) -> Path:
+    (root / ".git").mkdir()
+    (root / ".git" / "HEAD.md").write_text("[x]: \n", encoding="utf-8")
+    (root / "docs").mkdir()
+    (root / "docs" / "refs.md").write_text("# Refs\n[empty]: \n", encoding="utf-8")
+    (root / "docs" / "long.md").write_text("x" * 500 + "\n", encoding="utf-8")
+    (root / "templates").mkdir()
+    (root / "templates" / "long.md").write_text("y" * 800 + "\n", encoding="utf-8")
+    examples = root / "examples"
+    (examples / "b").mkdir(parents=True)
+    (examples / "a.py").write_text("print('hi')\n", encoding="utf-8")
+    (examples / "b" / "copy.py").write_text("print('hi')\n", encoding="utf-8")
+    (examples / "b" / "other.py").write_text("print('ho')\n", encoding="utf-8")
+    (examples / "b" / "link.py").symlink_to(examples / "a.py")
+    return root
+
+
+def test_walk_skips_git_and_symlinks(tmp_path: Path) -> None:
+    names = [relative for relative, _ in sanity_files.walk(_tree(tmp_path))]
+
+    assert "examples/b/link.py" not in names
+    assert not any(name.startswith(".git/") for name in names)
+    assert names.index("examples/a.py") < names.index("examples/b/copy.py")
+
+
+def test_results_match_shell_messages(tmp_path: Path) -> None:
+    results = sanity_files.run(_tree(tmp_path), verbose=True)
+
+    assert results == [
+        ("15", "PASS", "No unusually large text files detected"),
+        ("16", "WARN", "long.md: Contains very long lines (>500 chars)"),
+        ("16", "WARN", "refs.md: Empty reference-style link found"),
+        ("16", "WARN", "Found 2 markdown formatting warnings"),
+        ("19", "WARN", "Duplicate file detected: examples/b/copy.py == examples/a.py"),
+        ("19", "WARN", "Found 1 duplicate files in examples"),
+    ]
+
+
+def test_quiet_mode_keeps_counts_but_drops_detail(tmp_path: Path) -> None:
+    results = sanity_files.run(_tree(tmp_path), verbose=False)
+
+    assert ("16", "WARN", "Found 2 markdown formatting warnings") in results
+    assert [message for _, _, message in results if "Duplicate file detected" in message] == []
+    assert ("19", "WARN", "Found 1 duplicate files in examples") in results
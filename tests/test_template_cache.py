@@ -0,0 +1,305 @@
+"""Tests for the template/installer cache and its object store."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
+
+sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+from templates._shared import cache as cache_utils  # type: ignore  # noqa: E402
+from templates._shared import eviction  # type: ignore  # noqa: E402
+from templates._shared import store  # type: ignore  # noqa: E402
+
+
+@pytest.fixture
+def cache_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "cache"
+    monkeypatch.setattr(cache_utils, "CACHE_ROOT", root)
+    monkeypatch.setattr(cache_utils, "WHEELHOUSE_DIR", root / "installers" / "wheelhouse")
+    monkeypatch.setattr(cache_utils, "TEMPLATE_CACHE_DIR", root / "templates")
+    monkeypatch.setattr(cache_utils, "NODE_CACHE_DIR", root / "installers" / "node")
+    monkeypatch.setattr(cache_utils, "PIP_CACHE_DIR", root / "installers" / "pip")
+    monkeypatch.setattr(cache_utils, "GO_CACHE_DIR", root / "installers" / "go")
+    monkeypatch.setattr(cache_utils, "OBJECT_STORE_DIR", root / "objects")
+    return root
+
+
+def _object_count(root: Path) -> int:
+    return sum(1 for path in (root / "objects").rglob("*") if path.is_file())
+
+
+def _write_tree(base: Path, marker: str) -> None:
+    (base / "bin").mkdir(parents=True)
+    (base / "README.md").write_text("shared readme\n", encoding="utf-8")
+    (base / "bin" / "tool").write_text("#!/bin/sh\necho tool\n", encoding="utf-8")
+    (base / "bin" / "tool").chmod(0o755)
+    (base / "marker.txt").write_text(marker, encoding="utf-8")
+    (base / "empty").mkdir()
+    os.symlink("bin/tool", base / "tool-link")
+
+
+def test_template_entries_share_identical_files(cache_root: Path) -> None:
+    """Two contexts that differ in one file only add one new object."""
+    first = cache_utils.prime_template_cache(
+        "docs-only", {"variant": "a"}, lambda dest: _write_tree(dest, "a")
+    )
+    objects_after_first = _object_count(cache_root)
+    second = cache_utils.prime_template_cache(
+        "docs-only", {"variant": "b"}, lambda dest: _write_tree(dest, "b")
+    )
+
+    assert first != second
+    assert _object_count(cache_root) == objects_after_first + 1
+    assert store.read_tree(first) is not None
+    assert not (first / "README.md").exists()
+
+
+def test_copy_from_cache_restores_tree(cache_root: Path, tmp_path: Path) -> None:
+    cache_dir = cache_utils.prime_template_cache(
+        "docs-only", {"variant": "a"}, lambda dest: _write_tree(dest, "a")
+    )
+    destination = tmp_path / "restored"
+
+    cache_utils.copy_from_cache(cache_dir, destination)
+
+    assert (destination / "README.md").read_text(encoding="utf-8") == "shared readme\n"
+    assert os.access(destination / "bin" / "tool", os.X_OK)
+    assert (destination / "empty").is_dir()
+    assert os.readlink(destination / "tool-link") == "bin/tool"
+    assert not (destination / cache_utils.SENTINEL).exists()
+    assert not (destination / store.TREE_MANIFEST).exists()
+
+
+def test_copy_from_cache_reads_legacy_entries(cache_root: Path, tmp_path: Path) -> None:
+    legacy = cache_root / "templates" / "docs-only" / "legacy"
+    _write_tree(legacy, "legacy")
+    (legacy / cache_utils.SENTINEL).write_text("", encoding="utf-8")
+    destination = tmp_path / "restored"
+
+    cache_utils.copy_from_cache(legacy, destination)
+
+    assert (destination / "marker.txt").read_text(encoding="utf-8") == "legacy"
+    assert not (destination / cache_utils.SENTINEL).exists()
+
+
+def test_installer_cache_restores_from_store(cache_root: Path, tmp_path: Path) -> None:
+    calls: list[Path] = []
+
+    def installer(path: Path) -> None:
+        calls.append(path)
+        _write_tree(path / "node_modules", "installed")
+
+    for name in ("one", "two"):
+        project = tmp_path / name
+        project.mkdir()
+        cache_utils.cache_node_modules(project, [b"package-lock"], installer)
+        assert (project / "node_modules" / "marker.txt").read_text(encoding="utf-8") == "installed"
+
+    assert calls == [tmp_path / "one"]
+
+
+def test_hardlink_strategy_links_read_only_objects(cache_root: Path, tmp_path: Path) -> None:
+    cache_dir = cache_utils.prime_template_cache(
+        "docs-only", {"variant": "a"}, lambda dest: _write_tree(dest, "a")
+    )
+    destination = tmp_path / "linked"
+
+    cache_utils.copy_from_cache(cache_dir, destination, strategy="hardlink")
+
+    readme = destination / "README.md"
+    digest = store.hash_file(readme)
+    assert readme.stat().st_ino == store.object_path(cache_root / "objects", digest).stat().st_ino
+    assert not os.access(readme, os.W_OK) or os.geteuid() == 0
+    assert os.access(destination / "bin" / "tool", os.X_OK)
+
+
+def test_copy_strategy_produces_independent_files(cache_root: Path, tmp_path: Path) -> None:
+    cache_dir = cache_utils.prime_template_cache(
+        "docs-only", {"variant": "a"}, lambda dest: _write_tree(dest, "a")
+    )
+    destination = tmp_path / "copied"
+
+    cache_utils.copy_from_cache(cache_dir, destination, strategy="copy")
+
+    readme = destination / "README.md"
+    readme.write_text("edited\n", encoding="utf-8")
+    again = tmp_path / "again"
+    cache_utils.copy_from_cache(cache_dir, again, strategy="copy")
+    assert (again / "README.md").read_text(encoding="utf-8") == "shared readme\n"
+
+
+def test_in_place_edit_through_hardlink_invalidates_entry(cache_root: Path, tmp_path: Path) -> None:
+    cache_dir = cache_utils.prime_template_cache(
+        "docs-only", {"variant": "a"}, lambda dest: _write_tree(dest, "a")
+    )
+    destination = tmp_path / "linked"
+    cache_utils.copy_from_cache(cache_dir, destination, strategy="hardlink")
+
+    marker = destination / "marker.txt"
+    marker.chmod(0o644)
+    marker.write_text("tampered", encoding="utf-8")
+
+    with pytest.raises(store.StoreIntegrityError):
+        cache_utils.copy_from_cache(cache_dir, tmp_path / "again", strategy="hardlink")
+    assert not cache_dir.exists()
+
+    rebuilt = cache_utils.prime_template_cache(
+        "docs-only", {"variant": "a"}, lambda dest: _write_tree(dest, "a")
+    )
+    cache_utils.copy_from_cache(rebuilt, tmp_path / "rebuilt", strategy="hardlink")
+    assert (tmp_path / "rebuilt" / "marker.txt").read_text(encoding="utf-8") == "a"
+
+
+def test_resolve_strategy_prefers_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(cache_utils.CACHE_STRATEGY_ENV, raising=False)
+    # Installer restores (node_modules, .venv, Go modules) keep the fast default; only
+    # the Trunk-edited renders are downgraded, through editable_strategy().
+    for template in ("docs-only", "go-service", "node-service", "project-management", "python-service", "react-webapp"):
+        assert cache_utils.resolve_strategy(template) == "auto"
+        assert cache_utils.editable_strategy(cache_utils.resolve_strategy(template)) == "reflink"
+    assert cache_utils.resolve_strategy("unknown-template") == cache_utils.DEFAULT_STRATEGY
+
+    monkeypatch.setenv(cache_utils.CACHE_STRATEGY_ENV, "copy")
+    assert cache_utils.resolve_strategy("node-service") == "copy"
+
+    monkeypatch.setenv(cache_utils.CACHE_STRATEGY_ENV, "teleport")
+    with pytest.raises(ValueError):
+        cache_utils.resolve_strategy()
+
+
+def test_formatter_edit_on_editable_render_keeps_store_intact(cache_root: Path, tmp_path: Path) -> None:
+    cache_dir = cache_utils.prime_template_cache(
+        "docs-only", {"variant": "a"}, lambda dest: _write_tree(dest, "a")
+    )
+    render = tmp_path / "render"
+    cache_utils.copy_from_cache(cache_dir, render, strategy=cache_utils.editable_strategy("hardlink"))
+
+    # Formatters such as `trunk fmt` rewrite files in place through the existing inode.
+    marker = render / "marker.txt"
+    marker.chmod(0o644)
+    with open(marker, "r+", encoding="utf-8") as handle:
+        handle.write("A")
+    assert marker.read_text(encoding="utf-8") == "A"
+
+    digest = hashlib.sha256(b"a").hexdigest()
+    assert store.object_path(cache_root / "objects", digest).read_bytes() == b"a"
+    cache_utils.copy_from_cache(cache_dir, tmp_path / "again", strategy="hardlink")
+    assert (tmp_path / "again" / "marker.txt").read_text(encoding="utf-8") == "a"
+    assert cache_utils.editable_strategy("auto") == "reflink"
+    assert cache_utils.editable_strategy("copy") == "copy"
+
+
+def _age(cache_dir: Path, days: float) -> None:
+    stamp = time.time() - days * 86400
+    os.utime(cache_dir / cache_utils.SENTINEL, (stamp, stamp))
+
+
+def _prime(variant: str, days_old: float) -> Path:
+    cache_dir = cache_utils.prime_template_cache(
+        "docs-only", {"variant": variant}, lambda dest: _write_tree(dest, variant)
+    )
+    _age(cache_dir, days_old)
+    return cache_dir
+
+
+def test_gc_evicts_entries_past_max_age(cache_root: Path) -> None:
+    stale = _prime("stale", 45)
+    fresh = _prime("fresh", 1)
+    stale_marker = store.object_path(cache_root / "objects", hashlib.sha256(b"stale").hexdigest())
+
+    report = eviction.collect_garbage(max_bytes=0, max_age_days=30)
+
+    assert report["evicted"] == [str(stale)]
+    assert not stale.exists()
+    assert fresh.exists()
+    assert not stale_marker.exists()
+    # Objects shared with the surviving entry stay in the store.
+    cache_utils.copy_from_cache(fresh, cache_root / "restored")
+    assert (cache_root / "restored" / "README.md").exists()
+
+
+def test_gc_evicts_least_recently_used_until_under_budget(cache_root: Path) -> None:
+    oldest = _prime("a" * 4096, 3)
+    middle = _prime("b" * 4096, 2)
+    newest = _prime("c" * 4096, 1)
+    cache_utils.copy_from_cache(oldest, cache_root / "hit")  # a hit makes it most recent
+
+    total = eviction.collect_garbage(max_bytes=0, max_age_days=0, dry_run=True)["bytes_before"]
+
+    report = eviction.collect_garbage(max_bytes=total - 1, max_age_days=0)
+
+    assert report["evicted"] == [str(middle)]
+    assert oldest.exists() and newest.exists()
+    assert report["bytes_after"] == total - 4096
+
+
+def test_gc_dry_run_and_busy_entries_are_kept(cache_root: Path) -> None:
+    busy = _prime("busy", 90)
+    idle = _prime("idle", 90)
+
+    preview = eviction.collect_garbage(max_bytes=0, max_age_days=30, dry_run=True)
+    assert sorted(preview["evicted"]) == sorted([str(busy), str(idle)])
+    assert busy.exists() and idle.exists()
+
+    with cache_utils.file_lock(cache_utils.entry_lock_path(busy), shared=True):
+        report = eviction.collect_garbage(max_bytes=0, max_age_days=30)
+
+    assert report["busy"] == [str(busy)]
+    assert report["evicted"] == [str(idle)]
+    assert busy.exists()
+    cache_utils.copy_from_cache(busy, cache_root / "restored")
+
+
+def test_gc_covers_derived_caches(cache_root: Path) -> None:
+    stale_wheel = cache_root / "installers" / "wheelhouse" / "old-1.0-py3-none-any.whl"
+    fresh_bytecode = cache_root / "jinja" / "__jinja2_fresh.cache"
+    doctor = cache_root / "doctor.json"
+    for path in (stale_wheel, fresh_bytecode, doctor):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * 100)
+    for path, days in ((stale_wheel, 45), (doctor, 45), (fresh_bytecode, 2)):
+        past = time.time() - days * 86400
+        os.utime(path, (past, past))
+    entry = _prime("entry", 1)
+
+    preview = eviction.collect_garbage(max_bytes=0, max_age_days=30, dry_run=True)
+    assert preview["scanned"] == 1
+    assert preview["auxiliary"]["wheelhouse"] == {"files": 1, "bytes": 100, "evicted": 1}
+    assert preview["auxiliary"]["jinja"] == {"files": 1, "bytes": 100, "evicted": 0}
+    assert preview["auxiliary"]["doctor"]["evicted"] == 1
+    assert stale_wheel.exists() and doctor.exists()
+
+    total = preview["bytes_before"]
+    report = eviction.collect_garbage(max_bytes=total - 250, max_age_days=30)
+
+    assert not stale_wheel.exists() and not doctor.exists()
+    # Then least recently used first: the 2-day-old bytecode goes before the 1-day-old entry.
+    assert not fresh_bytecode.exists()
+    assert report["evicted"] == []
+    assert entry.exists()
+    assert report["bytes_after"] == total - 300
+
+
+def test_copy_from_evicted_entry_raises(cache_root: Path) -> None:
+    cache_dir = _prime("gone", 90)
+    eviction.collect_garbage(max_bytes=0, max_age_days=30)
+
+    with pytest.raises(FileNotFoundError):
+        cache_utils.copy_from_cache(cache_dir, cache_root / "restored")
+
+
+def test_parse_size_units() -> None:
+    assert eviction.parse_size("512") == 512
+    assert eviction.parse_size("2K") == 2048
+    assert eviction.parse_size("1.5GiB") == int(1.5 * 1024**3)
+    with pytest.raises(ValueError):
+        eviction.parse_size("lots")
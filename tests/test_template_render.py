@@ -0,0 +1,275 @@
+"""Tests for the shared template render helpers."""
+
+from __future__ import annotations
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
+TEMPLATES_ROOT = APPLICATIONS_ROOT / "templates"
+
+sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+from templates._shared import cache as cache_utils  # type: ignore  # noqa: E402
+from templates._shared import engine  # type: ignore  # noqa: E402
+from templates._shared import manifest as manifest_utils  # type: ignore  # noqa: E402
+from templates._shared import render as render_utils  # type: ignore  # noqa: E402
+from templates._shared import sources  # type: ignore  # noqa: E402
+from templates._shared import store  # type: ignore  # noqa: E402
+
+pytest.importorskip("cookiecutter.main", reason="cookiecutter is required for render tests")
+
+
+@pytest.fixture
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "cache" / "templates"
+    monkeypatch.setattr(cache_utils, "TEMPLATE_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(cache_utils, "OBJECT_STORE_DIR", tmp_path / "cache" / "objects")
+    return cache_dir
+
+
+def _sample_targets() -> list[render_utils.RenderTarget]:
+    targets: list[render_utils.RenderTarget] = []
+    for template_name in ("docs-only", "project-management"):
+        config = manifest_utils.get_template_config(template_name)
+        for context in config["sample_contexts"].values():
+            targets.append((template_name, TEMPLATES_ROOT / template_name, dict(context)))
+    return targets
+
+
+def test_render_many_parallel_preserves_target_order(isolated_cache: Path) -> None:
+    """Parallel renders return cache dirs in input order, deduplicating shared contexts."""
+    targets = _sample_targets()
+    targets.append(targets[0])
+
+    cache_dirs = render_utils.render_many(targets, jobs=2)
+
+    assert len(cache_dirs) == len(targets)
+    assert cache_dirs[0] == cache_dirs[-1]
+    for (template_name, _root, context), cache_dir in zip(targets, cache_dirs):
+        assert cache_dir == cache_utils.get_template_cache_dir(template_name, context)
+        assert (cache_dir / cache_utils.SENTINEL).exists()
+        assert cache_dir.is_relative_to(isolated_cache)
+
+
+def test_render_many_reuses_cache_hits(isolated_cache: Path) -> None:
+    """A second pass resolves every target from the cache without re-rendering."""
+    targets = _sample_targets()[:1]
+    first = render_utils.render_many(targets)
+    marker = first[0] / "marker.txt"
+    marker.write_text("cached", encoding="utf-8")
+
+    second = render_utils.render_many(targets, jobs=4)
+
+    assert second == first
+    assert marker.exists()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_render_many_can_return_failures(isolated_cache: Path, jobs: int) -> None:
+    """With return_exceptions a failing hook is reported in place instead of aborting the batch."""
+    good = _sample_targets()[0]
+    bad = ("docs-only", TEMPLATES_ROOT / "docs-only", {"project_slug": "Not A Slug"})
+
+    results = render_utils.render_many([bad, good], jobs=jobs, return_exceptions=True)
+
+    assert isinstance(results[0], BaseException)
+    assert results[1] == cache_utils.get_template_cache_dir(good[0], good[2])
+    with pytest.raises((SystemExit, Exception)):
+        render_utils.render_many([bad], jobs=jobs)
+
+
+def test_resolve_jobs_defaults() -> None:
+    assert render_utils.resolve_jobs(None) == 1
+    assert render_utils.resolve_jobs(3) == 3
+    assert render_utils.resolve_jobs(0) >= 1
+
+
+@pytest.fixture
+def template_copy(tmp_path: Path, isolated_cache: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A writable copy of docs-only whose hooks still import the real ``_shared``."""
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "_shared").symlink_to(TEMPLATES_ROOT / "_shared")
+    root = templates / "docs-only"
+    shutil.copytree(TEMPLATES_ROOT / "docs-only", root)
+    monkeypatch.setattr(sources, "template_root", lambda _name: root)
+    return root
+
+
+def _count_full_renders(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    original = render_utils.render_into
+
+    def _spy(template_root: Path, extra_context: dict, destination: Path) -> None:
+        calls.append(destination)
+        original(template_root, extra_context, destination)
+
+    monkeypatch.setattr(render_utils, "render_into", _spy)
+    return calls
+
+
+def _docs_context() -> dict:
+    return dict(manifest_utils.get_template_config("docs-only")["sample_contexts"]["default"])
+
+
+def test_template_edit_invalidates_render_cache(template_copy: Path) -> None:
+    context = _docs_context()
+    before = cache_utils.get_template_cache_dir("docs-only", context)
+
+    (template_copy / "{{cookiecutter.project_slug}}" / "docs" / "index.md").write_text(
+        "# Edited\n", encoding="utf-8"
+    )
+
+    assert cache_utils.get_template_cache_dir("docs-only", context) != before
+
+
+def test_incremental_render_patches_previous_entry(
+    template_copy: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    context = _docs_context()
+    first = render_utils.render_cached("docs-only", template_copy, context)
+    calls = _count_full_renders(monkeypatch)
+
+    page = template_copy / "{{cookiecutter.project_slug}}" / "docs" / "user-guide.md"
+    page.write_text("# {{ cookiecutter.project_name }} guide\n", encoding="utf-8")
+    patched = render_utils.render_cached("docs-only", template_copy, context, incremental=True)
+
+    assert patched != first
+    assert calls == []
+    patched_tree = store.read_tree(patched)
+
+    # A from-scratch render of the edited template produces the identical tree.
+    monkeypatch.setattr(cache_utils, "TEMPLATE_CACHE_DIR", tmp_path / "fresh")
+    fresh = render_utils.render_cached("docs-only", template_copy, context)
+    assert store.read_tree(fresh) == patched_tree
+    restored = tmp_path / "restored"
+    cache_utils.copy_from_cache(patched, restored)
+    assert (restored / "docs" / "user-guide.md").read_text(encoding="utf-8") == (
+        f"# {context['project_name']} guide\n"
+    )
+
+
+def test_incremental_render_falls_back_for_hook_edits(
+    template_copy: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    context = _docs_context()
+    render_utils.render_cached("docs-only", template_copy, context)
+    calls = _count_full_renders(monkeypatch)
+
+    hook = template_copy / "hooks" / "post_gen_project.py"
+    hook.write_text(hook.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    render_utils.render_cached("docs-only", template_copy, context, incremental=True)
+
+    assert len(calls) == 1
+
+
+def test_engine_parses_each_template_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Many contexts of one template share compiled templates instead of re-parsing."""
+    monkeypatch.setattr(engine, "BYTECODE_CACHE_DIR", tmp_path / "jinja")
+    monkeypatch.setattr(engine, "_ENVIRONMENTS", {})
+    monkeypatch.setattr(engine, "_PATH_TEMPLATES", {})
+    template_root = TEMPLATES_ROOT / "docs-only"
+    base = _docs_context()
+    compiled: list[str] = []
+
+    def _render(index: int) -> Path:
+        context = dict(base, project_name=f"Docs {index}", project_slug=f"docs-{index}")
+        full_context = engine.build_context(template_root, context, tmp_path / "out", default_context={})
+        env = engine.environment_for(template_root, full_context)
+        if "compile" not in vars(env):
+            original = env.compile
+
+            def _counting_compile(source, *args, **kwargs):
+                compiled.append(source)
+                return original(source, *args, **kwargs)
+
+            monkeypatch.setattr(env, "compile", _counting_compile)
+        return engine.generate_project(template_root, full_context, tmp_path / "out", accept_hooks=False)
+
+    first = _render(0)
+    parses_after_first = len(compiled)
+    for index in range(1, 5):
+        _render(index)
+
+    assert parses_after_first > 0
+    assert len(compiled) == parses_after_first
+    assert "Docs 4" in (tmp_path / "out" / "docs-4" / "README.md").read_text(encoding="utf-8")
+    assert (first / "docs" / "index.md").exists()
+    assert any((tmp_path / "jinja").iterdir())
+
+
+def test_render_project_clones_cached_render(
+    isolated_cache: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Standalone generation is served from the cache and keeps git out of cached entries."""
+    if shutil.which("git") is None:
+        pytest.skip("git is required to check repository initialisation")
+    monkeypatch.delenv("AGENTIC_CANON_SKIP_GIT_INIT", raising=False)
+    renders = _count_full_renders(monkeypatch)
+    context = _docs_context()
+
+    first = render_utils.render_project("docs-only", TEMPLATES_ROOT / "docs-only", context, tmp_path / "a")
+    second = render_utils.render_project("docs-only", TEMPLATES_ROOT / "docs-only", context, tmp_path / "b")
+
+    assert len(renders) == 1
+    assert first.parent == tmp_path / "a" and second.parent == tmp_path / "b"
+    assert (first / ".git").is_dir() and (second / ".git").is_dir()
+    cached = store.read_tree(cache_utils.get_template_cache_dir("docs-only", context))
+    assert not any(entry["path"].split("/")[0] == ".git" for entry in cached["entries"])
+    assert "AGENTIC_CANON_SKIP_GIT_INIT" not in render_utils.os.environ
+    with pytest.raises(FileExistsError):
+        render_utils.render_project("docs-only", TEMPLATES_ROOT / "docs-only", context, tmp_path / "a")
+
+
+def test_render_project_overwrite_merges_without_deleting(isolated_cache: Path, tmp_path: Path) -> None:
+    context = _docs_context()
+    project = render_utils.render_project("docs-only", TEMPLATES_ROOT / "docs-only", context, tmp_path)
+    (project / "NOTES.local").write_text("keep me\n", encoding="utf-8")
+    readme = project / "README.md"
+    original = readme.read_bytes()
+    readme.write_text("edited\n", encoding="utf-8")
+
+    again = render_utils.render_project("docs-only", TEMPLATES_ROOT / "docs-only", context, tmp_path, overwrite=True)
+
+    assert again == project
+    assert (project / "NOTES.local").read_text(encoding="utf-8") == "keep me\n"
+    assert readme.read_bytes() == original
+    assert not [path for path in tmp_path.iterdir() if path.name.startswith(f".{project.name}.")]
+
+
+def test_copy_from_cache_refuses_to_delete_unowned_directories(isolated_cache: Path, tmp_path: Path) -> None:
+    cache_dir = render_utils.render_cached("docs-only", TEMPLATES_ROOT / "docs-only", _docs_context())
+    destination = tmp_path / "existing"
+    destination.mkdir()
+    (destination / "user.txt").write_text("mine\n", encoding="utf-8")
+
+    with pytest.raises(FileExistsError):
+        cache_utils.copy_from_cache(cache_dir, destination)
+    assert (destination / "user.txt").exists()
+
+    cache_utils.copy_from_cache(cache_dir, destination, existing="replace")
+    assert not (destination / "user.txt").exists()
+    assert (destination / "README.md").exists()
+
+
+def test_templates_with_commands_render_in_the_project(
+    isolated_cache: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Manifest commands may depend on the project path, so those templates bypass the cache."""
+    assert render_utils.post_gen_cacheable("docs-only")
+    assert not render_utils.post_gen_cacheable("go-service")  # bootstrap: go mod tidy
+
+    monkeypatch.setattr(render_utils, "post_gen_cacheable", lambda name: False)
+    monkeypatch.setenv("AGENTIC_CANON_SKIP_GIT_INIT", "1")
+    renders = _count_full_renders(monkeypatch)
+
+    project = render_utils.render_project("docs-only", TEMPLATES_ROOT / "docs-only", _docs_context(), tmp_path)
+
+    assert renders == []
+    assert (project / "README.md").exists()
+    assert not isolated_cache.exists() or not any(isolated_cache.iterdir())
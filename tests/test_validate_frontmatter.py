@@ -0,0 +1,82 @@
+"""Tests for the cached front matter validator in tools/validate_frontmatter.py."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+import validate_frontmatter  # type: ignore  # noqa: E402
+
+SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "required": ["title"],
+    "properties": {"title": {"type": "string"}},
+}
+
+
+def _doc(path: Path, front_matter: str, body: str = "# Body\n") -> Path:
+    path.write_text(f"---\n{front_matter}---\n{body}", encoding="utf-8")
+    return path
+
+
+def test_reader_stops_at_closing_fence(tmp_path: Path) -> None:
+    doc = _doc(tmp_path / "page.md", "title: Page\n", body="Text with --- inside\n---\nmore\n")
+
+    assert validate_frontmatter.read_front_matter(doc) == "title: Page\n"
+    assert validate_frontmatter.check_file(doc, validate_frontmatter.build_validator(SCHEMA)) is None
+
+    (tmp_path / "open.md").write_text("---\ntitle: Open\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="unterminated"):
+        validate_frontmatter.read_front_matter(tmp_path / "open.md")
+
+
+def test_cache_revalidates_only_changed_docs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = tmp_path / "cache.json"
+    good = _doc(tmp_path / "good.md", "title: Good\n")
+    bad = _doc(tmp_path / "bad.md", "title: 3\n")
+    checked: list[str] = []
+    original = validate_frontmatter.check_file
+
+    def _spy(path, validator=None):  # type: ignore[no-untyped-def]
+        checked.append(Path(path).name)
+        return original(path, validator)
+
+    monkeypatch.setattr(validate_frontmatter, "check_file", _spy)
+
+    first = validate_frontmatter.validate_docs([good, bad], SCHEMA, cache_path=cache)
+    assert first[str(good)] is None
+    assert "is not of type 'string'" in first[str(bad)]
+
+    _doc(bad, "title: Fixed\n")
+    os.utime(bad, ns=(bad.stat().st_atime_ns, bad.stat().st_mtime_ns + 1_000_000))
+    second = validate_frontmatter.validate_docs([good, bad], SCHEMA, cache_path=cache)
+    assert second == {str(good): None, str(bad): None}
+    assert checked == ["good.md", "bad.md", "bad.md"]
+
+    validate_frontmatter.validate_docs([good, bad], {**SCHEMA, "required": ["title", "summary"]}, cache_path=cache)
+    assert checked[3:] == ["good.md", "bad.md"]
+
+
+def test_cache_keeps_only_current_docs(tmp_path: Path) -> None:
+    cache = tmp_path / "cache.json"
+    kept = _doc(tmp_path / "kept.md", "title: Kept\n")
+    removed = _doc(tmp_path / "removed.md", "title: Removed\n")
+    digest = validate_frontmatter.schema_digest(SCHEMA)
+
+    validate_frontmatter.validate_docs([kept, removed], SCHEMA, cache_path=cache)
+    removed.unlink()
+    validate_frontmatter.validate_docs([kept], SCHEMA, cache_path=cache)
+
+    assert list(validate_frontmatter.load_cache(digest, cache)) == [str(kept.resolve())]
+
+
+def test_repository_docs_pass() -> None:
+    assert validate_frontmatter.main(["--no-cache"]) == 0
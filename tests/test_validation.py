@@ -0,0 +1,132 @@
+"""Tests for the non-exiting validation API in `templates/_shared/validation.py`."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APPLICATIONS_ROOT = REPO_ROOT / "applications" / "scaffolder"
+
+sys.path.insert(0, str(APPLICATIONS_ROOT))
+
+from templates._shared import validation  # type: ignore  # noqa: E402
+
+VALID = {
+    "project_slug": "demo-service",
+    "pkg_name": "demo_service",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+    "license": "MIT",
+    "project_description": "A demo Python service",
+    "unrelated": "ignored",
+}
+
+
+def test_validate_context_reports_every_failing_field() -> None:
+    context = {**VALID, "project_slug": "Bad_Slug", "pkg_name": "class", "author_email": "nope"}
+
+    issues = validation.validate_context("python-service", context)
+
+    assert [issue["field"] for issue in issues] == ["project_slug", "pkg_name", "author_email"]
+    assert issues[0]["message"] == "project_slug 'Bad_Slug' must be in kebab-case format"
+    assert issues[0]["hints"][-1] == "  Examples: my-project, api-service, web-app-v2"
+    assert all(issue["template"] == "python-service" for issue in issues)
+    assert validation.validate_context("python-service", VALID) == []
+
+
+def test_manifest_declares_template_rules() -> None:
+    assert validation.validate_context("docs-only", {"license": "CC-BY-4.0"}) == []
+    assert validation.validate_context("python-service", {"license": "CC-BY-4.0"})[0]["field"] == "license"
+    assert validation.validate_context("project-management", {"github_org": "-bad-"})[0]["field"] == "github_org"
+    # project-management keeps its own slug pattern: it must start with a letter.
+    assert validation.validate_context("project-management", {"project_slug": "1-project"})[0]["message"] == (
+        "Invalid project_slug '1-project'. Must be lowercase kebab-case (e.g., 'my-project')."
+    )
+    assert list(validation.rules_for("go-service")) == [
+        "project_slug",
+        "module_path",
+        "author_name",
+        "author_email",
+        "license",
+        "description",
+    ]
+
+
+def test_compile_rules_rejects_unknown_rules() -> None:
+    rules = validation.compile_rules([{"variable": "api_version", "rule": "version"}])
+    assert rules["api_version"]("1.2", "api_version")["message"].endswith("is not a valid semantic version")
+
+    with pytest.raises(ValueError, match="Invalid validation rule"):
+        validation.compile_rules([{"variable": "api_version", "rule": "semver"}])
+
+
+def test_validate_many_checks_each_value_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    original = validation.check_email
+
+    def _counting(value: str, field_name: str = "email"):  # type: ignore[no-untyped-def]
+        calls.append(value)
+        return original(value, field_name)
+
+    monkeypatch.setitem(validation.FIELD_RULES, "author_email", _counting)
+    contexts = [(None, {**VALID, "project_slug": f"svc-{index}"}) for index in range(50)]
+    contexts.append((None, {**VALID, "author_email": "bad"}))
+
+    results = validation.validate_many(contexts)
+
+    assert calls == ["test@example.com", "bad"]
+    assert results[:50] == [[]] * 50
+    assert [issue["field"] for issue in results[50]] == ["author_email"]
+
+
+def test_exiting_shims_print_the_issue(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        validation.validate_license("WTFPL")
+
+    assert excinfo.value.code == 1
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == "ERROR: WTFPL is not an approved license"
+    assert out[-1] == "  See: https://spdx.org/licenses/"
+    assert validation.validate_version("1.2.3") is True
+
+
+def test_run_pre_gen_reports_all_issues_then_exits(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        validation.run_pre_gen("go-service", {"project_slug": "Bad", "module_path": "nope", "license": "MIT"})
+
+    assert excinfo.value.code == 1
+    errors = [line for line in capsys.readouterr().out.splitlines() if line.startswith("ERROR: ")]
+    assert errors == [
+        "ERROR: project_slug 'Bad' must be in kebab-case format",
+        "ERROR: module_path 'nope' is not a valid Go module path",
+    ]
+
+    validation.run_pre_gen("docs-only", {"project_slug": "docs", "license": "CC-BY-4.0", "_template": "x"})
+    assert "✅ All validations passed!" in capsys.readouterr().out
+
+
+def test_pre_gen_hook_survives_awkward_answers_and_a_foreign_template_path(tmp_path: Path) -> None:
+    """The rendered hook finds ``_shared`` from its own location and gets the context verbatim."""
+    # pylint: disable=import-outside-toplevel
+    import subprocess
+
+    from cookiecutter.environment import StrictEnvironment  # type: ignore[import]
+
+    templates = APPLICATIONS_ROOT / "templates"
+    hook = tmp_path / "templates" / "docs-only" / "hooks" / "pre_gen_project.py"
+    hook.parent.mkdir(parents=True)
+    (tmp_path / "templates" / "_shared").symlink_to(templates / "_shared")
+    slug = 'say """hi""" \\'
+    context = {"cookiecutter": {"project_slug": slug, "license": "MIT", "_template": "elsewhere/docs-only"}}
+    source = (templates / "docs-only" / "hooks" / "pre_gen_project.py").read_text(encoding="utf-8")
+    hook.write_text(StrictEnvironment(context=context).from_string(source).render(**context), encoding="utf-8")
+
+    result = subprocess.run(
+        [sys.executable, str(hook)], cwd=tmp_path, capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 1, result.stderr
+    assert f"ERROR: project_slug '{slug}' must be in kebab-case format" in result.stdout
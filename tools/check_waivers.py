@@ -1,19 +1,40 @@
 #!/usr/bin/env python3
-"""Scan frontiers/waivers for upcoming expirations."""
+"""Scan frontiers/waivers for upcoming expirations.
+
+Parsed waivers are kept in a JSON index under the Agentic Canon cache root.
+The index is refreshed incrementally: a waiver file is only re-parsed when its
+SHA-256 changes. Each entry stores its expiry as a date ordinal, and the
+entries are kept sorted by it, so "expiring within N days" is a bisect range
+query. ``--json`` prints the results for dashboards. ``--since`` limits them to
+waivers whose file or status changed after a given time; it only narrows what
+is printed, while the exit status and ``GITHUB_OUTPUT`` always cover every
+waiver. A waiver's edit time is its last commit time, or its mtime when the
+file is untracked or has uncommitted changes.
+"""
 
 from __future__ import annotations
 
 import argparse
+import bisect
+import hashlib
 import json
 import os
-from datetime import date, datetime
+import subprocess
+import tempfile
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import yaml
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 WAIVER_DIR = REPO_ROOT / "frontiers" / "waivers"
+INDEX_PATH = (
+    Path(os.environ.get("AGENTIC_CANON_CACHE_DIR", Path.home() / ".cache" / "agentic-canon")).expanduser()
+    / "waivers"
+    / "index.json"
+)
+INDEX_VERSION = 2
 DEFAULT_WARNING_DAYS = 7
 
 REQUIRED_FIELDS = {
@@ -28,7 +49,7 @@ REQUIRED_FIELDS = {
 }
 
 
-def _parse_args() -> argparse.Namespace:
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--warning-days",
@@ -41,7 +62,25 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Exit with non-zero status when expired waivers are detected.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the results as JSON instead of a report.",
+    )
+    parser.add_argument(
+        "--since",
+        type=_parse_since,
+        help="Only report waivers edited, or whose status changed, after this ISO date or datetime.",
+    )
+    return parser.parse_args(argv)
+
+
+def _parse_since(value: str) -> datetime:
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid ISO date or datetime: {value!r}") from exc
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
 
 
 def _load_waiver(path: Path) -> Dict[str, Any]:
@@ -54,35 +93,140 @@ def _to_date(value: str) -> date:
     return datetime.strptime(value, "%Y-%m-%d").date()
 
 
+def _git(*args: str) -> str:
+    try:
+        result = subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=False)
+    except OSError:
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def _edited_at(path: Path) -> str:
+    """When ``path`` was last edited: its last commit time if committed and clean, else its mtime."""
+    relative = str(path.relative_to(REPO_ROOT))
+    if not _git("status", "--porcelain", "--", relative):
+        committed = _git("log", "-1", "--format=%cI", "--", relative)
+        if committed:
+            return datetime.fromisoformat(committed).astimezone(timezone.utc).isoformat()
+    return datetime.fromtimestamp(path.stat().st_mtime, timezone.utc).isoformat()
+
+
+def _index_entry(path: Path, digest: str) -> Dict[str, Any]:
+    # Round-trip through JSON so YAML dates are stored (and reported) as strings.
+    record = json.loads(json.dumps(_load_waiver(path), default=str))
+    entry: Dict[str, Any] = {"digest": digest, "edited_at": _edited_at(path), "record": record, "expiry": None}
+    missing = REQUIRED_FIELDS - record.keys()
+    if not missing:
+        try:
+            entry["expiry"] = _to_date(str(record["expires"])).toordinal()
+        except ValueError:
+            missing = {"expires"}
+    if missing:
+        record["missing_fields"] = sorted(missing)
+    return entry
+
+
+def _load_index(index_path: Path) -> Dict[str, Any]:
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return {}
+    return index
+
+
+def _save_index(index: Dict[str, Any], index_path: Path) -> None:
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=index_path.parent, prefix=f".{index_path.name}.")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(index, handle, indent=1)
+        os.replace(temp_name, index_path)
+    except OSError:
+        pass
+
+
+def update_index(waiver_dir: Path = WAIVER_DIR, index_path: Path = INDEX_PATH) -> Dict[str, Any]:
+    """
+    Refresh the waiver index from ``waiver_dir`` and return it.
+
+    Only files whose SHA-256 differs from the indexed digest are re-parsed, and
+    only those get a new ``edited_at``.
+    ``order`` lists the valid waivers by ``(expiry ordinal, path)`` and ``expiries``
+    holds the matching ordinals for bisecting.
+    """
+    previous = _load_index(index_path).get("entries", {})
+    entries: Dict[str, Dict[str, Any]] = {}
+    paths = sorted(waiver_dir.glob("*.yml")) if waiver_dir.exists() else []
+    for path in paths:
+        key = str(path.relative_to(REPO_ROOT))
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        cached = previous.get(key)
+        entries[key] = cached if cached and cached["digest"] == digest else _index_entry(path, digest)
+
+    order = sorted((entry["expiry"], key) for key, entry in entries.items() if entry["expiry"] is not None)
+    index = {
+        "version": INDEX_VERSION,
+        "entries": entries,
+        "order": [key for _, key in order],
+        "expiries": [expiry for expiry, _ in order],
+    }
+    if entries != previous or not index_path.exists():
+        _save_index(index, index_path)
+    return index
+
+
+def _status(expiry: int, ordinal: int, warning_days: int) -> str:
+    delta = expiry - ordinal
+    if delta < 0:
+        return "expired"
+    return "upcoming" if delta <= warning_days else "active"
+
+
 def _evaluate_waivers(
     warning_days: int,
+    *,
+    today: Optional[date] = None,
+    since: Optional[datetime] = None,
+    waiver_dir: Path = WAIVER_DIR,
+    index_path: Path = INDEX_PATH,
 ) -> Dict[str, List[Dict[str, Any]]]:
-    today = date.today()
-    upcoming: List[Dict[str, Any]] = []
-    expired: List[Dict[str, Any]] = []
-    invalid: List[Dict[str, Any]] = []
-
-    if not WAIVER_DIR.exists():
-        return {"upcoming": upcoming, "expired": expired, "invalid": invalid}
+    today = today or date.today()
+    ordinal = today.toordinal()
+    index = update_index(waiver_dir, index_path)
+    entries, order, expiries = index["entries"], index["order"], index["expiries"]
 
-    for path in sorted(WAIVER_DIR.glob("*.yml")):
-        record = _load_waiver(path)
-        missing = REQUIRED_FIELDS - record.keys()
-        if missing:
-            record["missing_fields"] = sorted(missing)
-            invalid.append(record)
-            continue
+    def _changed(key: str) -> bool:
+        if since is None:
+            return True
+        entry = entries[key]
+        if datetime.fromisoformat(entry["edited_at"]) > since:
+            return True
+        if entry["expiry"] is None:
+            return False
+        since_ordinal = since.astimezone(timezone.utc).date().toordinal()
+        return _status(entry["expiry"], since_ordinal, warning_days) != _status(entry["expiry"], ordinal, warning_days)
 
-        expiry = _to_date(str(record["expires"]))
-        delta = (expiry - today).days
-        record["days_until_expiry"] = delta
+    def _records(keys: List[str]) -> List[Dict[str, Any]]:
+        records = []
+        for key in keys:
+            if _changed(key):
+                record = dict(entries[key]["record"])
+                record["days_until_expiry"] = entries[key]["expiry"] - ordinal
+                records.append(record)
+        return records
 
-        if delta < 0:
-            expired.append(record)
-        elif delta <= warning_days:
-            upcoming.append(record)
-
-    return {"upcoming": upcoming, "expired": expired, "invalid": invalid}
+    first_current = bisect.bisect_left(expiries, ordinal)
+    last_upcoming = bisect.bisect_right(expiries, ordinal + warning_days)
+    invalid = [
+        dict(entries[key]["record"]) for key in sorted(entries) if entries[key]["expiry"] is None and _changed(key)
+    ]
+    return {
+        "upcoming": _records(order[first_current:last_upcoming]),
+        "expired": _records(order[:first_current]),
+        "invalid": invalid,
+    }
 
 
 def _write_github_output(results: Dict[str, List[Dict[str, Any]]]) -> None:
@@ -94,15 +238,7 @@ def _write_github_output(results: Dict[str, List[Dict[str, Any]]]) -> None:
             handle.write(f"{key}={json.dumps(value)}\n")
 
 
-def main() -> int:
-    args = _parse_args()
-    results = _evaluate_waivers(args.warning_days)
-    _write_github_output(results)
-
-    if not any(results.values()):
-        print("✅ No waivers found.")
-        return 0
-
+def _print_report(results: Dict[str, List[Dict[str, Any]]]) -> None:
     if results["invalid"]:
         print("⚠️ Invalid waiver files detected:")
         for waiver in results["invalid"]:
@@ -124,6 +260,21 @@ def main() -> int:
                 f"[{waiver['__path']}]"
             )
 
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    locations = {"waiver_dir": WAIVER_DIR, "index_path": INDEX_PATH}
+    results = _evaluate_waivers(args.warning_days, **locations)
+    _write_github_output(results)
+    shown = results if args.since is None else _evaluate_waivers(args.warning_days, since=args.since, **locations)
+
+    if args.json:
+        print(json.dumps(shown, indent=2))
+    elif not any(shown.values()):
+        print("✅ No waivers found.")
+    else:
+        _print_report(shown)
+
     if results["invalid"]:
         return 1
     if results["expired"] and args.fail_expired:
@@ -1,18 +1,46 @@
 #!/usr/bin/env python3
-"""Validate MkDocs front matter against the frontiers schema."""
+"""Validate MkDocs front matter against the frontiers schema.
+
+The schema is compiled into a validator once per process. Each document is
+read only up to its closing front matter fence. Results are cached under the
+Agentic Canon cache root, keyed on (path, mtime, size, schema hash), so
+repeated runs only revalidate docs that changed. Large doc trees are spread
+over a process pool.
+"""
 
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+import os
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from jsonschema import ValidationError, validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SCHEMA_PATH = REPO_ROOT / "frontiers" / "policy" / "frontiers.schema.json"
 DOCS_DIR = REPO_ROOT / "docs"
+CACHE_PATH = (
+    Path(os.environ.get("AGENTIC_CANON_CACHE_DIR", Path.home() / ".cache" / "agentic-canon")).expanduser()
+    / "frontmatter"
+    / "results.json"
+)
+
+FENCE = "---"
+POOL_THRESHOLD = 64
+"""Minimum number of stale docs before validation moves to a process pool."""
+
+CacheEntry = Tuple[int, int, Optional[str]]
+"""``(mtime_ns, size, error)`` recorded per doc; ``error`` is ``None`` for a valid doc."""
+
+_VALIDATOR: Any = None
 
 
 def iter_markdown_files() -> list[Path]:
@@ -23,26 +51,133 @@ def load_schema() -> dict:
     return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
 
 
+def schema_digest(schema: dict) -> str:
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def build_validator(schema: dict) -> Any:
+    """Check ``schema`` once and return a reusable validator for its declared draft."""
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def read_front_matter(markdown: Path) -> str:
+    """Return the YAML between the opening and closing fences, without reading the body."""
+    with open(markdown, encoding="utf-8") as handle:
+        if not handle.readline().startswith(FENCE):
+            raise ValueError("missing YAML front matter")
+        lines: List[str] = []
+        for line in handle:
+            if line.startswith(FENCE):
+                return "".join(lines)
+            lines.append(line)
+    raise ValueError("unterminated YAML front matter")
+
+
 def parse_front_matter(markdown: Path) -> dict:
-    text = markdown.read_text(encoding="utf-8")
-    if not text.startswith("---"):
-        raise ValueError("missing YAML front matter")
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        raise ValueError("unterminated YAML front matter")
-    return yaml.safe_load(parts[1]) or {}
-
-
-def main() -> int:
-    schema = load_schema()
-    errors: list[str] = []
-
-    for md in iter_markdown_files():
-        try:
-            front_matter = parse_front_matter(md)
-            validate(instance=front_matter, schema=schema)
-        except (ValueError, ValidationError) as exc:
-            errors.append(f"{md.relative_to(REPO_ROOT)}: {exc}")
+    return yaml.safe_load(read_front_matter(markdown)) or {}
+
+
+def check_file(markdown: Path, validator: Any = None) -> Optional[str]:
+    """Return the validation error for ``markdown``, or ``None`` when its front matter is valid."""
+    validator = validator or _VALIDATOR
+    try:
+        error = best_match(validator.iter_errors(parse_front_matter(markdown)))
+    except (ValueError, yaml.YAMLError) as exc:
+        return str(exc)
+    return None if error is None else str(error)
+
+
+def _init_worker(schema: dict) -> None:
+    global _VALIDATOR  # pylint: disable=global-statement
+    _VALIDATOR = build_validator(schema)
+
+
+def load_cache(digest: str, path: Path = CACHE_PATH) -> Dict[str, CacheEntry]:
+    """Cached results for ``digest``; a different schema hash discards everything."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("schema") != digest:
+        return {}
+    return {key: tuple(value) for key, value in data.get("entries", {}).items()}  # type: ignore[misc]
+
+
+def save_cache(digest: str, entries: Dict[str, CacheEntry], path: Path = CACHE_PATH) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump({"schema": digest, "entries": entries}, handle)
+        os.replace(temp_name, path)
+    except OSError:
+        pass
+
+
+def validate_docs(
+    paths: List[Path],
+    schema: dict,
+    *,
+    jobs: int = 0,
+    use_cache: bool = True,
+    cache_path: Path = CACHE_PATH,
+) -> Dict[str, Optional[str]]:
+    """Map each doc path to its error (or ``None``), revalidating only docs whose stat changed."""
+    digest = schema_digest(schema)
+    cached = load_cache(digest, cache_path) if use_cache else {}
+    entries: Dict[str, CacheEntry] = {}
+    stale: List[Tuple[str, Path, int, int]] = []
+
+    for path in paths:
+        key = str(path.resolve())
+        stat = path.stat()
+        hit = cached.get(key)
+        if hit is not None and hit[0] == stat.st_mtime_ns and hit[1] == stat.st_size:
+            entries[key] = hit
+        else:
+            stale.append((key, path, stat.st_mtime_ns, stat.st_size))
+
+    workers = jobs or os.cpu_count() or 1
+    if workers > 1 and len(stale) >= POOL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(schema,)) as executor:
+            errors = list(executor.map(check_file, [path for _, path, _, _ in stale], chunksize=16))
+    else:
+        validator = build_validator(schema)
+        errors = [check_file(path, validator) for _, path, _, _ in stale]
+
+    for (key, _, mtime_ns, size), error in zip(stale, errors):
+        entries[key] = (mtime_ns, size, error)
+    # Only the current paths are saved, so deleted or renamed docs drop out of the cache.
+    if use_cache and (stale or len(entries) != len(cached)):
+        save_cache(digest, entries, cache_path)
+    return {str(path): entries[str(path.resolve())][2] for path in paths}
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help=f"Worker processes once {POOL_THRESHOLD}+ docs need revalidating (default: CPU count).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Revalidate every doc and leave the results cache untouched.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    paths = iter_markdown_files()
+    results = validate_docs(paths, load_schema(), jobs=args.jobs, use_cache=not args.no_cache)
+    errors = [
+        f"{Path(path).relative_to(REPO_ROOT)}: {error}" for path, error in results.items() if error is not None
+    ]
 
     if errors:
         print("❌ Front matter validation failed:", file=sys.stderr)